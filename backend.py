@@ -6,51 +6,53 @@ import datetime
 import time
 import math
 import pandas
+import numpy
 import pickle
 from cryptography.fernet import Fernet
 import base64
 import hashlib
-import yahooquery
-from threading import Thread
+import functools
+from threading import RLock
 from strings import ENG as STRINGS
+from constants import CONSTANTS
 from PyQt5.QtWidgets import QMessageBox
 from backend_datatypes import Product, Person, Transaction, Investment, Asset
-from fullstack_utils import SortEnum, Filter
+from fullstack_utils import SortEnum, Filter, LotMethod, utils
+from backend_journal import Journal, SaveWorker, writeFileAtomic
+from backend_store import TransactionStore
+from backend_sorting import SortedOrders
+from backend_ledger import PositionLedger
+from backend_tickercache import TickerCache
+from backend_quotes import QuoteProvider, YahooQuoteProvider
+from backend_valuation import ValuationEngine
+from backend_prices import PriceHistoryStore
+from backend_lots import LotEngine
+from backend_returns import ReturnCalculator
 
 def Dsave(func):
     """
-    decorator, which runs the function and executes a save afterwards
+    decorator, which runs the function and journals the mutation afterwards
+    a function that returns False declined the mutation, so nothing is journaled
     """
+    @functools.wraps(func)
     def wrapper_save(self, *args):
-        ret = func(self, *args)
-        Thread(target=self._save).start()
+        with self._lock:
+            ret = func(self, *args)
+            if not self._replaying and ret is not False:
+                self._journalRecord(func.__name__, args)
         return ret
     return wrapper_save
 
-def DsortTrans(func):
-    """
-    decorator, which runs the function and executes a sort afterwards
-    """
-    def wrapper_sort_trans(self, *args):
-        ret = func(self, *args)
-        Thread(target=self.sortTransactions, args=(self.sortCriteriaTrans[0], self.sortCriteriaTrans[1])).start()
-        return ret
-    return wrapper_sort_trans
-
-def DsortInv(func):
-    """
-    decorator, which runs the function and executes a sort afterwards
-    """
-    def wrapper_sort_inv(self, *args):
-        ret = func(self, *args)
-        Thread(target=self.sortInvestments, args=(self.sortCriteriaInv[0], self.sortCriteriaInv[1])).start()
-        return ret
-    return wrapper_sort_inv
+#sort keys of the transactions and investments, the sort direction is applied by iterating the sorted lists backwards
+#the transaction list is only kept in date order, the sort orders of the ui are cached in the transaction store
+TRANSACTION_SORT_KEYS = {SortEnum.DATE: lambda x: x.date}
+INVESTMENT_SORT_KEYS = {SortEnum.DATE: lambda x: x.date, SortEnum.CASHFLOW: lambda x: x.price, SortEnum.NAME: lambda x: x.asset.short_name.lower()}
 
 def Dbenchmark(func):   #DEBUGONLY
     """
     decorator, which runs the function and prints the runtime
     """
+    @functools.wraps(func)
     def wrapper_bench(self, *args, **kwargs):
         start = time.perf_counter()
         ret = func(self, *args, **kwargs)
@@ -65,18 +67,39 @@ class Backend:
     the object are passed to the frontend classes that uses the backend to encapsulate it
     this class uses some extern datatypes defined in backend_datatypes
     """
-    def __init__(self, ui, load:bool=True):
+    def __init__(self, ui, load:bool=True, quote_provider:QuoteProvider=None):
         """
         basic constructor is setting up the objects needed in the backend
         :param ui: object<Window>, we need some ui, to display messages like errors or information
+        :param load: bool<should the data be loaded from the data file?>
+        :param quote_provider: object<QuoteProvider> that gets the ticker data or None for the yahoo finance api
         :return: void
         """
         self.ui = ui            #the ui object
+        self.quote_provider = YahooQuoteProvider() if quote_provider == None else quote_provider    #source of all ticker data
         self.error_string = ""  #the last occured error as a string
         self.products = []      #a list that holds product objects of all known products
         self.categories = []    #a list that holds some strings representing all known categories
         self.persons = []       #a list that holds person objects of all known persons
-        self.transactions = []  #a list that holds transaction objects of all known transactions
+        #lower case name indexes of the lists above, that are updated on every change (names are case insensitive)
+        self._product_index:dict[str, Product] = {}
+        self._category_index:dict[str, str] = {}
+        self._person_index:dict[str, Person] = {}
+        self._next_id = 0       #id of the next added transaction or investment, ids are never reused
+        #posting lists from the lower case product and person names to the transactions that reference them
+        self._product_transactions:dict[str, dict[Transaction, True]] = {}
+        self._person_transactions:dict[str, dict[Transaction, True]] = {}
+        #holds the transactions sorted by date, so a new transaction is just inserted at its position
+        self._trans_orders = SortedOrders(TRANSACTION_SORT_KEYS, SortEnum.DATE)
+        self.transactions = self._trans_orders.getElements()  #a list that holds transaction objects of all known transactions (sorted ascending by date)
+        self._store = TransactionStore(self.getTransactions)   #holds the filterable values of the transactions column wise
+        self._journal = Journal(CONSTANTS.JOURNAL_FILE)    #appends every mutation since the last snapshot
+        self._ticker_cache = TickerCache(CONSTANTS.TICKER_CACHE_FILE, CONSTANTS.TICKER_CACHE_TTL)   #metadata of the tickers loaded from the api
+        self._replaying = False #true while the journal is replayed, these mutations should not be journaled again
+        self._lock = RLock()    #held while the data is changed or written into a snapshot
+        self._compact = False   #true if the save worker should write a new snapshot
+        #the save worker is the only thread that writes the data files
+        self._saver = SaveWorker(self._persist, CONSTANTS.SAVE_DEBOUNCE, CONSTANTS.SAVE_MAX_DELAY, CONSTANTS.SAVE_RETRY_BACKOFF, CONSTANTS.SAVE_MAX_RETRY_BACKOFF)
 
         self.transactionFilter = Filter()   #sets up a filter object for the backend
         #if the user dont want to set a own password, this pass is used
@@ -85,7 +108,7 @@ class Backend:
         #if the user has a password set, he will input it on the start and exchange this password  
         self.setNewPassword("jsa0pidfhuj89awhfp9ghqwp9fh9awgh8p9wrghf98ahgwf98gep89")    #standard password
 
-        self.sortCriteriaTrans = [SortEnum.DATE.value, True]
+        self.sortCriteriaTrans = [SortEnum.DATE, True]
         self.initInvestments()
         if load:
             self._load()
@@ -101,6 +124,8 @@ class Backend:
         """
         self._password = password
         self._key = self._gen_fernet_key(self._password.encode("utf-8"))
+        self._journal.setKey(self._key)
+        self._ticker_cache.setKey(self._key)
 
     def TEST(self): #DEBUGONLY
         self.transactions = (Transaction(datetime.date(2022, 1, 1), Product("product1", categories=["cat1", "cat2", "cat3"]), 5, 7.25, [Person("pers1"), Person("pers2")], [Person("pers3"), Person("pers4")]))
@@ -144,14 +169,34 @@ class Backend:
         for trans in self.transactions:
             yield trans
 
+    def getTransactionById(self, transaction_id:int):
+        """
+        getter for the transaction with the given id
+        :param transaction_id: int<id of the transaction>
+        :return: object<Transaction> or None if there is no transaction with that id
+        """
+        return self._store.getTransaction(transaction_id)
+
     def getFilteredTransactions(self):
         """
         generator for all transactions that met the requirements of the filter
+        the filter is evaluated for all transactions at once on the columnar store
+        and the transactions are returned in the cached order of the sort criteria
         :return: Generator<object<Transaction>>
         """
-        for trans in self.transactions:
-            if self.isTransactionFilter(trans):
-                yield trans
+        mask = self._store.getMask(self.transactionFilter)
+        order = self._store.getOrder(self.sortCriteriaTrans[0])
+        rows = self._store.rows
+        for row in self._getSorted(order[mask[order]], self.sortCriteriaTrans):
+            yield rows[row]
+
+    def getFilteredCashflow(self):
+        """
+        getter for the sum of the cashflows of all transactions that met the requirements of the filter
+        the sum is computed exactly in minor units (cents) on the columnar store
+        :return: float<sum of the cashflows>
+        """
+        return utils.fromCents(self._store.getCashflowSum(self._store.getMask(self.transactionFilter)))
 
     def isTransactionFilter(self, transaction:Transaction):
         """
@@ -169,36 +214,36 @@ class Backend:
         if self.transactionFilter.absoluteValues:
             if type(self.transactionFilter.minCashflow) != bool:
                 #filter set
-                if not(abs(self.transactionFilter.minCashflow) <= abs(transaction.cashflow)):
+                if not(abs(self.transactionFilter.minCashflow) <= abs(transaction.cashflow_cents)):
                     return False
             if type(self.transactionFilter.maxCashflow) != bool:
                 #filter set
-                if not(abs(self.transactionFilter.maxCashflow) >= abs(transaction.cashflow)):
+                if not(abs(self.transactionFilter.maxCashflow) >= abs(transaction.cashflow_cents)):
                     return False
             if type(self.transactionFilter.minCashflowPerProduct) != bool:
                 #filter set
-                if not(abs(self.transactionFilter.minCashflowPerProduct) <= abs(transaction.cashflow_per_product)):
+                if not(abs(self.transactionFilter.minCashflowPerProduct) <= abs(transaction.cashflow_per_product_cents)):
                     return False
             if type(self.transactionFilter.maxCashflowPerProduct) != bool:
                 #filter set
-                if not(abs(self.transactionFilter.maxCashflowPerProduct) >= abs(transaction.cashflow_per_product)):
+                if not(abs(self.transactionFilter.maxCashflowPerProduct) >= abs(transaction.cashflow_per_product_cents)):
                     return False
         else:
             if type(self.transactionFilter.minCashflow) != bool:
                 #filter set
-                if not(self.transactionFilter.minCashflow <= transaction.cashflow):
+                if not(self.transactionFilter.minCashflow <= transaction.cashflow_cents):
                     return False
             if type(self.transactionFilter.maxCashflow) != bool:
                 #filter set
-                if not(self.transactionFilter.maxCashflow >= transaction.cashflow):
+                if not(self.transactionFilter.maxCashflow >= transaction.cashflow_cents):
                     return False
             if type(self.transactionFilter.minCashflowPerProduct) != bool:
                 #filter set
-                if not(self.transactionFilter.minCashflowPerProduct <= transaction.cashflow_per_product):
+                if not(self.transactionFilter.minCashflowPerProduct <= transaction.cashflow_per_product_cents):
                     return False
             if type(self.transactionFilter.maxCashflowPerProduct) != bool:
                 #filter set
-                if not(self.transactionFilter.maxCashflowPerProduct >= transaction.cashflow_per_product):
+                if not(self.transactionFilter.maxCashflowPerProduct >= transaction.cashflow_per_product_cents):
                     return False
         if not(any(map(lambda x: x.lower() in map(lambda x: x.lower(), transaction.product.categories), self.transactionFilter.categories))) and \
                                 self.transactionFilter.categories != []:
@@ -221,12 +266,10 @@ class Backend:
         :param product_name: str<name of the product>
         :return: object<Transaction> or bool<False> if no transaction was found
         """
-        product_name = product_name.lower()
-        date_sorted_transactions = sorted(self.transactions, key=lambda x: x.date, reverse=True)
-        for transaction in date_sorted_transactions:
-            if transaction.product.name.lower() == product_name:
-                return transaction
-        return False
+        transactions = self._product_transactions.get(product_name.lower())
+        if not transactions:
+            return False
+        return max(transactions, key=lambda x: x.date)
 
     def setFilter(self, filter:Filter):
         """
@@ -247,11 +290,12 @@ class Backend:
         """
         assert(type(category) == str), STRINGS.getTypeErrorString(category, "category", str)
         assert(len(category) - category.count(" ") >= 3), STRINGS.ERROR_CATEGORY_CONTAINS_NOT_ENOUGH_CHAR+str(category)
-        if category.lower() in map(lambda x: x.lower(), self.categories):
+        if category.lower() in self._category_index:
             #dont add the category because its already added (ignoring case)
             self.error_string = f"cannot add category '{category}' because its already added"
             return False
         self.categories.append(category)
+        self._category_index[category.lower()] = category
         return True
 
     @Dsave
@@ -264,11 +308,13 @@ class Backend:
         """
         assert(type(person_text) == str), STRINGS.getTypeErrorString(person_text, "person_text", str)
         assert(len(person_text) - person_text.count(" ") >= 3), STRINGS.ERROR_PERSON_CONTAINS_NOT_ENOUGH_CHAR+str(person_text)
-        if person_text.lower() in map(lambda x: x.name.lower(), self.persons):
+        if person_text.lower() in self._person_index:
             #dont add the person because its already added (ignoring case)
             self.error_string = f"cannot add person '{person_text}' because its already added"
             return False
-        self.persons.append(Person(person_text))
+        person = Person(person_text)
+        self.persons.append(person)
+        self._person_index[person_text.lower()] = person
         return True
 
     def getTransactionObject(self, date:datetime.date, product_name:str, number:int, full_cf:float, 
@@ -293,11 +339,11 @@ class Backend:
         assert(type(full_cf) == float), STRINGS.getTypeErrorString(full_cf, "full_cf", int)
         assert(full_cf != 0), STRINGS.ERROR_CASHFLOW_ZERO+str(full_cf)
         assert(type(categories) == list and all(map(lambda x: type(x) == str, categories))), STRINGS.getListTypeErrorString(categories, "categories", str)
-        assert(all(map(lambda x: x in self.getCategories(), categories))), STRINGS.ERROR_NOT_ALL_CATEGORIES_ARE_VALID+str(categories)
+        assert(all(map(lambda x: self._category_index.get(x.lower()) == x, categories))), STRINGS.ERROR_NOT_ALL_CATEGORIES_ARE_VALID+str(categories)
         assert(type(ftpersons) == list and all(map(lambda x: type(x) == str, ftpersons))), STRINGS.getListTypeErrorString(ftpersons, "ftpersons", str)
-        assert(all(map(lambda x: x in self.getPersonNames(), ftpersons))), STRINGS.ERROR_NOT_ALL_FTPERSONS_ARE_VALID+str(ftpersons)
+        assert(all(map(self._isPersonName, ftpersons))), STRINGS.ERROR_NOT_ALL_FTPERSONS_ARE_VALID+str(ftpersons)
         assert(type(whypersons) == list and all(map(lambda x: type(x) == str, whypersons))), STRINGS.getListTypeErrorString(whypersons, "whypersons", str)
-        assert(all(map(lambda x: x in self.getPersonNames(), whypersons))), STRINGS.ERROR_NOT_ALL_WHYPERSONS_ARE_VALID+str(whypersons)
+        assert(all(map(self._isPersonName, whypersons))), STRINGS.ERROR_NOT_ALL_WHYPERSONS_ARE_VALID+str(whypersons)
         assert(len(set(categories)) == len(categories)), STRINGS.ERROR_CATEGORY_NOT_UNIQUE+str(categories)
         assert(len(set(ftpersons)) == len(ftpersons)), STRINGS.ERROR_FTPERSON_NOT_UNIQUE+str(ftpersons)
         assert(len(set(whypersons)) == len(whypersons)), STRINGS.ERROR_WHYPERSON_NOT_UNIQUE+str(whypersons)
@@ -318,30 +364,9 @@ class Backend:
                     msgbox.exec()
                     return False
                 
-        #stores the person objects that are choosen by the user
-        ftperson_objects = []
-        whyperson_objects = []
-
-        #gets the lower case person names
-        ftpersons_lower = list(map(lambda x: x.lower(), ftpersons))
-        whypersons_lower = list(map(lambda x: x.lower(), whypersons))
-
-        for person in self.persons:
-            #goes through all person objects and try to find the persons the user choosed
-            if not(ftpersons_lower or whypersons_lower):
-                #if all persons are found break
-                break
-            if person.name.lower() in ftpersons_lower:
-                #if a from/to person is found
-                ftperson_objects.append(person)             #append the person object of the right person
-                ftpersons_lower.remove(person.name.lower()) #remove the person string that are found
-            if person.name.lower() in whypersons_lower:
-                #if a why person is found
-                whyperson_objects.append(person)            #append the person object of the right person
-                whypersons_lower.remove(person.name.lower())#remove the person string that are found   
-        
-        assert(ftpersons_lower == []), STRINGS.ERROR_NOT_KNOWN_FTPERSON_CHOOSEN+str(ftpersons_lower)
-        assert(whypersons_lower == []), STRINGS.ERROR_NOT_KNOWN_WHYPERSON_CHOOSEN+str(whypersons_lower)
+        #gets the person objects that are choosen by the user (all of them are known, because they are validated above)
+        ftperson_objects = [self._person_index[person.lower()] for person in ftpersons]
+        whyperson_objects = [self._person_index[person.lower()] for person in whypersons]
 
         if product_obj == False:
             #add the choosen product if its not known
@@ -349,7 +374,6 @@ class Backend:
         return Transaction(date, product_obj, number, full_cf, ftperson_objects, whyperson_objects)
 
     @Dsave
-    @DsortTrans
     def addTransaction(self, transaction:Transaction):
         """
         adds a new transaction to the existing ones, pls validate it first with getTransactionObject
@@ -359,10 +383,12 @@ class Backend:
         assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
 
         #add the validated transaction
-        self.transactions.append(transaction)
+        self._assignId(transaction)
+        self._trans_orders.insert(transaction)
+        self._store.add(transaction)
+        self._indexTransaction(transaction)
 
     @Dsave
-    @DsortTrans
     def deleteTransaction(self, transaction:Transaction):
         """
         deletes a given transaction from the system
@@ -370,10 +396,46 @@ class Backend:
         :return: void
         """
         assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
-        assert(transaction in self.transactions), STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(transaction)+str(self.transactions)
-        self.transactions.remove(transaction)
+        assert(transaction.id in self._store.row_of), STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(transaction)
+        self._trans_orders.remove(transaction)
+        self._store.delete(transaction)
+        self._unindexTransaction(transaction)
         self.clean(full=False, transaction=transaction)
 
+    @Dsave
+    def replaceTransaction(self, old_transaction:Transaction, new_transaction:Transaction):
+        """
+        replaces a transaction with a new one at once, pls validate the new one first with getTransactionObject
+        the product of the old transaction is only deleted if the new transaction does not use it
+        the new transaction gets the id of the old one
+        :param old_transaction: object<Transaction> that is in the system
+        :param new_transaction: object<Transaction> that replaces it
+        :return: void
+        """
+        assert(type(old_transaction) == Transaction), STRINGS.getTypeErrorString(old_transaction, "old_transaction", Transaction)
+        assert(type(new_transaction) == Transaction), STRINGS.getTypeErrorString(new_transaction, "new_transaction", Transaction)
+        assert(old_transaction.id in self._store.row_of), STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(old_transaction)
+        self._trans_orders.remove(old_transaction)
+        self._store.delete(old_transaction)
+        self._unindexTransaction(old_transaction)
+        new_transaction.id = old_transaction.id
+        self._trans_orders.insert(new_transaction)
+        self._store.add(new_transaction)
+        self._indexTransaction(new_transaction)
+        self.clean(full=False, transaction=old_transaction)
+
+    def _clearTransactions(self):
+        """
+        deletes all transactions from the system
+        its not journaled on its own, the import that uses it is journaled as a whole
+        :return: void
+        """
+        self._trans_orders.reset([])
+        self.transactions = self._trans_orders.getElements()
+        self._store.rebuild()
+        self._product_transactions = {}
+        self._person_transactions = {}
+
     def deleteProduct(self, product:Product):
         """
         deletes the given product taking into account that we have case insensitivity
@@ -381,13 +443,10 @@ class Backend:
         :return: void
         """
         name_lower = product.name.lower()
-        for _product in self.products:
-            if _product.name.lower() == name_lower:
-                self.products.remove(_product)
-                return
+        if name_lower in self._product_index:
+            self.products.remove(self._product_index.pop(name_lower))
 
     @Dsave
-    @DsortTrans
     def renameCategory(self, category:str, new_category:str):
         """
         renames the given category to the new_category name
@@ -395,21 +454,21 @@ class Backend:
         :param new_category: str<new category name>
         :return: void
         """
-        assert(category.lower() in map(lambda x: x.lower(), self.categories)), STRINGS.ERROR_CATEGORY_NOT_FOUND
+        assert(category.lower() in self._category_index), STRINGS.ERROR_CATEGORY_NOT_FOUND
         assert(len(new_category) - new_category.count(" ") >= 3), STRINGS.ERROR_CATEGORY_CONTAINS_NOT_ENOUGH_CHAR
         category = category.lower()
-        #change the category inside the transactions
-        for transaction in self.transactions:
-            if category in map(lambda x: x.lower(), transaction.product.categories):
-                transaction.product.categories.pop(list(map(lambda x: x.lower(), transaction.product.categories)).index(category))
-                transaction.product.categories.append(new_category)
+        #change the category inside the products (the transactions only reference the products)
+        for product in self.products:
+            if category in map(lambda x: x.lower(), product.categories):
+                product.categories.pop(list(map(lambda x: x.lower(), product.categories)).index(category))
+                product.categories.append(new_category)
 
         #changes the category list
-        self.categories.pop(list(map(lambda x: x.lower(), self.categories)).index(category))
+        self.categories.remove(self._category_index.pop(category))
         self.categories.append(new_category)
+        self._category_index[new_category.lower()] = new_category
 
     @Dsave
-    @DsortTrans
     def renamePerson(self, person_name:str, new_person_name:str):
         """
         renames the given person to the new_person_name
@@ -417,11 +476,12 @@ class Backend:
         :param new_person_name: str<new person name>
         :return: void
         """
-        assert(person_name.lower() in map(lambda x: x.name.lower(), self.persons)), STRINGS.ERROR_PERSON_NOT_FOUND
+        assert(person_name.lower() in self._person_index), STRINGS.ERROR_PERSON_NOT_FOUND
         assert(len(new_person_name) - new_person_name.count(" ") >= 3), STRINGS.ERROR_PERSON_CONTAINS_NOT_ENOUGH_CHAR
         person_name = person_name.lower()
-        #change the persons inside the transactions
-        for transaction in self.transactions:
+        #change the persons inside the transactions, that reference that person
+        transactions = self._person_transactions.pop(person_name, {})
+        for transaction in transactions:
             if person_name in transaction.getLowerFtPersonNames(_sorted=False):
                 person = transaction.from_to_persons.pop(transaction.getLowerFtPersonNames(_sorted=False).index(person_name))
                 person.name = new_person_name
@@ -433,15 +493,15 @@ class Backend:
                 transaction.why_persons.append(person)
 
         #changes the person list
-        #it can happen that the list is changed correctly, because we are changing the name of the person object inside the transactions
-        #these objects are likely just a reference to the persons list, that means that they have already been changed
-        if person_name in map(lambda x: x.name.lower(), self.persons):
-            person = self.persons.pop(list(map(lambda x: x.name.lower(), self.persons)).index(person_name))
-            person.name = new_person_name
-            self.persons.append(person)
+        #the person object is likely already renamed, because the objects inside the transactions are just a reference to the persons list
+        person = self._person_index.pop(person_name)
+        person.name = new_person_name
+        self._person_index[new_person_name.lower()] = person
+        if transactions:
+            self._person_transactions.setdefault(new_person_name.lower(), {}).update(transactions)
+        self._store.renamePerson(person_name, new_person_name)
 
     @Dsave
-    @DsortTrans
     def renameProduct(self, product_name:str, new_product_name:str):
         """
         renames the given product to the new_product_name
@@ -449,52 +509,51 @@ class Backend:
         :param new_product_name: str<new product name>
         :return: void
         """
-        assert(product_name.lower() in map(lambda x: x.name.lower(), self.products)), STRINGS.ERROR_PRODUCT_NOT_FOUND
+        assert(product_name.lower() in self._product_index), STRINGS.ERROR_PRODUCT_NOT_FOUND
         assert(len(new_product_name) - new_product_name.count(" ") >= 1), STRINGS.ERROR_PRODUCT_CONTAINS_NOT_ENOUGH_CHAR
         product_name = product_name.lower()
-        #change the products inside the transactions
-        for transaction in self.transactions:
-            if product_name == transaction.product.name.lower():
-                transaction.product.name = new_product_name
+        #change the products inside the transactions, that reference that product
+        transactions = self._product_transactions.pop(product_name, {})
+        for transaction in transactions:
+            transaction.product.name = new_product_name
 
         #changes the prodcut list
-        #it can happen that the list is changed correctly, because we are changing the name of the product object inside the transactions
-        #these objects are likely just a reference to the products list, that means that they have already been changed
-        if product_name in map(lambda x: x.name.lower(), self.products):
-            product = self.persons.pop(list(map(lambda x: x.name.lower(), self.products)).index(product_name))
-            product.name = new_product_name
-            self.persons.append(product)
+        #the product object is likely already renamed, because the objects inside the transactions are just a reference to the products list
+        product = self._product_index.pop(product_name)
+        product.name = new_product_name
+        self._product_index[new_product_name.lower()] = product
+        if transactions:
+            self._product_transactions.setdefault(new_product_name.lower(), {}).update(transactions)
+            self._store.invalidateOrder(SortEnum.NAME)
 
     @Dsave
-    @DsortTrans
     def deleteCategoryByName(self, category:str):
         """
         deletes the given category from the system
         :param category: str<category, that you want to delete>
         :return: void
         """
-        assert(category.lower() in map(lambda x: x.lower(), self.categories)), STRINGS.ERROR_CATEGORY_NOT_FOUND
+        assert(category.lower() in self._category_index), STRINGS.ERROR_CATEGORY_NOT_FOUND
         category = category.lower()
-        #delete the category from the transactions
-        for transaction in self.transactions:
-            if category in map(lambda x: x.lower(), transaction.product.categories):
-                transaction.product.categories.pop(list(map(lambda x: x.lower(), transaction.product.categories)).index(category))
+        #delete the category from the products (the transactions only reference the products)
+        for product in self.products:
+            if category in map(lambda x: x.lower(), product.categories):
+                product.categories.pop(list(map(lambda x: x.lower(), product.categories)).index(category))
 
         #changes the category list
-        self.categories.pop(list(map(lambda x: x.lower(), self.categories)).index(category))
+        self.categories.remove(self._category_index.pop(category))
 
     @Dsave
-    @DsortTrans
     def deletePersonByName(self, person_name:str):
         """
         deletes the given person from the system
         :param person_name: str<name of the person, that you want to delete>
         :return: void
         """
-        assert(person_name.lower() in map(lambda x: x.name.lower(), self.persons)), STRINGS.ERROR_PERSON_NOT_FOUND
+        assert(person_name.lower() in self._person_index), STRINGS.ERROR_PERSON_NOT_FOUND
         person_name = person_name.lower()
-        #delete the persons from the transactions
-        for transaction in self.transactions:
+        #delete the persons from the transactions, that reference that person
+        for transaction in self._person_transactions.pop(person_name, {}):
             if person_name in transaction.getLowerFtPersonNames(_sorted=False):
                 transaction.from_to_persons.pop(transaction.getLowerFtPersonNames(_sorted=False).index(person_name))
 
@@ -502,34 +561,29 @@ class Backend:
                 transaction.why_persons.pop(transaction.getLowerWhyPersonNames(_sorted=False).index(person_name))
 
         #delete from the person list
-        #it can happen that the list is changed correctly, because we are deleting the person object inside the transactions
-        #these objects are likely just a reference to the persons list, that means that they have already been deleted
-        if person_name in map(lambda x: x.name.lower(), self.persons):
-            self.persons.pop(list(map(lambda x: x.name.lower(), self.persons)).index(person_name))
+        self.persons.remove(self._person_index.pop(person_name))
+        self._store.deletePerson(person_name)
 
     @Dsave
-    @DsortTrans
     def deleteProductByName(self, product_name:str):
         """
         deletes the given product from the system
         :param product_name: str<name of the product, that you want to delete>
         :return: void
         """
-        assert(product_name.lower() in map(lambda x: x.name.lower(), self.products)), STRINGS.ERROR_PRODUCT_NOT_FOUND
+        assert(product_name.lower() in self._product_index), STRINGS.ERROR_PRODUCT_NOT_FOUND
         product_name = product_name.lower()
         #deletes the transactions that have the given product
-        for transaction in self.transactions.copy():
-            if product_name == transaction.product.name.lower():
-                self.transactions.remove(transaction)
+        transactions = self._product_transactions.get(product_name, {}).copy()
+        for transaction in transactions:
+            self._trans_orders.remove(transaction)
+            self._store.delete(transaction)
+            self._unindexTransaction(transaction)
 
         #change the prodcut list
-        #it can happen that the list is changed correctly, because we are deleting the product object inside the transactions
-        #these objects are likely just a reference to the products list, that means that they have already been deleted
-        if product_name in map(lambda x: x.name.lower(), self.products):
-            self.products.pop(list(map(lambda x: x.name.lower(), self.products)).index(product_name))
+        self.products.remove(self._product_index.pop(product_name))
 
     @Dsave
-    @DsortTrans
     def mergeCategory(self, category1:str, category2:str, new_category:str):
         """
         merges two given categories into a new one and name it like new_category
@@ -539,39 +593,34 @@ class Backend:
         :param new_category: str<new category name>
         :return: void
         """
-        assert(category1.lower() in map(lambda x: x.lower(), self.categories)), STRINGS.ERROR_CATEGORY_NOT_FOUND
-        assert(category2.lower() in map(lambda x: x.lower(), self.categories)), STRINGS.ERROR_CATEGORY_NOT_FOUND
+        assert(category1.lower() in self._category_index), STRINGS.ERROR_CATEGORY_NOT_FOUND
+        assert(category2.lower() in self._category_index), STRINGS.ERROR_CATEGORY_NOT_FOUND
         assert(len(new_category) - new_category.count(" ") >= 3), STRINGS.ERROR_CATEGORY_CONTAINS_NOT_ENOUGH_CHAR
         category1 = category1.lower()
         category2 = category2.lower()
-        #delete the category from the transactions
-        for transaction in self.transactions:
-            cats_lower = list(map(lambda x: x.lower(), transaction.product.categories))
-            in_list = False     #true if some of the categories that you wanna merge are in the transaction
+        #delete the category from the products (the transactions only reference the products)
+        for product in self.products:
+            cats_lower = list(map(lambda x: x.lower(), product.categories))
+            in_list = False     #true if some of the categories that you wanna merge are in the product
             if category1 in cats_lower:
                 in_list = True
-                transaction.product.categories.pop(cats_lower.index(category1))
-                cats_lower = list(map(lambda x: x.lower(), transaction.product.categories))
+                product.categories.pop(cats_lower.index(category1))
+                cats_lower = list(map(lambda x: x.lower(), product.categories))
             if category2 in cats_lower:
                 in_list = True
-                transaction.product.categories.pop(cats_lower.index(category2))
+                product.categories.pop(cats_lower.index(category2))
             if in_list:
-                #at least one category was in the transaction
-                transaction.product.categories.append(new_category)
+                #at least one category was in the product
+                product.categories.append(new_category)
 
         #changes the category list
-        try:
-            self.categories.pop(list(map(lambda x: x.lower(), self.categories)).index(category1))
-        except:
-            pass
-        try:
-            self.categories.pop(list(map(lambda x: x.lower(), self.categories)).index(category2))
-        except:
-            pass
+        for category in (category1, category2):
+            if category in self._category_index:
+                self.categories.remove(self._category_index.pop(category))
         self.categories.append(new_category)
+        self._category_index[new_category.lower()] = new_category
 
     @Dsave
-    @DsortTrans
     def mergePerson(self, person1:str, person2:str, new_person:str):
         """
         merges two given persons into a new one and name it like new_person
@@ -582,18 +631,20 @@ class Backend:
         :param new_person: str<new person name>
         :return: void
         """
-        assert(person1.lower() in map(lambda x: x.name.lower(), self.persons)), STRINGS.ERROR_PERSON_NOT_FOUND
-        assert(person2.lower() in map(lambda x: x.name.lower(), self.persons)), STRINGS.ERROR_PERSON_NOT_FOUND
+        assert(person1.lower() in self._person_index), STRINGS.ERROR_PERSON_NOT_FOUND
+        assert(person2.lower() in self._person_index), STRINGS.ERROR_PERSON_NOT_FOUND
         assert(len(new_person) - new_person.count(" ") >= 3), STRINGS.ERROR_PERSON_CONTAINS_NOT_ENOUGH_CHAR
         person1 = person1.lower()
         person2 = person2.lower()
         #changes the person list
-        person = self.persons.pop(list(map(lambda x: x.name.lower(), self.persons)).index(person1))
-        self.persons.pop(list(map(lambda x: x.name.lower(), self.persons)).index(person2))
+        person = self._person_index.pop(person1)
+        self.persons.remove(self._person_index.pop(person2))
         person.name = new_person
-        self.persons.append(person)
-        #delete the person from the transactions
-        for transaction in self.transactions:
+        self._person_index[new_person.lower()] = person
+        #delete the person from the transactions, that reference one of the persons
+        transactions = self._person_transactions.pop(person1, {})
+        transactions.update(self._person_transactions.pop(person2, {}))
+        for transaction in transactions:
             ftpers_lower = list(map(lambda x: x.name.lower(), transaction.from_to_persons))
             whypers_lower = list(map(lambda x: x.name.lower(), transaction.why_persons))
             in_ftlist = False     #true if some of the persons that you wanna merge are in the ftpersons of the transaction
@@ -618,9 +669,12 @@ class Backend:
             if in_whylist:
                 #at least one person was in the whyperosns of the transaction
                 transaction.why_persons.append(person)
+        if transactions:
+            self._person_transactions.setdefault(new_person.lower(), {}).update(transactions)
+        self._store.renamePerson(person1, new_person)
+        self._store.renamePerson(person2, new_person)
 
     @Dsave
-    @DsortTrans
     def mergeProduct(self, product1:str, product2:str, new_product:str):
         """
         merges two given products into a new one and name it like new_product
@@ -631,38 +685,47 @@ class Backend:
         :param new_product: str<new product name>
         :return: void
         """
-        assert(product1.lower() in map(lambda x: x.name.lower(), self.products)), STRINGS.ERROR_PRODUCT_NOT_FOUND
-        assert(product2.lower() in map(lambda x: x.name.lower(), self.products)), STRINGS.ERROR_PRODUCT_NOT_FOUND
+        assert(product1.lower() in self._product_index), STRINGS.ERROR_PRODUCT_NOT_FOUND
+        assert(product2.lower() in self._product_index), STRINGS.ERROR_PRODUCT_NOT_FOUND
         assert(len(new_product) - new_product.count(" ") >= 1), STRINGS.ERROR_PRODUCT_CONTAINS_NOT_ENOUGH_CHAR
         product1 = product1.lower()
         product2 = product2.lower()
         #changes the product list
-        product = self.products.pop(list(map(lambda x: x.name.lower(), self.products)).index(product1))
-        self.products.pop(list(map(lambda x: x.name.lower(), self.products)).index(product2))
+        product = self._product_index.pop(product1)
+        self.products.remove(self._product_index.pop(product2))
         product.name = new_product
-        self.products.append(product)
-        #delete the product from the transactions
-        for transaction in self.transactions:
-            if transaction.product.name.lower() in [product1, product2]:
-                #we got a product
-                transaction.product = product
+        self._product_index[new_product.lower()] = product
+        #set the product in the transactions, that reference one of the products
+        transactions = self._product_transactions.pop(product1, {})
+        transactions.update(self._product_transactions.pop(product2, {}))
+        for transaction in transactions:
+            transaction.product = product
+            self._store.setProduct(transaction)
+        if transactions:
+            self._product_transactions.setdefault(new_product.lower(), {}).update(transactions)
 
     def sortTransactions(self, sortElement:SortEnum, up:bool):
         """
-        sorts the transactions given the sort criteria. should also sort new adds too
+        sets the sort criteria of the transactions
+        the sorted rows are cached in the store and new adds are inserted, so only an order that was never used before needs a sort
         :param sortElement: object<SortEnum>
         :param up: bool<ascending?>
         :return: void
         """
+        assert(type(sortElement) == SortEnum), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
         self.sortCriteriaTrans = [sortElement, up]
-        if sortElement == SortEnum.NAME:
-            self.transactions.sort(key=lambda x: x.product.name.lower(), reverse=not(up))
-        elif sortElement == SortEnum.CASHFLOW:
-            self.transactions.sort(key=lambda x: x.cashflow, reverse=up)
-        elif sortElement == SortEnum.DATE:
-            self.transactions.sort(key=lambda x: x.date, reverse=up)
-        else:
-            assert(False), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
+
+    def _getSorted(self, elements:list, sortCriteria:list[SortEnum, bool]):
+        """
+        iterates over an ascending sorted list in the direction of the sort criteria
+        "up" means a-z for names, but the newest or highest first for dates and cashflows
+        :param elements: list or numpy.ndarray<elements sorted ascending by the key of the sort criteria>
+        :param sortCriteria: list<object<SortEnum>, bool<up?>>
+        :return: Iterable<elements>
+        """
+        sortElement, up = sortCriteria
+        descending = not(up) if sortElement == SortEnum.NAME else up
+        return elements[::-1] if descending else elements
 
     def clean(self, full:bool, transaction:Transaction=None):
         """
@@ -675,17 +738,12 @@ class Backend:
         assert(type(full) == bool), STRINGS.getTypeErrorString(full, "full", bool)
         assert(type(transaction) == Transaction or (transaction == None and full)), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
         if full:
-            neededProducts = []
-            for _transaction in self.transactions:
-                neededProducts.append(_transaction.product.name.lower())
             for product in self.products.copy():
-                if not product.name.lower() in neededProducts:
+                if not product.name.lower() in self._product_transactions:
                     self.deleteProduct(product)
         else:
-            for _transaction in self.transactions:
-                if _transaction.product.name.lower() == transaction.product.name.lower():
-                    return
-            else:
+            if not transaction.product.name.lower() in self._product_transactions:
+                #no other transaction has that product
                 self.deleteProduct(transaction.product)
 
     def TESTloadFromCSV(self):  #DEBUGONLY
@@ -725,11 +783,11 @@ class Backend:
                 cashflow_full = -abs(cashflow_full)
             
             for category in categories:
-                if category.lower() in map(lambda x: x.lower(), self.categories):
+                if category.lower() in self._category_index:
                     continue
                 self.addCategory(category)
             for person in ftpersons + whypersons:
-                if person.lower() in map(lambda x: x.name.lower() ,self.persons):
+                if person.lower() in self._person_index:
                     continue
                 self.addPerson(person)
 
@@ -737,48 +795,142 @@ class Backend:
 
     def loadFromCSV(self, fileName:str):
         """
-        laods all transactions from a csv file
+        loads all transactions from a csv file, they replace the current transactions
         the separation symbol has to be ";"
+        the file is read in chunks and the columns of each chunk are parsed at once
+        rows that are not valid are skipped and reported, the valid ones are added with a single sort and a single save
         :param fileName: str<path and file name of the csv>
-        :return: void
+        :return: list<str<error message of a skipped row>, ...> or bool<False if the file could not be read>
         """
         assert(type(fileName) == str), STRINGS.getTypeErrorString(fileName, "fileName", str)
         if not fileName.endswith(".csv"):
             #if the ending is not correct, appending the right ending
             fileName += ".csv"
-        self.transactions = []
+        rows = []
+        errors = []     #(line, message) of the skipped rows
         try:
-            trans_df = pandas.read_csv(fileName, sep=";")
-            for _, row in trans_df.iterrows():
-                #if the category or person is not known, a new one has to be added
-                cats = [] if type(row["categories"]) == float and math.isnan(row["categories"]) else row["categories"].split(",")
-                for cat in cats:
-                    if not cat in self.categories:
-                        self.addCategory(cat)
-                ftp = [] if type(row["ftpersons"]) == float else row["ftpersons"].split(",")
-                for p in ftp:
-                    if not p in self.persons:
-                        self.addPerson(p)
-                whyp = [] if type(row["whypersons"]) == float else row["whypersons"].split(",")
-                for p in whyp:
-                    if not p in self.persons:
-                        self.addPerson(p)
-                #gets the transaction object
-                trans = self.getTransactionObject(
-                    datetime.date.fromisoformat(row["date"]),
-                    row["product"], 
-                    int(row["number"]),
-                    float(row["cashflow"]),
-                    cats,
-                    ftp,
-                    whyp)
-                if trans == False:
-                    raise ValueError
-                self.addTransaction(trans)
-        except:
-            self.transactions = []
+            #all values are read as strings, so the parsing is done by us
+            for chunk in pandas.read_csv(fileName, sep=";", dtype=str, keep_default_na=False, chunksize=CONSTANTS.CSV_CHUNK_SIZE):
+                rows += self._parseCSVChunk(chunk, errors)
+        except (OSError, ValueError, KeyError, pandas.errors.ParserError):
+            #the file is not readable or some columns are missing
             return False
-        return True
+        if rows == [] and errors != []:
+            #nothing in the file is valid, so its probably not a transaction file
+            return False
+        self._importTransactions(rows)
+        #the import is saved as a new snapshot, so the large journal record is dropped right away
+        self._save()
+        return [f"line {line}: {message}" for line, message in sorted(errors)]
+
+    def _parseCSVChunk(self, chunk:pandas.DataFrame, errors:list[tuple[int, str]]):
+        """
+        parses the rows of a csv chunk
+        date, number and cashflow are parsed for the whole chunk at once, only the name lists are split per row
+        :param chunk: pandas.DataFrame<rows of the csv, all values as strings>
+        :param errors: list<tuple<int<line>, str<message>>>, the errors of the skipped rows are appended
+        :return: list<tuple<datetime.date<date>, str<product name>, int<number>, int<cashflow in minor units>, list<str<category>>, list<str<ftperson>>, list<str<whyperson>>>>
+        """
+        lines = chunk.index.to_numpy() + 2     #the first line is the header
+        dates = pandas.to_datetime(chunk["date"], format="%Y-%m-%d", errors="coerce")
+        numbers = pandas.to_numeric(chunk["number"], errors="coerce")
+        #the cashflows are rounded to minor units, a cashflow that rounds to zero is not valid
+        cashflows = (pandas.to_numeric(chunk["cashflow"], errors="coerce") * CONSTANTS.MONEY_MINOR_UNITS).round()
+        products = chunk["product"]
+        checks = (
+            ((dates.notna() & (dates <= pandas.Timestamp(datetime.date.today()))).to_numpy(), STRINGS.ERROR_IMPORT_INVALID_DATE, chunk["date"]),
+            (((numbers > 0) & (numbers % 1 == 0)).to_numpy(), STRINGS.ERROR_IMPORT_INVALID_NUMBER, chunk["number"]),
+            ((cashflows.notna() & (cashflows != 0)).to_numpy(), STRINGS.ERROR_IMPORT_INVALID_CASHFLOW, chunk["cashflow"]),
+            ((products.str.strip() != "").to_numpy(), STRINGS.ERROR_PRODUCT_CONTAINS_NO_CHAR, products))
+        valid = numpy.ones(len(chunk), dtype=numpy.bool_)
+        for check, message, values in checks:
+            #only the first error of a row is reported
+            invalid = valid & ~check
+            errors += [(line, message+value) for line, value in zip(lines[invalid], values.to_numpy()[invalid])]
+            valid &= check
+
+        #the name columns repeat a lot, so each distinct value is split and checked only once
+        names:dict[str, dict[str, tuple[list[str], str]]] = {}
+        for column, error_length, error_unique in (("categories", STRINGS.ERROR_CATEGORY_CONTAINS_NOT_ENOUGH_CHAR, STRINGS.ERROR_CATEGORY_NOT_UNIQUE),
+                                                   ("ftpersons", STRINGS.ERROR_PERSON_CONTAINS_NOT_ENOUGH_CHAR, STRINGS.ERROR_FTPERSON_NOT_UNIQUE),
+                                                   ("whypersons", STRINGS.ERROR_PERSON_CONTAINS_NOT_ENOUGH_CHAR, STRINGS.ERROR_WHYPERSON_NOT_UNIQUE)):
+            names[column] = {}
+            for value in pandas.unique(chunk[column].to_numpy()[valid]):
+                split = [] if value == "" else value.split(",")
+                names[column][value] = (split, self._getImportNamesError(split, error_length, error_unique))
+
+        rows = []
+        for line, date, product, number, cashflow, categories, ftpersons, whypersons in zip(lines[valid], dates.dt.date.to_numpy()[valid],
+                products.to_numpy()[valid], numbers.to_numpy()[valid], cashflows.to_numpy()[valid], chunk["categories"].to_numpy()[valid],
+                chunk["ftpersons"].to_numpy()[valid], chunk["whypersons"].to_numpy()[valid]):
+            categories, category_error = names["categories"][categories]
+            ftpersons, ftperson_error = names["ftpersons"][ftpersons]
+            whypersons, whyperson_error = names["whypersons"][whypersons]
+            error = category_error or ftperson_error or whyperson_error
+            if error:
+                errors.append((line, error))
+                continue
+            #the categories become the list of the product, so each row needs its own list
+            rows.append((date, product, int(number), int(cashflow), list(categories), ftpersons, whypersons))
+        return rows
+
+    def _getImportNamesError(self, names:list[str], error_length:str, error_unique:str):
+        """
+        checks the category or person names of an imported row like the form does
+        :param names: list<str<name1>, ...>
+        :param error_length: str<message if a name is too short>
+        :param error_unique: str<message if a name is given twice>
+        :return: str<error message> or None if the names are valid
+        """
+        for name in names:
+            if len(name) - name.count(" ") < 3:
+                return error_length+name
+        if len(set(map(lambda x: x.lower(), names))) != len(names):
+            return error_unique+",".join(names)
+        return None
+
+    @Dsave
+    def _importTransactions(self, rows:list[tuple]):
+        """
+        replaces all transactions with the parsed rows of an import
+        unknown categories, persons and products are added in the same pass, the categories of a known product are overwritten
+        the transactions are built at once from the already validated columns and sorted once
+        the whole import is one journal record, so a replay never clears the transactions without adding the imported ones
+        :param rows: list<tuple<row like it is returned by _parseCSVChunk>>
+        :return: void
+        """
+        self._clearTransactions()
+        products = []
+        for date, product_name, number, cashflow, categories, ftpersons, whypersons in rows:
+            for i, category in enumerate(categories):
+                if not category.lower() in self._category_index:
+                    self.categories.append(category)
+                    self._category_index[category.lower()] = category
+                #use the spelling of the known category
+                categories[i] = self._category_index[category.lower()]
+            for person_name in ftpersons + whypersons:
+                if not person_name.lower() in self._person_index:
+                    person = Person(person_name)
+                    self.persons.append(person)
+                    self._person_index[person_name.lower()] = person
+            product = self._getProductByName(product_name)
+            if product == False:
+                product = self._addProduct(product_name, categories)
+            else:
+                product.categories = categories
+            products.append(product)
+        transactions = Transaction.fromColumns([row[0] for row in rows], products,
+            numpy.array([row[2] for row in rows], dtype=numpy.int64), numpy.array([row[3] for row in rows], dtype=numpy.int64),
+            [[self._person_index[name.lower()] for name in row[5]] for row in rows], [[self._person_index[name.lower()] for name in row[6]] for row in rows])
+
+        for transaction in transactions:
+            self._assignId(transaction)
+        self._trans_orders.reset(transactions)
+        self.transactions = self._trans_orders.getElements()
+        self._store.addMany(transactions)
+        for transaction in transactions:
+            self._indexTransaction(transaction)
+        self.clean(full=True)
 
     def export(self, fileName:str):
         """
@@ -797,8 +949,8 @@ class Backend:
              "product": map(lambda x: x.product.name, self.transactions),
              "categories": map(lambda x: ",".join(x.product.categories), self.transactions),
              "number": map(lambda x: x.number, self.transactions),
-             "cashflow_pp": map(lambda x: x.cashflow_per_product, self.transactions),
-             "cashflow": map(lambda x: x.cashflow, self.transactions),
+             "cashflow_pp": map(lambda x: utils.formatCents(x.cashflow_per_product_cents), self.transactions),
+             "cashflow": map(lambda x: utils.formatCents(x.cashflow_cents), self.transactions),
              "ftpersons": map(lambda x: ",".join(map(lambda y: y.name, x.from_to_persons)), self.transactions),
              "whypersons": map(lambda x: ",".join(map(lambda y: y.name, x.why_persons)), self.transactions)})
         #saves the data frame
@@ -810,10 +962,55 @@ class Backend:
         :param product_name: str<name of the product>
         :return: object<Product> or bool<False if no product is found>
         """
-        for product in self.products:
-            if product.name.lower() == product_name.lower():
-                return product
-        return False
+        return self._product_index.get(product_name.lower(), False)
+
+    def _isPersonName(self, person_name:str):
+        """
+        checks whether a person with exactly that name is known
+        :param person_name: str<name of the person>
+        :return: bool<is known?>
+        """
+        person = self._person_index.get(person_name.lower())
+        return person != None and person.name == person_name
+
+    def _rebuildIndexes(self):
+        """
+        builds the lower case name indexes from the product, category and person lists
+        :return: void
+        """
+        self._product_index = {product.name.lower(): product for product in self.products}
+        self._category_index = {category.lower(): category for category in self.categories}
+        self._person_index = {person.name.lower(): person for person in self.persons}
+        self._product_transactions = {}
+        self._person_transactions = {}
+        for transaction in self.transactions:
+            self._indexTransaction(transaction)
+
+    def _indexTransaction(self, transaction:Transaction):
+        """
+        adds a transaction to the posting lists of its product and persons
+        :param transaction: object<Transaction>
+        :return: void
+        """
+        self._product_transactions.setdefault(transaction.product.name.lower(), {})[transaction] = True
+        for person in transaction.from_to_persons + transaction.why_persons:
+            self._person_transactions.setdefault(person.name.lower(), {})[transaction] = True
+
+    def _unindexTransaction(self, transaction:Transaction):
+        """
+        removes a transaction from the posting lists of its product and persons
+        empty posting lists are removed, so a name is only a key if some transaction references it
+        :param transaction: object<Transaction>
+        :return: void
+        """
+        postings = [(self._product_transactions, transaction.product.name.lower())]
+        for person in transaction.from_to_persons + transaction.why_persons:
+            postings.append((self._person_transactions, person.name.lower()))
+        for posting_lists, name in postings:
+            transactions = posting_lists.get(name, {})
+            transactions.pop(transaction, None)
+            if not transactions:
+                posting_lists.pop(name, None)
 
     @Dsave
     def _setCategoriesToProduct(self, product_name:str, categories:list[str]):
@@ -844,6 +1041,7 @@ class Backend:
 
         product_obj = Product(product_name, categories)
         self.products.append(product_obj)
+        self._product_index[product_name.lower()] = product_obj
         return product_obj
 
     def _gen_fernet_key(self, passcode:bytes) -> bytes:
@@ -857,26 +1055,66 @@ class Backend:
         hlib.update(passcode)
         return base64.urlsafe_b64encode(hlib.hexdigest().encode('latin-1'))
 
+    def flush(self):
+        """
+        writes all changes that are not saved yet and waits until they are written
+        should be called before the program exits
+        raises the error of the save if the changes could not be written
+        :return: void
+        """
+        self._saver.flush()
+
     def _save(self):
         """
         saves, the backend object in a file
+        the snapshot contains all journaled mutations, so the journal gets emptied
+        blocks until the save worker wrote the snapshot
+        if that fails, the save worker keeps trying in the background
         :return: void
         """
-        dumped_data = pickle.dumps([self.products, self.categories, self.persons, self.transactions, self.investments, self.current_assets, self.ticker_symbols, self.ticker_shares_dict])
-        dec_file = open("data.fin", "wb")
-        dec_file.write(Fernet(self._key).encrypt(dumped_data))
-        dec_file.close()
+        self._compact = True
+        self._saver.markDirty()
+        try:
+            self._saver.flush()
+        except Exception as e:
+            print("The data could not be saved yet: "+str(e))
+
+    def _persist(self):
+        """
+        gets called by the save worker
+        writes the journaled mutations and compacts the journal into a snapshot if its too long
+        :return: void
+        """
+        self._ticker_cache.write()
+        if self._journal.writePending() >= CONSTANTS.JOURNAL_MAX_RECORDS or self._compact:
+            self._writeSnapshot()
+            #only reset after the snapshot is written, so a failed snapshot is tried again
+            self._compact = False
+
+    def _writeSnapshot(self):
+        """
+        writes all data into the data file and empties the journal afterwards
+        :return: void
+        """
+        with self._lock:
+            #no mutation can happen while the data is dumped, so the snapshot matches the journal sequence number
+            journal_seq = self._journal.seq
+            dumped_data = pickle.dumps([self.products, self.categories, self.persons, self.transactions, self.investments, self.current_assets, self.ticker_symbols, self.ticker_shares_dict, journal_seq, self._next_id])
+        writeFileAtomic(CONSTANTS.DATA_FILE, Fernet(self._key).encrypt(dumped_data))
+        self._journal.truncate()
     
     def _load(self):
         """
         loads, the backend object from a file
+        the mutations from the journal are replayed on top of the loaded snapshot
         :return: void
         """
+        self._ticker_cache.load()
         try:
-            data_file = open("data.fin", "rb")
+            data_file = open(CONSTANTS.DATA_FILE, "rb")
         except:
             print("no file to load from found")
-            self.__init__(self.ui, load=False)
+            self._replayJournal(0)
             return
         try:
             dumped_data = Fernet(self._key).decrypt(data_file.read())
@@ -885,19 +1123,190 @@ class Backend:
             data_file.close()
             return
         data_file.close()
+        journal_seq = 0
         try:
             saved = pickle.loads(dumped_data)
             self.products = saved[0]
             self.categories = saved[1]
             self.persons =  saved[2]
-            self.transactions = saved[3]
-            self.investments = saved[4]
-            self.current_assets = saved[5]
+            self._trans_orders.reset(saved[3])
+            self.transactions = self._trans_orders.getElements()
+            self._inv_orders.reset(saved[4])
+            self.investments = self._inv_orders.getElements()
+            #the current assets and shares (saved[5] and saved[7]) are derived from the investments by the ledger
             self.ticker_symbols = saved[6]
-            self.ticker_shares_dict = saved[7]
+            if len(saved) > 8:
+                #older data files are written without a journal
+                journal_seq = saved[8]
+            if len(saved) > 9:
+                self._next_id = saved[9]
         except:
             print("Some error occured with the old data")
-        Thread(target=self.initAfterLoad).start()   #init the loaded data in an other thread
+        #older data files are written without ids
+        for element in self.transactions + self.investments:
+            self._assignId(element)
+        self._store.rebuild()
+        self._rebuildIndexes()
+        self._internAssets()
+        self._rebuildLedger()
+        self.initAfterLoad()    #the replay needs the investment hash map
+        self._replayJournal(journal_seq)
+
+    def _replayJournal(self, journal_seq:int):
+        """
+        replays all journal records that are newer than the loaded snapshot
+        :param journal_seq: int<sequence number of the last journal record that is contained in the snapshot>
+        :return: void
+        """
+        self._replaying = True
+        try:
+            for name, args in self._journal.read(journal_seq):
+                self._replayRecord(name, args)
+        except:
+            print("Some error occured while replaying the journal")
+        finally:
+            self._replaying = False
+
+    def _journalRecord(self, name:str, args:tuple):
+        """
+        records a mutation in the journal, the objects in args are stored as plain values
+        the save worker writes it after the current burst of changes
+        :param name: str<name of the mutating method>
+        :param args: tuple<arguments of the mutating method>
+        :return: void
+        """
+        record_args = []
+        for arg in args:
+            if type(arg) == Transaction:
+                arg = self._getTransactionRecord(arg)
+            elif type(arg) == Investment:
+                arg = self._getInvestmentRecord(arg)
+            record_args.append(arg)
+        self._journal.record(name, tuple(record_args))
+        self._saver.markDirty()
+
+    def _replayRecord(self, name:str, args:tuple):
+        """
+        performs a journaled mutation again, the stored plain values are converted back into objects
+        :param name: str<name of the mutating method>
+        :param args: tuple<arguments as they are stored in the journal>
+        :return: void
+        """
+        match name:
+            case "addTransaction":
+                args = (self._getTransactionFromRecord(args[0]),)
+            case "deleteTransaction":
+                args = (self._findTransactionByRecord(args[0]),)
+            case "addInvestment":
+                args = (self._getInvestmentFromRecord(args[0]),)
+            case "deleteInvestment":
+                args = (self._findInvestmentByRecord(args[0]),)
+            case "replaceTransaction":
+                #the old transaction has to be found before the new one adds its product
+                old_transaction = self._findTransactionByRecord(args[0])
+                args = (old_transaction, self._getTransactionFromRecord(args[1]))
+            case "replaceInvestment":
+                args = (self._findInvestmentByRecord(args[0]), self._getInvestmentFromRecord(args[1]))
+        getattr(self, name)(*args)
+
+    def _getTransactionRecord(self, transaction:Transaction):
+        """
+        gets the plain values of a transaction, that are stored in the journal
+        :param transaction: object<Transaction>
+        :return: tuple<date, product name, categories, number, cashflow, ftperson names, whyperson names, id>
+        """
+        return (transaction.date, transaction.product.name, list(transaction.product.categories), transaction.number, transaction.cashflow,
+                [person.name for person in transaction.from_to_persons], [person.name for person in transaction.why_persons], transaction.id)
+
+    def _getTransactionFromRecord(self, record:tuple):
+        """
+        builds a new transaction from its journal record, using the known product and person objects
+        :param record: tuple<transaction record>
+        :return: object<Transaction>
+        """
+        date, product_name, categories, number, cashflow, ftpersons, whypersons = record[:7]
+        product_obj = self._getProductByName(product_name)
+        if product_obj == False:
+            product_obj = self._addProduct(product_name, categories)
+        transaction = Transaction(date, product_obj, number, cashflow, self._getPersonsByNames(ftpersons), self._getPersonsByNames(whypersons))
+        if len(record) > 7:
+            #older journals are written without ids
+            transaction.id = record[7]
+        return transaction
+
+    def _findTransactionByRecord(self, record:tuple):
+        """
+        gets the known transaction that matches a journal record
+        :param record: tuple<transaction record>
+        :return: object<Transaction>
+        """
+        if len(record) > 7:
+            transaction = self._store.getTransaction(record[7])
+            if transaction != None:
+                return transaction
+            raise ValueError(STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(record))
+        #older journals are written without ids, so the values have to be compared
+        for transaction in self.transactions:
+            if self._getTransactionRecord(transaction)[:7] == record:
+                return transaction
+        raise ValueError(STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(record))
+
+    def _assignId(self, element:Transaction|Investment):
+        """
+        gives a new transaction or investment the next id, an element that has an id already keeps it
+        :param element: object<Transaction> or object<Investment>
+        :return: void
+        """
+        if element.id == None:
+            element.id = self._next_id
+        self._next_id = max(self._next_id, element.id + 1)
+
+    def _getPersonsByNames(self, person_names:list[str]):
+        """
+        gets the person objects to the given names (ignoring case)
+        names that are not known get a new person object
+        :param person_names: list<str<person name1>, ...>
+        :return: list<object<Person>, ...>
+        """
+        return [self._person_index[name.lower()] if name.lower() in self._person_index else Person(name) for name in person_names]
+
+    def _getInvestmentRecord(self, investment:Investment):
+        """
+        gets the plain values of an investment, that are stored in the journal
+        :param investment: object<Investment>
+        :return: tuple<trade type, date, ticker symbol, short name, number, price per asset, tradingfee, tax, id>
+        """
+        return (investment.trade_type, investment.date, investment.asset.ticker_symbol, investment.asset.short_name,
+                investment.number, investment.price_per_asset, investment.tradingfee, investment.tax, investment.id)
+
+    def _getInvestmentFromRecord(self, record:tuple):
+        """
+        builds a new investment from its journal record
+        :param record: tuple<investment record>
+        :return: object<Investment>
+        """
+        trade_type, date, ticker_symbol, short_name, number, ppa, tradingfee, tax = record[:8]
+        investment = Investment(trade_type, date, self._getAsset(ticker_symbol, short_name), number, ppa, tradingfee, tax)
+        if len(record) > 8:
+            #older journals are written without ids
+            investment.id = record[8]
+        return investment
+
+    def _findInvestmentByRecord(self, record:tuple):
+        """
+        gets the known investment that matches a journal record
+        :param record: tuple<investment record>
+        :return: object<Investment>
+        """
+        if len(record) > 8:
+            if record[8] in self._investment_ids:
+                return self._investment_ids[record[8]]
+            raise ValueError(STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(record))
+        #older journals are written without ids, so the values have to be compared
+        for investment in self.investments:
+            if self._getInvestmentRecord(investment)[:8] == record:
+                return investment
+        raise ValueError(STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(record))
         
 
 #***********************INVESTMENT******************************
@@ -907,12 +1316,21 @@ class Backend:
         sets up some required datatyes
         :return: void
         """
-        self.investments:list[Investment] = []       #saves all investment objects
+        #holds the investments sorted by each sort key that was used, so a new investment is just inserted at its position
+        self._inv_orders = SortedOrders(INVESTMENT_SORT_KEYS, SortEnum.DATE)
+        self.investments:list[Investment] = self._inv_orders.getElements()  #saves all investment objects (sorted ascending by the active sort key)
         self.investment_dict:dict[Investment, True] = {}     #saves all investment object in a hash map
-        self.current_assets:list[Asset] = []    #saves all current assets hold by the user
+        self._investment_ids:dict[int, Investment] = {}     #the investment of each id
+        self._ledger = PositionLedger()     #holds the running number of shares of each ticker to validate the investments
+        self._lots = LotEngine(LotMethod.FIFO)     #matches the sold shares to the bought shares
+        self._returns = ReturnCalculator(lambda ticker_symbol: self._lots.getTrades(ticker_symbol))    #caches the cashflows of each ticker
+        self.current_assets:dict[str, Asset] = {}    #saves all current assets hold by the user per ticker
+        self._asset_index:dict[tuple[str, str], Asset] = {}  #the one asset object per ticker symbol and short name, that all investments share
         self.ticker_symbols:dict[str, True] = {}           #a list of tickers used by the user (we can import some tickers here)
         self.ticker_shares_dict:dict[str, float] = {}             #saves the current number of shares that the user is holding per asset
         self.sortCriteriaInv = [SortEnum.DATE, True]
+        self._valuation = ValuationEngine(self.quote_provider)    #marks the held assets to market
+        self._price_history = PriceHistoryStore(CONSTANTS.PRICE_HISTORY_DIR, self.quote_provider)   #local daily close prices of the tickers
         self.timeout_time = 1.0   #time in seconds the programm should wait for a api response before throwing
         self.investmentFilter = Filter()   #sets up a investment filter object for the backend
 
@@ -926,6 +1344,15 @@ class Backend:
         for i in self.investments:
             if not i in self.investment_dict:
                 self.investment_dict[i] = True
+            self._investment_ids[i.id] = i
+
+    def getInvestmentById(self, investment_id:int):
+        """
+        getter for the investment with the given id
+        :param investment_id: int<id of the investment>
+        :return: object<Investment> or None if there is no investment with that id
+        """
+        return self._investment_ids.get(investment_id)
 
     def getTickerNames(self):
         """
@@ -939,7 +1366,7 @@ class Backend:
         getter for stock names
         :return: Iterable[str<stock name1>, ...]
         """
-        return list(sorted(map(lambda x: x.short_name, self.current_assets)))
+        return list(sorted(map(lambda x: x.short_name, self.current_assets.values())))
 
     def getInvestments(self):
         """
@@ -947,7 +1374,7 @@ class Backend:
         these are sorted like the sort criteria is specified
         :return: Iterable[Investment]
         """
-        return self.investments
+        return list(self._getSorted(self.investments, self.sortCriteriaInv))
 
     def getAllAssetNames(self):
         """
@@ -967,7 +1394,7 @@ class Backend:
         :param name: str<name of the asset>
         :return: str<ticker>
         """
-        for asset in self.current_assets:
+        for asset in self.current_assets.values():
             if asset.short_name == name:
                 return asset.ticker_symbol
         print("error finding the name in the current assets")
@@ -984,33 +1411,160 @@ class Backend:
         else:
             #user dont hold this asset right now
             return 0
+
+    def getSharesAtDate(self, ticker_symbol:str, date:datetime.date):
+        """
+        getter for the number of shares of an asset that were held at the end of a date
+        :param ticker_symbol: str<ticker symbol of the asset>
+        :param date: datetime.date<day of the query>
+        :return: float<number of shares>
+        """
+        with self._lock:
+            return self._ledger.getSharesAt(ticker_symbol, date)
+
+    def getHoldingsAtDate(self, date:datetime.date):
+        """
+        getter for the number of shares of all assets that were held at the end of a date
+        :param date: datetime.date<day of the query>
+        :return: dict<str<ticker symbol>: float<number of shares>> (only assets with shares)
+        """
+        with self._lock:
+            holdings = {ticker_symbol: self._ledger.getSharesAt(ticker_symbol, date) for ticker_symbol in self._ledger.getTickers()}
+        return {ticker_symbol: shares for ticker_symbol, shares in holdings.items() if shares > 0}
+
+    def getDailyShares(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the number of shares of an asset at the end of each day of a date range, e.g. for charts
+        :param ticker_symbol: str<ticker symbol of the asset>
+        :param start: datetime.date<first day>
+        :param end: datetime.date<last day>
+        :return: numpy.ndarray<float64 shares of each day>
+        """
+        with self._lock:
+            return self._ledger.getDailyShares(ticker_symbol, start, end)
+
+    def getPositions(self):
+        """
+        getter for the number of shares and the cost basis of all currently held assets
+        the cost basis depends on the lot method (fifo or average cost)
+        :return: dict<str<ticker symbol>: tuple<float<shares>, float<cost basis>>>
+        """
+        with self._lock:
+            return {ticker_symbol: self._lots.getPosition(ticker_symbol) for ticker_symbol in self.current_assets}
+
+    def getLotSummary(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the realized profits, fees, taxes and dividends of the trades in a date range
+        and the held shares and their cost basis at the end of the range
+        :param ticker_symbol: str<ticker symbol> or None for all assets
+        :param start: datetime.date<first day>
+        :param end: datetime.date<last day>
+        :return: object<LotSummary>
+        """
+        with self._lock:
+            return self._lots.getSummary(ticker_symbol, start, end)
+
+    def setLotMethod(self, method:LotMethod):
+        """
+        setter for the method that matches sold shares to bought shares
+        :param method: object<LotMethod>
+        :return: void
+        """
+        with self._lock:
+            self._lots.setMethod(method)
+
+    def refreshValuation(self):
+        """
+        starts loading the prices of all held assets with one request, it doesnt block
+        :return: object<Future<PortfolioValuation>>
+        """
+        return self._valuation.refresh(self.getPositions())
+
+    def getPriceHistory(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the daily close prices of a ticker, only the days that are not stored yet are loaded from the api
+        blocks until the missing prices are loaded
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day>
+        :param end: datetime.date<last day>
+        :return: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>> (read only views)
+        """
+        return self._price_history.getHistory(ticker_symbol, start, end)
+
+    def getMoneyWeightedReturns(self):
+        """
+        getter for the money weighted returns (xirr) of all assets and the portfolio
+        the current value of the held shares is taken from the last valuation
+        :return: tuple<dict<str<ticker symbol>: float<yearly return>>, float<yearly return of the portfolio>> (nan if its unknown)
+        """
+        values, _, day = self._getCurrentValues()
+        with self._lock:
+            return self._returns.getMoneyWeighted(list(self._lots.getTickers()), values, day)
+
+    def getTimeWeightedReturns(self, timeout:float=None):
+        """
+        getter for the time weighted returns of all assets and the portfolio
+        the missing daily close prices are loaded into the price history first, this blocks if some are missing
+        the data is not locked while they are loaded, so the returns are computed from the stored prices afterwards
+        if the prices cannot be loaded (an error of the api or the timeout), only the prices that are already stored are used
+        :param timeout: float<seconds to wait for the quote provider> or None to wait until its done
+        :return: tuple<dict<str<ticker symbol>: float<return>>, float<return of the portfolio>> (nan if its unknown)
+        """
+        _, prices, day = self._getCurrentValues()
+        with self._lock:
+            tickers = list(self._lots.getTickers())
+            start = min([self._lots.getTrades(ticker_symbol)[0].date for ticker_symbol in tickers], default=day)
+        #a failed update keeps the stored prices, the days without a price use the prices of the trades
+        self._price_history.update(tickers, start, day, timeout)
+        with self._lock:
+            return self._returns.getTimeWeighted(list(self._lots.getTickers()), prices, day, self._price_history.getStoredHistory)
+
+    def _getCurrentValues(self):
+        """
+        gets the current values and prices of all assets from the last valuation
+        an asset that is held but has no price gets nan, an asset that is not held has no value
+        :return: tuple<dict<str<ticker symbol>: float<value>>, dict<str<ticker symbol>: float<price>>, datetime.date<day of the valuation>>
+        """
+        valuation = self.getValuation()
+        values:dict[str, float] = {}
+        prices:dict[str, float] = {}
+        if valuation != None:
+            for ticker_symbol, value, price in zip(valuation.tickers, valuation.values, valuation.prices):
+                values[ticker_symbol] = float(value)
+                prices[ticker_symbol] = float(price)
+        for ticker_symbol in self.current_assets:
+            values.setdefault(ticker_symbol, numpy.nan)
+        day = datetime.date.fromtimestamp(valuation.time) if valuation != None else datetime.date.today()
+        return values, prices, day
+
+    def getValuation(self):
+        """
+        getter for the last finished valuation of the held assets
+        :return: object<PortfolioValuation> or None if there was no valuation yet
+        """
+        return self._valuation.last
     @Dbenchmark
     def sortInvestments(self, sortElement:SortEnum, up:bool):
         """
-        sorts the investments given the sort criteria. should also sort new adds too
+        sets the sort criteria of the investments. the investments are kept sorted, so new adds are sorted too
+        only a sort key that was never used before needs a sort
         :param sortElement: object<SortEnum>
         :param up: bool<ascending?>
         :return: void
         """
-        self.sortCriteriaTrans = [sortElement, up]
-        if sortElement == SortEnum.NAME:
-            self.investments.sort(key=lambda x: x.asset.short_name.lower(), reverse=not(up))
-        elif sortElement == SortEnum.CASHFLOW:
-            self.investments.sort(key=lambda x: x.price, reverse=up)
-        elif sortElement == SortEnum.DATE:
-            self.investments.sort(key=lambda x: x.date, reverse=up)
-        else:
-            assert(False), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
+        assert(sortElement in INVESTMENT_SORT_KEYS), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
+        with self._lock:
+            self.sortCriteriaInv = [sortElement, up]
+            self.investments = self._inv_orders.setActive(sortElement)
     
     def printInvestments(self): #DEBUGONLY
         """
         prints the current investment data for debug purposes
         :return: void
         """
-        self.sortInvestments(SortEnum.DATE, False)
-        print(list(map(lambda x: x.date.isoformat()+" "+x.trade_type+" "+x.asset.ticker_symbol+" "+str(x.number), self.investments)))
+        print(list(map(lambda x: x.date.isoformat()+" "+x.trade_type+" "+x.asset.ticker_symbol+" "+str(x.number), self._inv_orders.getElements(SortEnum.DATE))))
         print(self.investment_dict)
-        print(list(map(lambda x: x.ticker_symbol+" "+x.short_name, self.current_assets)))
+        print(list(map(lambda x: x.ticker_symbol+" "+x.short_name, self.current_assets.values())))
         print(self.ticker_symbols)
         print(self.ticker_shares_dict)
 
@@ -1019,7 +1573,7 @@ class Backend:
         generator for all investments that met the requirements of the investment filter
         :return: Generator<object<Investment>>
         """
-        for inv in self.investments:
+        for inv in self._getSorted(self.investments, self.sortCriteriaInv):
             if self.isInvestmentFilter(inv):
                 yield inv
 
@@ -1034,19 +1588,19 @@ class Backend:
             return False
         if type(self.investmentFilter.minCashflow) != bool:
             #filter set
-            if not(abs(self.investmentFilter.minCashflow) <= abs(investment.price)):
+            if not(abs(self.investmentFilter.minCashflow) <= abs(investment.price_cents)):
                 return False
         if type(self.investmentFilter.maxCashflow) != bool:
             #filter set
-            if not(abs(self.investmentFilter.maxCashflow) >= abs(investment.price)):
+            if not(abs(self.investmentFilter.maxCashflow) >= abs(investment.price_cents)):
                 return False
         if type(self.investmentFilter.minCashflowPerProduct) != bool:
             #filter set
-            if not(abs(self.investmentFilter.minCashflowPerProduct) <= abs(investment.price_per_asset)):
+            if not(abs(utils.fromCents(self.investmentFilter.minCashflowPerProduct)) <= abs(investment.price_per_asset)):
                 return False
         if type(self.investmentFilter.maxCashflowPerProduct) != bool:
             #filter set
-            if not(abs(self.investmentFilter.maxCashflowPerProduct) >= abs(investment.price_per_asset)):
+            if not(abs(utils.fromCents(self.investmentFilter.maxCashflowPerProduct)) >= abs(investment.price_per_asset)):
                 return False
         if not(investment.asset.short_name.lower() in map(lambda x: x.lower(), self.investmentFilter.assets)) and \
                                 self.investmentFilter.assets != []:
@@ -1064,7 +1618,6 @@ class Backend:
 
     @Dbenchmark
     @Dsave
-    @DsortInv
     def addInvestment(self, investment:Investment):
         """
         takes in some data from the form 
@@ -1073,16 +1626,24 @@ class Backend:
         :return: bool<success?>
         """
         assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
-        self.investments.append(investment)    #adds the investment
+        self._assignId(investment)
+        self._inv_orders.insert(investment)    #adds the investment
         self.investment_dict[investment] = True    #adds the investment to the map
+        self._investment_ids[investment.id] = investment
+        self._ledger.insert(investment)
+        self._lots.insert(investment)
+        self._updateTicker(investment.asset.ticker_symbol)
     
-    def getInvestmentObject(self, data:list[str, str, float, float, float, float]):
+    def getInvestmentObject(self, data:list[str, str, float, float, float, float], replaced:Investment=None):
         """
         takes in some data from the form 
         validates them first and returns the investment object if not error occurred
+        if an investment gets replaced, its asset is reused for the same ticker and the shares are validated by replaceInvestment
         :param data: list[datetime.date<date of the transaction>, str<trade_type>, str<ticker>, float<number>, float<ppa>, float<tradingfee>, float<tax>]
+        :param replaced: object<Investment> that gets replaced by the new one or None if its added
         :return: object<Investment> or bool<False if the data is not valid>
         """
+        assert(type(replaced) == Investment or replaced == None), STRINGS.getTypeErrorString(replaced, "replaced", Investment)
         assert(len(data) == 7), STRINGS.ERROR_WRONG_DATA_LENGTH+str(data)
         date, trade_type, ticker_symbol, number, ppa, tradingfee, tax = data
         ticker_symbol = ticker_symbol.lower()
@@ -1103,60 +1664,44 @@ class Backend:
             #data out of range
             self.error_string = "some of the following rules are broken:\nnumber of assets <= 0 \nprice per asset <= 0\n tradingfee < 0\ntax < 0"
             return False
+        if replaced != None and replaced.asset.ticker_symbol == ticker_symbol:
+            #the ticker is already known, so the api is not needed
+            inv_obj = Investment(trade_type, date, replaced.asset, number, ppa, tradingfee, tax)
+            if inv_obj in self.investment_dict and inv_obj != replaced:
+                #the user tries to add the same investment twice
+                self.error_string = "This investment is already added"
+                return False
+            return inv_obj
         
-        #gets the ticker object from the api
-        #sets up a variable that should store the Ticker object
-        self.ticker_obj = False
-        #calling the loadTicker method on a new thread to avoid hanging program
-        thread = Thread(target=self._loadTicker, args=[ticker_symbol])  
-        thread.start()
-        #if no ticker is got after a given timeout the program returns with a connection error
-        thread.join(self.timeout_time)
-        ticker_obj:yahooquery.Ticker = self.ticker_obj    
-        if ticker_obj == False:
-            #could not load the ticker object, because its still false
-            self.error_string = f"ticker could not be loaded, because of network error or api errors.\nPlease try again later"
-            return False
-        try:
-            ticker_obj.quote_type[ticker_symbol]
-        except:
-            #ticker was loaded but not valid (there are no information about this ticker)
-            self.error_string = f"no data to the ticker with the symbol {ticker_symbol} could be found.\nCauses can be:\nThere was a network error\nThe api of yahoo finance has some errors or is not reachable at the moment\nThe provided ticker does not exist"
-            return False
-        try:
-            short_name = ticker_obj.quote_type[ticker_symbol]["shortName"]
-            cur = ticker_obj.price[ticker_symbol]["currency"]
-        except:
-            #there are still not enough informations to work with
-            self.error_string = f"the ticker symbol exists but has no name and currency data"
+        metadata = self._getTickerMetadata(ticker_symbol)
+        if metadata == False:
             return False
+        short_name = metadata.short_name
+        cur = metadata.currency
         if cur != STRINGS.CURRENCY_STRING:
             #the ticker selected by the user has a different currency than the set currency of the program (that is invalid)
             self.error_string = f"the ticker you provided is not in your currency.\nYour currency: {STRINGS.CURRENCY_STRING}, asset currency: {cur}\nPlease provide the ticker with your currency"
             return False
         
-        asset = Asset(ticker_symbol, short_name)    #creates the asset object
+        asset = self._getAsset(ticker_symbol, short_name)    #gets the shared asset object
         inv_obj = Investment(trade_type, date, asset, number, ppa, tradingfee, tax) #create the investment object
         if inv_obj in self.investment_dict:
             #the user tries to add the same investment twice
             self.error_string = "This investment is already added"
             return False
-        self.investments.append(inv_obj)    #adds the investment
-        self.investment_dict[inv_obj] = True    #adds the investment to the map
-
-        success = self._update()
-        self.investments.remove(inv_obj)    #removes the data again
-        self.investment_dict.pop(inv_obj)
-        if success:
-            #investment valid
+        if replaced != None:
+            #the shares are validated together with the removal of the replaced investment
             return inv_obj
-        else:
+        #only the trades of this ticker from the date of the new investment forward are checked
+        error = self._ledger.getInsertError(inv_obj)
+        if error != None:
             #some error occured
-            self.error_string = "The investment was not added.\nFollowing error occured:\n"+self.error_string
+            self.error_string = "The investment was not added.\nFollowing error occured:\n"+error
             return False
+        #investment valid
+        return inv_obj
     
     @Dsave
-    @DsortInv
     def deleteInvestment(self, investment:Investment):
         """
         deletes a given investment from the system
@@ -1164,75 +1709,107 @@ class Backend:
         :return: bool<success?>
         """
         assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
-        assert(investment in self.investments), STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(investment)+str(self.investments)
-        self.investments.remove(investment)
-        self.investment_dict.pop(investment)
-        success = self._update()
-        if success == False:
-            self.investments.append(investment)
-            self.investment_dict[investment] = True
-        return success
+        assert(self._investment_ids.get(investment.id) is investment), STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(investment)
+        error = self._ledger.getDeleteError(investment)
+        if error != None:
+            #the later trades of this ticker need the shares of this investment
+            self.error_string = error
+            return False
+        self._inv_orders.remove(investment)
+        #older data files can contain equal investments, that share one entry
+        self.investment_dict.pop(investment, None)
+        self._investment_ids.pop(investment.id)
+        self._ledger.delete(investment)
+        self._lots.delete(investment)
+        self._updateTicker(investment.asset.ticker_symbol)
+        return True
 
-    @Dbenchmark
-    def _update(self):
+    @Dsave
+    def replaceInvestment(self, old_investment:Investment, new_investment:Investment):
         """
-        this method should be called after a new investment is added
-        the program iterates over all investments sorted by date and validates them
-        if no error occured the class variables are overritten
+        replaces an investment with a new one at once, pls get the new one with getInvestmentObject(data, old_investment) first
+        the shares are validated once for the whole replacement
+        :param old_investment: object<Investment> that is in the system
+        :param new_investment: object<Investment> that replaces it
         :return: bool<success?>
         """
-        #creates the temp variables
-        tcurrent_assets = []
-        tticker_shares_dict = {}
-        self.sortInvestments(SortEnum.DATE, False)  #sorts the investments (after that we should sort it back)
-        for inv in self.investments:
-            match inv.trade_type:
-                case "buy":
-                    if inv.asset.ticker_symbol in tticker_shares_dict:
-                        #user buys an asset that is already in the portfolio
-                        tticker_shares_dict[inv.asset.ticker_symbol] += inv.number
-                    else:
-                        #user buys an asset that is not in the portfolio
-                        tticker_shares_dict[inv.asset.ticker_symbol] = inv.number
-                case "sell":
-                    if inv.asset.ticker_symbol in tticker_shares_dict:
-                        #user sells a asset that is already in the portfolio (should check on negative shares)
-                        tticker_shares_dict[inv.asset.ticker_symbol] -= inv.number
-                    else:
-                        #the user is trying to sell shares, but there are no currently hold
-                        self.error_string = f"you have no shares of this asset.\nYou cannot sell shares"
-                        return False
-                case "dividend":
-                    if inv.asset.ticker_symbol in tticker_shares_dict:
-                        #user gets a dividend from an asset that is in the portfolio
-                        if tticker_shares_dict[inv.asset.ticker_symbol] - inv.number < 0:
-                            #the user is trying to get a dividend from more shares than currently hold
-                            self.error_string = f"you only have {tticker_shares_dict[inv.asset.ticker_symbol]} shares of this asset.\nYou cannot get dividend from {inv.number} shares"
-                            return False
-                    else:
-                        #the user is trying to get a dividend from this asset, but there is no share currently hold
-                        self.error_string = f"you have no shares of this asset.\nYou cannot get dividend from this asset"
-                        return False
-            if tticker_shares_dict[inv.asset.ticker_symbol] < 0:
-                #the user is trying to sell more shares than currently hold
-                self.error_string = f"you only have {tticker_shares_dict[inv.asset.ticker_symbol] + inv.number} shares of this asset.\nYou cannot sell {inv.number} shares"
-                return False
-            elif tticker_shares_dict[inv.asset.ticker_symbol] > 0:
-                #the user is now holding this asset
-                if not hash(inv.asset) in map(lambda x: hash(x), tcurrent_assets):
-                    #add it to the current assets if its not already added
-                    tcurrent_assets.append(inv.asset)
-            else:
-                if hash(inv.asset) in map(lambda x: hash(x), tcurrent_assets):
-                    #remove the asset from the current assets, because the user no longer holds this asset
-                    tcurrent_assets.pop(list(map(lambda x: hash(x), tcurrent_assets)).index(hash(inv.asset)))
-            #saves the ticker
-            self.ticker_symbols[inv.asset.ticker_symbol] = True
-        #update succeeded
-        #load the data into the class
-        self.current_assets = tcurrent_assets
-        self.ticker_shares_dict = tticker_shares_dict
-        return True    
+        assert(type(old_investment) == Investment), STRINGS.getTypeErrorString(old_investment, "old_investment", Investment)
+        assert(type(new_investment) == Investment), STRINGS.getTypeErrorString(new_investment, "new_investment", Investment)
+        assert(self._investment_ids.get(old_investment.id) is old_investment), STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(old_investment)
+        error = self._ledger.getReplaceError(old_investment, new_investment)
+        if error != None:
+            self.error_string = "The investment was not changed.\nFollowing error occured:\n"+error
+            return False
+        self._inv_orders.remove(old_investment)
+        self.investment_dict.pop(old_investment, None)
+        new_investment.id = old_investment.id
+        self._inv_orders.insert(new_investment)
+        self.investment_dict[new_investment] = True
+        self._investment_ids[new_investment.id] = new_investment
+        self._ledger.replace(old_investment, new_investment)
+        self._lots.delete(old_investment)
+        self._lots.insert(new_investment)
+        self._updateTicker(old_investment.asset.ticker_symbol)
+        self._updateTicker(new_investment.asset.ticker_symbol)
+        return True
+
+    def _updateTicker(self, ticker_symbol:str):
+        """
+        updates the current assets and shares of a ticker from the ledger
+        should be called after an investment of this ticker is added or deleted
+        :param ticker_symbol: str<ticker symbol>
+        :return: void
+        """
+        self._returns.invalidate(ticker_symbol)
+        shares = self._ledger.getShares(ticker_symbol)
+        if shares == None:
+            #there is no investment of this ticker left
+            self.ticker_shares_dict.pop(ticker_symbol, None)
+            self.current_assets.pop(ticker_symbol, None)
+            return
+        self.ticker_shares_dict[ticker_symbol] = shares
+        if shares > 0:
+            #the user is holding this asset
+            self.current_assets[ticker_symbol] = self._ledger.getAsset(ticker_symbol)
+        else:
+            self.current_assets.pop(ticker_symbol, None)
+        #saves the ticker
+        self.ticker_symbols[ticker_symbol] = True
+
+    def _getAsset(self, ticker_symbol:str, short_name:str):
+        """
+        getter for the shared asset object of a ticker, it is created if there is none yet
+        :param ticker_symbol: str<symbol of the yahoo ticker>
+        :param short_name: str<short name of the asset>
+        :return: object<Asset>
+        """
+        key = (ticker_symbol.lower(), short_name)
+        if not key in self._asset_index:
+            self._asset_index[key] = Asset(ticker_symbol, short_name)
+        return self._asset_index[key]
+
+    def _internAssets(self):
+        """
+        lets all investments with the same ticker symbol and short name share one asset object
+        older data files contain a new asset object for every investment
+        :return: void
+        """
+        self._asset_index = {}
+        for investment in self.investments:
+            investment.asset = self._asset_index.setdefault((investment.asset.ticker_symbol, investment.asset.short_name), investment.asset)
+
+    def _rebuildLedger(self):
+        """
+        builds the ledger and the current assets and shares from all investments
+        :return: void
+        """
+        self._ledger.rebuild(self.investments)
+        self._lots.rebuild(self.investments)
+        self._returns.invalidate()
+        self.current_assets = {}
+        self.ticker_shares_dict = {}
+        for ticker_symbol in self._ledger.getTickers():
+            self._updateTicker(ticker_symbol)
     
     @Dsave
     def _reset(self):
@@ -1241,16 +1818,50 @@ class Backend:
         THIS WILL DELETE ALL INVESTMENT DATA
         :return: void
         """
-        self.investments:list[Investment] = []       #saves all investment objects
-        self.current_assets:list[Asset] = []    #saves all current assets hold by the user
+        self._inv_orders.reset([])
+        self.investments:list[Investment] = self._inv_orders.getElements()  #saves all investment objects
+        self.investment_dict:dict[Investment, True] = {}     #saves all investment object in a hash map
+        self._investment_ids:dict[int, Investment] = {}     #the investment of each id
+        self._ledger = PositionLedger()     #holds the running number of shares of each ticker to validate the investments
+        self._lots = LotEngine(LotMethod.FIFO)     #matches the sold shares to the bought shares
+        self._returns = ReturnCalculator(lambda ticker_symbol: self._lots.getTrades(ticker_symbol))    #caches the cashflows of each ticker
+        self.current_assets:dict[str, Asset] = {}    #saves all current assets hold by the user per ticker
+        self._asset_index:dict[tuple[str, str], Asset] = {}  #the one asset object per ticker symbol and short name, that all investments share
         self.ticker_symbols:dict[str, True] = {}           #a list of tickers used by the user (we can import some tickers here)
         self.ticker_shares_dict:dict[str, float] = {}             #saves the current number of shares that the user is holding per asset
-    @Dbenchmark
-    def _loadTicker(self, ticker_symbol:str):
+
+    def _getTickerMetadata(self, ticker_symbol:str):
         """
-        extern method for loading the ticker on an other thread
-        :param ticker_symbol: str<symbol of the ticker you wanna load>
-        :return: void
+        gets the metadata of a ticker from the ticker cache or the api if there is no fresh entry
+        if the api cannot be reached, an entry older than its time to live is used
+        :param ticker_symbol: str<ticker symbol in lower case>
+        :return: object<TickerMetadata> or bool<False if no data could be got>
         """
-        self.ticker_obj = yahooquery.Ticker(ticker_symbol)
-        return
+        metadata = self._ticker_cache.get(ticker_symbol)
+        if metadata != None:
+            #repeated trades of known assets need no api call
+            return metadata
+        stale_metadata = self._ticker_cache.get(ticker_symbol, stale=True)
+        #the provider loads the data on its own thread, if no data is got after a given timeout the program returns with a connection error
+        future = self.quote_provider.submitMetadata([ticker_symbol])
+        try:
+            loaded = future.result(self.timeout_time)
+        except Exception:
+            #could not load the ticker, because of a timeout or an error of the api
+            future.cancel()
+            if stale_metadata != None:
+                #offline, the last known data is used
+                return stale_metadata
+            self.error_string = f"ticker could not be loaded, because of network error or api errors.\nPlease try again later"
+            return False
+        if not ticker_symbol in loaded:
+            #ticker was loaded but not valid (there are no name and currency information about this ticker)
+            if stale_metadata != None:
+                #the api has some errors, the last known data is used
+                return stale_metadata
+            self.error_string = f"no data to the ticker with the symbol {ticker_symbol} could be found.\nCauses can be:\nThere was a network error\nThe api of yahoo finance has some errors or is not reachable at the moment\nThe provided ticker does not exist"
+            return False
+        metadata = loaded[ticker_symbol]
+        self._ticker_cache.set(ticker_symbol, metadata)
+        self._saver.markDirty()     #the save worker writes the ticker cache
+        return metadata
@@ -1,22 +1,59 @@
 """
 this module is providing the datatypes that are used by the backend
+the datatypes use slots instead of a dict per object, because there can be millions of them
+money amounts are stored as integer minor units (cents), the float attributes are only converted from them
 """
 import datetime
+from itertools import chain
+import numpy
 from strings import ENG as STRINGS
+from fullstack_utils import utils
 
 
-class Person:
+class SlottedDatatype:
+    """
+    base class of the datatypes, it pickles the slots as a dict
+    so the data that was saved before the datatypes had slots can still be loaded, slots that are not in the data are None
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        """
+        gets the values of all slots for pickle, slots starting with "_" are caches and are computed again while loading
+        :return: dict<str<slot name>: any<value>>
+        """
+        return {name: getattr(self, name) for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ()) if not name.startswith("_") and hasattr(self, name)}
+
+    def __setstate__(self, state):
+        """
+        sets the values of all slots from pickle
+        :param state: dict<str<slot name>: any<value>> or tuple<None, dict<str<slot name>: any<value>>> of the default slot pickling
+        :return: void
+        """
+        if type(state) == tuple:
+            state = {**(state[0] or {}), **state[1]}
+        for name in (name for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ())):
+            setattr(self, name, None)
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class Person(SlottedDatatype):
     """
     person class holds a name and a person category that you can set
     """
-    def __init__(self, name:str, person_categories:list[str]=[]):
+    __slots__ = ("name", "person_categories")
+
+    def __init__(self, name:str, person_categories:list[str]=None):
         """
         basic constructor
         saves the arguments in the object
         :param name: str<name of the person>
-        :param person_categories: list<str<person category1>, ...>
+        :param person_categories: list<str<person category1>, ...> or None for no categories
         :return: void
         """
+        #each person needs its own list, because categories are added to it
+        person_categories = [] if person_categories == None else person_categories
         assert(type(name) == str), STRINGS.getTypeErrorString(name, "name", str)
         assert(type(person_categories) == list and all(map(lambda x: type(x) == str, person_categories))), STRINGS.getListTypeErrorString(person_categories, "person_categories", str)
         self.name = name
@@ -32,31 +69,37 @@ class Person:
         self.person_categories.append(person_category)
 
 
-class Product:
+class Product(SlottedDatatype):
     """
     a product contains a product name and a list of categories.
     categories are used to filter the products and for statistics
     """
-    def __init__(self, product_name:str, categories:list[str]=[]):
+    __slots__ = ("name", "categories")
+
+    def __init__(self, product_name:str, categories:list[str]=None):
         """
         basic constructor
         saves the arguments to that object
         :param product_name: str<name of the product>
-        :param categories: list<str<product category1>, ... >
+        :param categories: list<str<product category1>, ... > or None for no categories
         :return: void
         """
+        #each product needs its own list, because the categories of a product are changed in place
+        categories = [] if categories == None else categories
         assert(type(product_name) == str), STRINGS.getTypeErrorString(product_name, "product_name", str)
         assert(type(categories) == list and all(map(lambda x: type(x) == str, categories))), STRINGS.getListTypeErrorString(categories, "categories", str)
         self.name = product_name
         self.categories = categories
 
 
-class Transaction:
+class Transaction(SlottedDatatype):
     """
     a transaction contains a date, product, number of products, the cashflow of the transaction and 
     two lists with persons that are involved into the transaction
     the from/to persons are the persons who made the transaction with you and the why persons are the persons who are the reason for this transaction
     """
+    __slots__ = ("id", "date", "number", "product", "cashflow_cents", "cashflow_per_product_cents", "from_to_persons", "why_persons")
+
     def __init__(self, date:datetime.date, product:Product, number:int, cashflow:float, from_to_persons:list[Person], why_persons:list[Person]):
         """
         basic constructor
@@ -75,13 +118,90 @@ class Transaction:
         assert(type(cashflow) == float), STRINGS.getTypeErrorString(cashflow, "cashflow", float)
         assert(type(from_to_persons) == list and all(map(lambda x: type(x) == Person, from_to_persons))), STRINGS.getListTypeErrorString(from_to_persons, "from_to_persons", Person)
         assert(type(why_persons) == list and all(map(lambda x: type(x) == Person, why_persons))), STRINGS.getListTypeErrorString(why_persons, "why_persons", Person)
+        self.id = None      #unique id, that is set by the backend if the transaction is added
         self.date = date
         self.number = number
         self.product = product
-        self.cashflow = round(cashflow, 2)
-        self.cashflow_per_product = round(self.cashflow / self.number, 2)
+        self.cashflow = cashflow
         self.from_to_persons = from_to_persons
         self.why_persons = why_persons
+
+    @classmethod
+    def fromColumns(cls, dates:list[datetime.date], products:list[Product], numbers:numpy.ndarray, cashflows_cents:numpy.ndarray,
+                    from_to_persons:list[list[Person]], why_persons:list[list[Person]]):
+        """
+        builds many transactions at once, used by the import
+        each column is validated once as a whole, so the objects are created without the checks of the constructor
+        :param dates: list<datetime.date<date of the transaction>>
+        :param products: list<object<Product>>
+        :param numbers: numpy.ndarray<int number of products>
+        :param cashflows_cents: numpy.ndarray<int cashflow in minor units (cents) from your sight>
+        :param from_to_persons: list<list<object<from/to person>>>
+        :param why_persons: list<list<object<why person>>>
+        :return: list<object<Transaction>> in the order of the columns
+        """
+        numbers = numpy.asarray(numbers)
+        cashflows_cents = numpy.asarray(cashflows_cents)
+        assert(len(dates) == len(products) == len(numbers) == len(cashflows_cents) == len(from_to_persons) == len(why_persons)), STRINGS.ERROR_WRONG_DATA_LENGTH+str(len(dates))
+        assert(set(map(type, dates)) <= {datetime.date}), STRINGS.getListTypeErrorString(dates, "dates", datetime.date)
+        assert(set(map(type, products)) <= {Product}), STRINGS.getListTypeErrorString(products, "products", Product)
+        assert(len(numbers) == 0 or numbers.dtype.kind == "i"), STRINGS.getTypeErrorString(numbers, "numbers", "int array")
+        assert(len(cashflows_cents) == 0 or cashflows_cents.dtype.kind == "i"), STRINGS.getTypeErrorString(cashflows_cents, "cashflows_cents", "int array")
+        assert(numpy.all(numbers > 0)), STRINGS.ERROR_NUMBER_ZERO_OR_LESS+str(numbers.min(initial=0))
+        for persons, name in ((from_to_persons, "from_to_persons"), (why_persons, "why_persons")):
+            assert(set(map(type, persons)) <= {list} and set(map(type, chain.from_iterable(persons))) <= {Person}), STRINGS.getListTypeErrorString(persons, name, Person)
+        #the cashflows per product are computed for the whole column, they are rounded like in the constructor
+        per_product = numpy.round(cashflows_cents / numbers).astype(numpy.int64) if len(numbers) > 0 else numbers
+        transactions = []
+        for date, product, number, cashflow_cents, cashflow_per_product_cents, ftpersons, whypersons in zip(dates, products, numbers.tolist(),
+                cashflows_cents.tolist(), per_product.tolist(), from_to_persons, why_persons):
+            transaction = cls.__new__(cls)
+            transaction.id = None
+            transaction.date = date
+            transaction.number = number
+            transaction.product = product
+            transaction.cashflow_cents = cashflow_cents
+            transaction.cashflow_per_product_cents = cashflow_per_product_cents
+            transaction.from_to_persons = ftpersons
+            transaction.why_persons = whypersons
+            transactions.append(transaction)
+        return transactions
+
+    @property
+    def cashflow(self):
+        """
+        getter for the cashflow in currency units
+        :return: float<cashflow>
+        """
+        return utils.fromCents(self.cashflow_cents)
+
+    @cashflow.setter
+    def cashflow(self, cashflow:float):
+        """
+        setter for the cashflow, its rounded to minor units and the cashflow per product is computed from it
+        older data files set the cashflow like this too
+        :param cashflow: float<cashflow in currency units>
+        :return: void
+        """
+        self.cashflow_cents = utils.toCents(cashflow)
+        self.cashflow_per_product_cents = round(self.cashflow_cents / self.number)
+
+    @property
+    def cashflow_per_product(self):
+        """
+        getter for the cashflow per product in currency units
+        :return: float<cashflow per product>
+        """
+        return utils.fromCents(self.cashflow_per_product_cents)
+
+    @cashflow_per_product.setter
+    def cashflow_per_product(self, cashflow_per_product:float):
+        """
+        setter for the cashflow per product, only used by older data files
+        :param cashflow_per_product: float<cashflow per product in currency units>
+        :return: void
+        """
+        self.cashflow_per_product_cents = utils.toCents(cashflow_per_product)
     
     def getFtPersonNames(self):
         """
@@ -122,10 +242,13 @@ class Transaction:
             return list(map(lambda x: x.name.lower(), self.why_persons))
 
 
-class Asset:
+class Asset(SlottedDatatype):
     """
     an asset contains a ticker_symbol and a short name that are gotten from the yahoo finance api
+    the backend uses one asset object for all investments with the same ticker symbol and short name
     """
+    __slots__ = ("ticker_symbol", "short_name")
+
     def __init__(self, ticker_symbol:str, short_name:str) -> None:
         """
         basic constructor
@@ -147,11 +270,13 @@ class Asset:
         return hash(self.ticker_symbol+self.short_name)
 
 
-class Investment:
+class Investment(SlottedDatatype):
     """
     an investment contains a trade_type which is "buy", "sell" or "dividend", date, asset object, number of assets,
     price per asset, tradingfee and tax
     """
+    __slots__ = ("id", "trade_type", "date", "number", "asset", "price_per_asset", "price_cents", "tradingfee_cents", "tax_cents", "_hash")
+
     def __init__(self, trade_type:str, date:datetime.date, asset:Asset, number:float, price_per_asset:float, tradingfee:float, tax:float):
         """
         basic constructor
@@ -178,6 +303,7 @@ class Investment:
         assert(price_per_asset > 0), STRINGS.ERROR_PRICE_ZERO_OR_LESS+str(price_per_asset)
         assert(tradingfee >= 0), STRINGS.ERROR_TRADINGFEE_LESS_ZERO+str(tradingfee)
         assert(tax >= 0), STRINGS.ERROR_TAX_LESS_ZERO+str(tax)
+        self.id = None      #unique id, that is set by the backend if the investment is added
         self.trade_type = trade_type
         self.date = date
         self.number = number
@@ -186,11 +312,95 @@ class Investment:
         self.price = price_per_asset * number
         self.tradingfee = tradingfee
         self.tax = tax
+        self._setKey()
+
+    def _getKey(self) -> tuple:
+        """
+        the content key of the investment, the id is not part of the key, two investments with the same values are equal
+        :return: tuple<values of the investment>
+        """
+        return (self.trade_type, self.date, self.asset.ticker_symbol, self.asset.short_name, self.number, self.price_per_asset, self.tradingfee_cents, self.tax_cents)
+
+    def _setKey(self):
+        """
+        computes the hash of the content key once, the values of the investment must not be changed afterwards
+        only the hash is stored, the key itself is built again for a comparison to keep the rows small
+        :return: void
+        """
+        self._hash = hash(self._getKey())
+
+    def __setstate__(self, state):
+        """
+        sets the values of all slots from pickle and computes the hash of the content key again
+        :param state: dict<str<slot name>: any<value>> or tuple<None, dict<str<slot name>: any<value>>> of the default slot pickling
+        :return: void
+        """
+        super().__setstate__(state)
+        self._setKey()
+
+    @property
+    def price(self):
+        """
+        getter for the price of all traded shares in currency units
+        :return: float<price>
+        """
+        return utils.fromCents(self.price_cents)
+
+    @price.setter
+    def price(self, price:float):
+        """
+        setter for the price of all traded shares, its rounded to minor units
+        :param price: float<price in currency units>
+        :return: void
+        """
+        self.price_cents = utils.toCents(price)
+
+    @property
+    def tradingfee(self):
+        """
+        getter for the tradingfee in currency units
+        :return: float<tradingfee>
+        """
+        return utils.fromCents(self.tradingfee_cents)
+
+    @tradingfee.setter
+    def tradingfee(self, tradingfee:float):
+        """
+        setter for the tradingfee, its rounded to minor units
+        :param tradingfee: float<tradingfee in currency units>
+        :return: void
+        """
+        self.tradingfee_cents = utils.toCents(tradingfee)
+
+    @property
+    def tax(self):
+        """
+        getter for the taxes in currency units
+        :return: float<taxes>
+        """
+        return utils.fromCents(self.tax_cents)
+
+    @tax.setter
+    def tax(self, tax:float):
+        """
+        setter for the taxes, its rounded to minor units
+        :param tax: float<taxes in currency units>
+        :return: void
+        """
+        self.tax_cents = utils.toCents(tax)
 
     def __hash__(self) -> int:
         """
         we can compare two investments in a hash map
         if they have the same values stored, they are the same
         """
-        return hash(self.trade_type+self.date.isoformat()+str(hash(self.asset))+str(self.number)+str(self.price_per_asset)+str(self.tradingfee)+str(self.tax))
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """
+        two investments are equal if they have the same values stored
+        """
+        if type(other) != Investment:
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self._getKey() == other._getKey())
     
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+this module provides the journal and the save worker that are used by the backend to persist its data
+instead of rewriting the whole data file after every change, each mutation is appended as a small encrypted record
+the records are replayed on top of the last snapshot if the data is loaded
+"""
+import os
+import time
+import pickle
+from threading import Thread, Lock, Condition
+from cryptography.fernet import Fernet
+from strings import ENG as STRINGS
+
+
+def writeFileAtomic(path:str, data:bytes):
+    """
+    writes the data into a temporary file and renames it afterwards
+    that way the file is either completely old or completely new, even if the program crashes while writing
+    :param path: str<path of the file>
+    :param data: bytes<new content of the file>
+    :return: void
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as tmp_file:
+        tmp_file.write(data)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+    os.replace(tmp_path, path)
+
+
+class Journal:
+    """
+    the journal class holds an append only file of encrypted mutation records
+    every record gets a sequence number, the snapshot stores the last sequence number it contains,
+    so records that are already part of the snapshot are skipped while replaying
+    new records are only kept in memory until the save worker writes them
+    """
+    def __init__(self, path:str):
+        """
+        basic constructor is setting up an empty journal for the given file
+        :param path: str<path of the journal file>
+        :return: void
+        """
+        assert(type(path) == str), STRINGS.getTypeErrorString(path, "path", str)
+        self.path = path
+        self.seq = 0            #sequence number of the last recorded mutation
+        self.count = 0          #number of records that are currently in the journal file
+        self._pending = []      #records that are not written yet
+        self._lock = Lock()     #protects the pending records
+        self._key = None
+
+    def setKey(self, key:bytes):
+        """
+        setter for the key that is used to encrypt and decrypt the records
+        :param key: bytes<fernet key>
+        :return: void
+        """
+        assert(type(key) == bytes), STRINGS.getTypeErrorString(key, "key", bytes)
+        self._key = key
+
+    def record(self, name:str, args:tuple):
+        """
+        adds a new mutation record, that gets written with the next call of writePending
+        :param name: str<name of the mutating backend method>
+        :param args: tuple<picklable arguments that are needed to replay the mutation>
+        :return: void
+        """
+        assert(type(name) == str), STRINGS.getTypeErrorString(name, "name", str)
+        with self._lock:
+            self.seq += 1
+            self._pending.append(pickle.dumps((self.seq, name, args)))
+
+    def hasPending(self):
+        """
+        checks whether there are records, that are not written yet
+        :return: bool<records pending?>
+        """
+        return self._pending != []
+
+    def writePending(self):
+        """
+        appends all pending records to the journal file with a single write
+        if the write fails, the records stay pending and the error is raised
+        :return: int<number of records in the journal file>
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+        if pending:
+            fernet = Fernet(self._key)
+            #a fernet token is url safe base64, so we can use a newline to separate the records
+            data = b"".join(fernet.encrypt(record) + b"\n" for record in pending)
+            try:
+                with open(self.path, "ab") as journal_file:
+                    size = journal_file.tell()
+                    try:
+                        journal_file.write(data)
+                        journal_file.flush()
+                    except:
+                        #a partially written record would end the replay, so the file is cut back
+                        journal_file.truncate(size)
+                        raise
+            except:
+                #the records are written with the next call, before the newer ones
+                with self._lock:
+                    self._pending = pending + self._pending
+                raise
+            self.count += len(pending)
+        return self.count
+
+    def read(self, snapshot_seq:int):
+        """
+        generator for all records that are newer than the snapshot
+        a record that cannot be read (for example partially written during a crash) ends the replay
+        :param snapshot_seq: int<last sequence number that is contained in the snapshot>
+        :return: Generator<tuple<str<name>, tuple<args>>>
+        """
+        assert(type(snapshot_seq) == int), STRINGS.getTypeErrorString(snapshot_seq, "snapshot_seq", int)
+        self.seq = max(self.seq, snapshot_seq)
+        try:
+            journal_file = open(self.path, "rb")
+        except FileNotFoundError:
+            #nothing was changed since the last snapshot
+            return
+        with journal_file:
+            lines = journal_file.read().splitlines()
+        fernet = Fernet(self._key)
+        for line in lines:
+            try:
+                seq, name, args = pickle.loads(fernet.decrypt(line))
+            except:
+                print("Some error occured with a journal record, stop replaying")
+                return
+            self.count += 1
+            if seq <= snapshot_seq:
+                #already part of the snapshot
+                continue
+            self.seq = seq
+            yield name, args
+
+    def truncate(self):
+        """
+        empties the journal file, should only be called after a snapshot with all written records was saved
+        pending records are kept, because they get written after the snapshot
+        :return: void
+        """
+        open(self.path, "wb").close()
+        self.count = 0
+
+
+class SaveWorker:
+    """
+    the save worker is the only thread that writes the data files
+    mutations just mark the worker as dirty, the worker waits until no change happened for a debounce window
+    and saves all changes of that burst at once
+    """
+    def __init__(self, save_func:callable, debounce:float, max_delay:float, retry_backoff:float, max_retry_backoff:float):
+        """
+        basic constructor is starting the worker thread
+        :param save_func: function<writes all changes, gets called on the worker thread>
+        :param debounce: float<seconds without changes that the worker waits before saving>
+        :param max_delay: float<maximum seconds a change waits to be saved during a long burst>
+        :param retry_backoff: float<seconds to wait before the first retry of a failed save, doubled for every further retry>
+        :param max_retry_backoff: float<maximum seconds between two retries>
+        :return: void
+        """
+        assert(callable(save_func)), STRINGS.getTypeErrorString(save_func, "save_func", "function")
+        assert(type(debounce) == float), STRINGS.getTypeErrorString(debounce, "debounce", float)
+        assert(type(max_delay) == float), STRINGS.getTypeErrorString(max_delay, "max_delay", float)
+        assert(type(retry_backoff) == float), STRINGS.getTypeErrorString(retry_backoff, "retry_backoff", float)
+        assert(type(max_retry_backoff) == float), STRINGS.getTypeErrorString(max_retry_backoff, "max_retry_backoff", float)
+        self.save_func = save_func
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self._dirty = False         #there are changes that are not saved yet
+        self._saving = False        #the worker is currently saving
+        self._urgent = False        #someone waits in flush, dont wait for the debounce window
+        self._first_change = 0.0    #time of the first unsaved change
+        self._last_change = 0.0     #time of the last unsaved change
+        self._saves = 0             #number of finished save attempts
+        self._error:Exception = None    #error of the last save attempt or None if it succeeded
+        self._failures = 0          #failed save attempts in a row
+        self._retry_time = 0.0      #time of the next attempt after a failed one
+        self._condition = Condition()
+        Thread(target=self._run, daemon=True).start()
+
+    def markDirty(self):
+        """
+        tells the worker that there are new changes to save
+        :return: void
+        """
+        with self._condition:
+            now = time.monotonic()
+            if not self._dirty:
+                self._first_change = now
+            self._dirty = True
+            self._last_change = now
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        saves all changes immediately and blocks until they are written
+        should be called on shutdown
+        if the save fails, the changes stay dirty (the worker keeps retrying) and the error is raised
+        :return: void
+        """
+        with self._condition:
+            self._urgent = True
+            self._condition.notify_all()
+            saves = self._saves
+            try:
+                while self._dirty or self._saving:
+                    if self._error != None and self._saves > saves:
+                        raise self._error
+                    self._condition.wait()
+            finally:
+                self._urgent = False
+
+    def _run(self):
+        """
+        the loop of the worker thread
+        :return: void
+        """
+        while True:
+            with self._condition:
+                while not self._dirty:
+                    self._condition.wait()
+                #wait until the burst of changes is over, after a failed save also wait for the backoff
+                while not self._urgent:
+                    now = time.monotonic()
+                    timeout = min(self._last_change + self.debounce, self._first_change + self.max_delay)
+                    if self._failures > 0:
+                        timeout = self._retry_time
+                    timeout -= now
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                self._dirty = False
+                self._saving = True
+            try:
+                self.save_func()
+                error = None
+            except Exception as e:
+                print("Some error occured while saving the data: "+str(e))
+                error = e
+            with self._condition:
+                self._saving = False
+                self._saves += 1
+                self._error = error
+                if error == None:
+                    self._failures = 0
+                else:
+                    #the changes are not saved, so the worker tries again after the backoff (even if someone waits in flush)
+                    self._dirty = True
+                    self._urgent = False
+                    self._retry_time = time.monotonic() + min(self.retry_backoff * 2**self._failures, self.max_retry_backoff)
+                    self._failures += 1
+                self._condition.notify_all()
@@ -0,0 +1,303 @@
+"""
+this module provides the position ledger that is used by the backend to validate the investments
+instead of replaying all investments after every change, the running share count of each ticker is kept in date order
+so a change only has to be checked for its ticker and from its date forward
+the running share counts are a prefix sum over the trades, so the shares at any date are found with bisect
+"""
+from bisect import bisect_left, bisect_right
+import datetime
+import numpy
+from strings import ENG as STRINGS
+from backend_datatypes import Investment
+
+
+class PositionLedger:
+    """
+    the position ledger holds the trades of each ticker sorted by date, trades on the same date keep the order they were added
+    for each trade the number of shares after the trade and the slack is stored
+    the slack is the number of shares that could be removed before the trade, without making it invalid
+    (the shares after a buy or sell must not be negative, a dividend needs at least its number of shares before it)
+    a buy or sell changes the shares and slacks of all later trades by the same amount,
+    so the trades are valid as long as the minimum slack is not negative
+    """
+    def __init__(self):
+        """
+        basic constructor is setting up an empty ledger
+        :return: void
+        """
+        #for each ticker symbol: (dates, trades, shares after each trade, slack of each trade)
+        self._tickers:dict[str, tuple[list, list[Investment], numpy.ndarray, numpy.ndarray]] = {}
+
+    def rebuild(self, investments:list[Investment]):
+        """
+        builds the ledger from scratch, the investments are not validated
+        :param investments: list<object<Investment>> in any order
+        :return: void
+        """
+        trades = {}
+        for investment in sorted(investments, key=lambda x: x.date):
+            trades.setdefault(investment.asset.ticker_symbol, []).append(investment)
+        self._tickers = {}
+        for ticker_symbol, ticker_trades in trades.items():
+            shares = numpy.cumsum([self._getEffect(trade) for trade in ticker_trades], dtype=numpy.float64)
+            slack = shares - [self._getNeed(trade) for trade in ticker_trades]
+            self._tickers[ticker_symbol] = ([trade.date for trade in ticker_trades], ticker_trades, shares, slack)
+
+    def getTickers(self):
+        """
+        getter for the ticker symbols that have at least one trade
+        :return: Iterable[str<ticker symbol>]
+        """
+        return self._tickers.keys()
+
+    def getShares(self, ticker_symbol:str):
+        """
+        getter for the current number of shares of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: float<shares after the last trade> or None if the ticker has no trades
+        """
+        if not ticker_symbol in self._tickers:
+            return None
+        shares = self._tickers[ticker_symbol][2]
+        return float(shares[-1])
+
+    def getSharesAt(self, ticker_symbol:str, date:datetime.date):
+        """
+        getter for the number of shares of a ticker at the end of a date
+        :param ticker_symbol: str<ticker symbol>
+        :param date: datetime.date<day of the query>
+        :return: float<shares after the last trade on or before the date>
+        """
+        assert(type(date) == datetime.date), STRINGS.getTypeErrorString(date, "date", datetime.date)
+        if not ticker_symbol in self._tickers:
+            return 0.0
+        dates, _, shares, _ = self._tickers[ticker_symbol]
+        index = bisect_right(dates, date)
+        return float(shares[index - 1]) if index > 0 else 0.0
+
+    def getSharesChanges(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the share counts of a ticker in a date range
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: tuple<float<shares before the range>, list<datetime.date<dates of the trades in the range>>, numpy.ndarray<shares after each trade>>
+        """
+        assert(type(start) == datetime.date), STRINGS.getTypeErrorString(start, "start", datetime.date)
+        assert(type(end) == datetime.date), STRINGS.getTypeErrorString(end, "end", datetime.date)
+        if not ticker_symbol in self._tickers:
+            return 0.0, [], numpy.empty(0, dtype=numpy.float64)
+        dates, _, shares, _ = self._tickers[ticker_symbol]
+        first = bisect_left(dates, start)
+        last = bisect_right(dates, end)
+        return (float(shares[first - 1]) if first > 0 else 0.0), dates[first:last], shares[first:last]
+
+    def getDailyShares(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the number of shares of a ticker at the end of each day of a date range
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: numpy.ndarray<float64 shares of each day>
+        """
+        before, dates, shares = self.getSharesChanges(ticker_symbol, start, end)
+        days = numpy.arange(start.toordinal(), end.toordinal() + 1)
+        #the last trade on or before each day, the trades of the range are few compared to the days
+        index = numpy.searchsorted(numpy.array([date.toordinal() for date in dates], dtype=numpy.int64), days, side="right")
+        return numpy.concatenate([[before], shares])[index]
+
+    def getAsset(self, ticker_symbol:str):
+        """
+        getter for the asset of the last trade of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: object<Asset>
+        """
+        assert(ticker_symbol in self._tickers), STRINGS.ERROR_TICKER_NOT_IN_LEDGER+ticker_symbol
+        return self._tickers[ticker_symbol][1][-1].asset
+
+    def getInsertError(self, investment:Investment):
+        """
+        checks whether the investment could be added, without changing the ledger
+        :param investment: object<Investment>
+        :return: str<error message> or None if its valid
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        if investment.trade_type == "dividend":
+            #a dividend doesnt change the shares, so only the shares at its date have to be checked
+            shares = self.getSharesAt(investment.asset.ticker_symbol, investment.date)
+            if shares >= investment.number:
+                return None
+            if not investment.asset.ticker_symbol in self._tickers or bisect_right(self._tickers[investment.asset.ticker_symbol][0], investment.date) == 0:
+                #the user is trying to get a dividend from this asset, but there is no share currently hold
+                return f"you have no shares of this asset.\nYou cannot get dividend from this asset"
+            #the user is trying to get a dividend from more shares than currently hold
+            return f"you only have {shares} shares of this asset.\nYou cannot get dividend from {investment.number} shares"
+        state, start = self._getInserted(self._getState(investment.asset.ticker_symbol), investment)
+        return self._getError(state, start)
+
+    def getDeleteError(self, investment:Investment):
+        """
+        checks whether the investment could be deleted, without changing the ledger
+        :param investment: object<Investment>
+        :return: str<error message> or None if its valid
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        if investment.trade_type == "dividend":
+            #a dividend doesnt change the shares, so no other trade needs it
+            return None
+        state, start = self._getDeleted(self._getState(investment.asset.ticker_symbol), investment)
+        return self._getError(state, start)
+
+    def getReplaceError(self, old_investment:Investment, new_investment:Investment):
+        """
+        checks whether an investment could be replaced by a new one, without changing the ledger
+        :param old_investment: object<Investment> in the ledger
+        :param new_investment: object<Investment>
+        :return: str<error message> or None if its valid
+        """
+        assert(type(old_investment) == Investment), STRINGS.getTypeErrorString(old_investment, "old_investment", Investment)
+        assert(type(new_investment) == Investment), STRINGS.getTypeErrorString(new_investment, "new_investment", Investment)
+        if old_investment.asset.ticker_symbol != new_investment.asset.ticker_symbol:
+            #the tickers are independent of each other
+            error = self.getDeleteError(old_investment)
+            return error if error != None else self.getInsertError(new_investment)
+        state, deleted = self._getDeleted(self._getState(old_investment.asset.ticker_symbol), old_investment)
+        state, inserted = self._getInserted(state, new_investment)
+        return self._getError(state, min(deleted, inserted))
+
+    def insert(self, investment:Investment):
+        """
+        adds a trade, should be checked with getInsertError first
+        :param investment: object<Investment>
+        :return: void
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        state, _ = self._getInserted(self._getState(investment.asset.ticker_symbol), investment)
+        self._setState(investment.asset.ticker_symbol, state)
+
+    def delete(self, investment:Investment):
+        """
+        removes a trade, should be checked with getDeleteError first
+        :param investment: object<Investment>
+        :return: void
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        state, _ = self._getDeleted(self._getState(investment.asset.ticker_symbol), investment)
+        self._setState(investment.asset.ticker_symbol, state)
+
+    def replace(self, old_investment:Investment, new_investment:Investment):
+        """
+        replaces a trade, should be checked with getReplaceError first
+        :param old_investment: object<Investment> in the ledger
+        :param new_investment: object<Investment>
+        :return: void
+        """
+        self.delete(old_investment)
+        self.insert(new_investment)
+
+    def _getState(self, ticker_symbol:str):
+        """
+        getter for the trades of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: tuple<list<dates>, list<trades>, numpy.ndarray<shares>, numpy.ndarray<slack>>
+        """
+        if not ticker_symbol in self._tickers:
+            return ([], [], numpy.empty(0, dtype=numpy.float64), numpy.empty(0, dtype=numpy.float64))
+        return self._tickers[ticker_symbol]
+
+    def _setState(self, ticker_symbol:str, state:tuple):
+        """
+        setter for the trades of a ticker, a ticker without trades is removed
+        :param ticker_symbol: str<ticker symbol>
+        :param state: tuple<list<dates>, list<trades>, numpy.ndarray<shares>, numpy.ndarray<slack>>
+        :return: void
+        """
+        if state[1] == []:
+            self._tickers.pop(ticker_symbol, None)
+        else:
+            self._tickers[ticker_symbol] = state
+
+    def _getInserted(self, state:tuple, investment:Investment):
+        """
+        gets the trades of a ticker with a new trade inserted, the given state is not changed
+        :param state: tuple<trades of the ticker like returned by _getState>
+        :param investment: object<Investment>
+        :return: tuple<tuple<new state>, int<index of the first changed trade>>
+        """
+        dates, trades, shares, slack = state
+        index = bisect_right(dates, investment.date)
+        effect = self._getEffect(investment)
+        new_shares = (shares[index - 1] if index > 0 else 0.0) + effect
+        shares = numpy.insert(shares, index, new_shares)
+        slack = numpy.insert(slack, index, new_shares - self._getNeed(investment))
+        #the later trades have the shares of the new trade too
+        shares[index + 1:] += effect
+        slack[index + 1:] += effect
+        return (dates[:index] + [investment.date] + dates[index:], trades[:index] + [investment] + trades[index:], shares, slack), index
+
+    def _getDeleted(self, state:tuple, investment:Investment):
+        """
+        gets the trades of a ticker with a trade removed, the given state is not changed
+        :param state: tuple<trades of the ticker like returned by _getState>
+        :param investment: object<Investment>
+        :return: tuple<tuple<new state>, int<index of the first changed trade>>
+        """
+        dates, trades, shares, slack = state
+        index = bisect_right(dates, investment.date) - 1
+        #trades with the same date are next to each other
+        while index >= 0 and not trades[index] is investment:
+            index -= 1
+        assert(index >= 0 and dates[index] == investment.date), STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(investment)
+        effect = self._getEffect(investment)
+        shares = numpy.delete(shares, index)
+        slack = numpy.delete(slack, index)
+        shares[index:] -= effect
+        slack[index:] -= effect
+        return (dates[:index] + dates[index + 1:], trades[:index] + trades[index + 1:], shares, slack), index
+
+    def _getError(self, state:tuple, start:int):
+        """
+        checks the trades of a ticker from the given index forward
+        :param state: tuple<trades of the ticker like returned by _getState>
+        :param start: int<index of the first trade that has to be checked>
+        :return: str<error message for the first invalid trade> or None if all are valid
+        """
+        _, trades, shares, slack = state
+        invalid = numpy.flatnonzero(slack[start:] < 0)
+        if len(invalid) == 0:
+            return None
+        index = start + int(invalid[0])
+        trade = trades[index]
+        shares_before = float(shares[index]) - self._getEffect(trade)
+        if trade.trade_type == "sell":
+            if index == 0:
+                #the user is trying to sell shares, but there are no currently hold
+                return f"you have no shares of this asset.\nYou cannot sell shares"
+            #the user is trying to sell more shares than currently hold
+            return f"you only have {shares_before} shares of this asset.\nYou cannot sell {trade.number} shares"
+        if index == 0:
+            #the user is trying to get a dividend from this asset, but there is no share currently hold
+            return f"you have no shares of this asset.\nYou cannot get dividend from this asset"
+        #the user is trying to get a dividend from more shares than currently hold
+        return f"you only have {shares_before} shares of this asset.\nYou cannot get dividend from {trade.number} shares"
+
+    def _getEffect(self, investment:Investment):
+        """
+        gets the change of the shares caused by a trade
+        :param investment: object<Investment>
+        :return: float<shares added (negative for sells)>
+        """
+        match investment.trade_type:
+            case "buy":
+                return investment.number
+            case "sell":
+                return -investment.number
+        return 0.0
+
+    def _getNeed(self, investment:Investment):
+        """
+        gets the shares a trade needs to be hold after the trade
+        :param investment: object<Investment>
+        :return: float<needed shares>
+        """
+        return investment.number if investment.trade_type == "dividend" else 0.0
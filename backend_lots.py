@@ -0,0 +1,267 @@
+"""
+this module provides the lot engine that is used by the backend to compute the cost basis and realized profits of the investments
+sold shares are matched to bought shares (fifo or average cost), the state after each trade is stored,
+so a change only has to be computed again for its ticker and from its date forward
+"""
+from bisect import bisect_left, bisect_right
+import datetime
+import numpy
+from strings import ENG as STRINGS
+from fullstack_utils import LotMethod, utils
+from backend_datatypes import Investment
+
+#a number of shares below this is treated as zero, it catches rounding errors of the floats
+SHARES_EPSILON = 1e-9
+
+
+class LotSummary:
+    """
+    the lot summary contains the profits, fees and taxes of the trades in a date range
+    and the held shares and their cost basis at the end of the range
+    """
+    def __init__(self, realized:float, fees:float, taxes:float, dividends:float, shares:float, cost_basis:float):
+        """
+        basic constructor
+        saves the arguments into the object
+        :param realized: float<profit of the sold shares after trading fees, before taxes>
+        :param fees: float<trading fees of all trades>
+        :param taxes: float<taxes of all trades>
+        :param dividends: float<received dividends before taxes>
+        :param shares: float<shares held at the end of the range>
+        :param cost_basis: float<cost of the shares held at the end of the range, including the trading fees of the buys>
+        :return: void
+        """
+        self.realized = realized
+        self.fees = fees
+        self.taxes = taxes
+        self.dividends = dividends
+        self.shares = shares
+        self.cost_basis = cost_basis
+
+
+class TickerLots:
+    """
+    the ticker lots hold the trades of one ticker sorted by date and the state after each trade
+    in fifo mode the open lots are always the buys from the head trade on, so the state only needs the head and its remaining shares
+    """
+    def __init__(self):
+        """
+        basic constructor is setting up a ticker without trades
+        :return: void
+        """
+        self.dates:list[datetime.date] = []
+        self.trades:list[Investment] = []
+        #state after each trade
+        self.shares:list[float] = []        #held shares
+        self.costs:list[float] = []         #cost basis of the held shares
+        self.heads:list[int] = []           #index of the oldest buy with open shares (fifo) or -1 if there is none
+        self.head_left:list[float] = []     #open shares of that buy
+        #results of each trade
+        self.realized = numpy.empty(0, dtype=numpy.float64)
+        self.fees = numpy.empty(0, dtype=numpy.int64)      #minor units (cents), so the sums are exact
+        self.taxes = numpy.empty(0, dtype=numpy.int64)     #minor units (cents)
+        self.dividends = numpy.empty(0, dtype=numpy.float64)
+
+
+class LotEngine:
+    """
+    the lot engine holds the lots of each ticker, it should get the same changes as the position ledger
+    the trades are not validated here, a sell never sells more shares than held because the ledger checks that before
+    """
+    def __init__(self, method:LotMethod=LotMethod.FIFO):
+        """
+        basic constructor is setting up an empty engine
+        :param method: object<LotMethod> that matches the sold shares
+        :return: void
+        """
+        assert(type(method) == LotMethod), STRINGS.getTypeErrorString(method, "method", LotMethod)
+        self.method = method
+        self._tickers:dict[str, TickerLots] = {}
+
+    def setMethod(self, method:LotMethod):
+        """
+        changes the method and computes all tickers again
+        :param method: object<LotMethod>
+        :return: void
+        """
+        assert(type(method) == LotMethod), STRINGS.getTypeErrorString(method, "method", LotMethod)
+        self.method = method
+        for lots in self._tickers.values():
+            self._compute(lots, 0)
+
+    def rebuild(self, investments:list[Investment]):
+        """
+        builds the lots of all tickers from scratch
+        :param investments: list<object<Investment>> in any order
+        :return: void
+        """
+        self._tickers = {}
+        for investment in sorted(investments, key=lambda x: x.date):
+            lots = self._tickers.setdefault(investment.asset.ticker_symbol, TickerLots())
+            lots.dates.append(investment.date)
+            lots.trades.append(investment)
+        for lots in self._tickers.values():
+            self._compute(lots, 0)
+
+    def insert(self, investment:Investment):
+        """
+        adds a trade, its ticker is computed again from the date of the trade forward
+        :param investment: object<Investment>
+        :return: void
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        lots = self._tickers.setdefault(investment.asset.ticker_symbol, TickerLots())
+        index = bisect_right(lots.dates, investment.date)
+        lots.dates.insert(index, investment.date)
+        lots.trades.insert(index, investment)
+        self._compute(lots, index)
+
+    def delete(self, investment:Investment):
+        """
+        removes a trade, its ticker is computed again from the date of the trade forward
+        :param investment: object<Investment>
+        :return: void
+        """
+        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        ticker_symbol = investment.asset.ticker_symbol
+        assert(ticker_symbol in self._tickers), STRINGS.ERROR_TICKER_NOT_IN_LEDGER+ticker_symbol
+        lots = self._tickers[ticker_symbol]
+        index = bisect_left(lots.dates, investment.date)
+        #trades with the same date are next to each other
+        while index < len(lots.trades) and not lots.trades[index] is investment:
+            index += 1
+        assert(index < len(lots.trades)), STRINGS.ERROR_INVESTMENT_NOT_IN_LIST+str(investment)
+        del lots.dates[index]
+        del lots.trades[index]
+        if lots.trades == []:
+            self._tickers.pop(ticker_symbol)
+            return
+        self._compute(lots, index)
+
+    def getTickers(self):
+        """
+        getter for the ticker symbols that have at least one trade
+        :return: Iterable[str<ticker symbol>]
+        """
+        return self._tickers.keys()
+
+    def getTrades(self, ticker_symbol:str):
+        """
+        getter for the trades of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: list<object<Investment>> sorted by date (must not be changed)
+        """
+        assert(ticker_symbol in self._tickers), STRINGS.ERROR_TICKER_NOT_IN_LEDGER+ticker_symbol
+        return self._tickers[ticker_symbol].trades
+
+    def getPosition(self, ticker_symbol:str):
+        """
+        getter for the currently held shares of a ticker and their cost basis
+        :param ticker_symbol: str<ticker symbol>
+        :return: tuple<float<shares>, float<cost basis>>
+        """
+        if not ticker_symbol in self._tickers:
+            return 0.0, 0.0
+        lots = self._tickers[ticker_symbol]
+        return lots.shares[-1], lots.costs[-1]
+
+    def getSummary(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the results of the trades of a ticker in a date range
+        :param ticker_symbol: str<ticker symbol> or None for all tickers
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: object<LotSummary>
+        """
+        assert(type(start) == datetime.date), STRINGS.getTypeErrorString(start, "start", datetime.date)
+        assert(type(end) == datetime.date), STRINGS.getTypeErrorString(end, "end", datetime.date)
+        if ticker_symbol == None:
+            tickers = list(self._tickers.values())
+        else:
+            tickers = [self._tickers[ticker_symbol]] if ticker_symbol in self._tickers else []
+        summary = LotSummary(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        fees, taxes = 0, 0
+        for lots in tickers:
+            first = bisect_left(lots.dates, start)
+            last = bisect_right(lots.dates, end)
+            summary.realized += float(lots.realized[first:last].sum())
+            fees += int(lots.fees[first:last].sum())
+            taxes += int(lots.taxes[first:last].sum())
+            summary.dividends += float(lots.dividends[first:last].sum())
+            if last > 0:
+                summary.shares += lots.shares[last - 1]
+                summary.cost_basis += lots.costs[last - 1]
+        summary.fees = utils.fromCents(fees)
+        summary.taxes = utils.fromCents(taxes)
+        return summary
+
+    def _compute(self, lots:TickerLots, start:int):
+        """
+        computes the states and results of a ticker from a trade forward, the states before it are kept
+        :param lots: object<TickerLots>
+        :param start: int<index of the first changed trade>
+        :return: void
+        """
+        del lots.shares[start:], lots.costs[start:], lots.heads[start:], lots.head_left[start:]
+        if start > 0:
+            shares, cost, head, head_left = lots.shares[-1], lots.costs[-1], lots.heads[-1], lots.head_left[-1]
+        else:
+            shares, cost, head, head_left = 0.0, 0.0, -1, 0.0
+        count = len(lots.trades) - start
+        realized = numpy.zeros(count, dtype=numpy.float64)
+        dividends = numpy.zeros(count, dtype=numpy.float64)
+        fees = numpy.array([trade.tradingfee_cents for trade in lots.trades[start:]], dtype=numpy.int64)
+        taxes = numpy.array([trade.tax_cents for trade in lots.trades[start:]], dtype=numpy.int64)
+        for offset, trade in enumerate(lots.trades[start:]):
+            index = start + offset
+            match trade.trade_type:
+                case "buy":
+                    cost += trade.number*trade.price_per_asset + trade.tradingfee
+                    shares += trade.number
+                    if head == -1:
+                        #there were no open lots, this buy is the oldest one now
+                        head, head_left = index, trade.number
+                case "sell":
+                    if self.method == LotMethod.AVERAGE:
+                        sold_cost = cost * trade.number / shares
+                    else:
+                        sold_cost, head, head_left = self._sellFifo(lots.trades, index, trade.number, head, head_left)
+                    realized[offset] = trade.number*trade.price_per_asset - trade.tradingfee - sold_cost
+                    cost -= sold_cost
+                    shares -= trade.number
+                    if shares < SHARES_EPSILON:
+                        #all shares are sold, the rest of the cost is a rounding error
+                        shares, cost, head, head_left = 0.0, 0.0, -1, 0.0
+                case "dividend":
+                    dividends[offset] = trade.number*trade.price_per_asset
+            lots.shares.append(shares)
+            lots.costs.append(cost)
+            lots.heads.append(head)
+            lots.head_left.append(head_left)
+        lots.realized = numpy.concatenate([lots.realized[:start], realized])
+        lots.fees = numpy.concatenate([lots.fees[:start], fees])
+        lots.taxes = numpy.concatenate([lots.taxes[:start], taxes])
+        lots.dividends = numpy.concatenate([lots.dividends[:start], dividends])
+
+    def _sellFifo(self, trades:list[Investment], index:int, number:float, head:int, head_left:float):
+        """
+        sells shares from the oldest open lots
+        :param trades: list<object<Investment>> of the ticker sorted by date
+        :param index: int<index of the sell>
+        :param number: float<sold shares>
+        :param head: int<index of the oldest buy with open shares>
+        :param head_left: float<open shares of that buy>
+        :return: tuple<float<cost of the sold shares>, int<new head>, float<open shares of the new head>>
+        """
+        sold_cost = 0.0
+        while number > SHARES_EPSILON and head != -1:
+            lot = trades[head]
+            sold = min(head_left, number)
+            sold_cost += sold * (lot.number*lot.price_per_asset + lot.tradingfee) / lot.number
+            number -= sold
+            head_left -= sold
+            if head_left < SHARES_EPSILON:
+                #the lot is sold completely, the next buy before the sell is the oldest open lot
+                head = next((later for later in range(head + 1, index) if trades[later].trade_type == "buy"), -1)
+                head_left = trades[head].number if head != -1 else 0.0
+        return sold_cost, head, head_left
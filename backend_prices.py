@@ -0,0 +1,228 @@
+"""
+this module provides the price history store that is used by the backend to keep the daily close prices of the tickers
+the prices of each ticker are stored in one numpy file, that is memory mapped for reading
+only the date ranges that are not stored yet are loaded from the quote provider
+"""
+import os
+import io
+import json
+import time
+import datetime
+from threading import RLock
+import numpy
+from strings import ENG as STRINGS
+from backend_journal import writeFileAtomic
+from backend_quotes import QuoteProvider
+
+#dtype of the price files, the rows are sorted by date and each date is unique
+PRICE_DTYPE = numpy.dtype([("date", "datetime64[D]"), ("close", numpy.float64)])
+
+
+class PriceHistoryStore:
+    """
+    the price history store holds the daily close prices of each ticker in the file <directory>/<ticker>.npy
+    the date ranges that were loaded are saved in <directory>/coverage.json, a covered day without a price is no trading day
+    the current day is never covered, because its close price is not final
+    the returned arrays are read only views of the memory mapped files
+    """
+    def __init__(self, directory:str, quote_provider:QuoteProvider):
+        """
+        basic constructor is loading the covered ranges, the directory is created with the first write
+        :param directory: str<path of the directory of the price files>
+        :param quote_provider: object<QuoteProvider> that gets the missing prices
+        :return: void
+        """
+        assert(type(directory) == str), STRINGS.getTypeErrorString(directory, "directory", str)
+        assert(isinstance(quote_provider, QuoteProvider)), STRINGS.getTypeErrorString(quote_provider, "quote_provider", QuoteProvider)
+        self.directory = directory
+        self.quote_provider = quote_provider
+        self._lock = RLock()    #held while the files are changed
+        self._maps:dict[str, numpy.ndarray] = {}    #memory mapped price files per ticker
+        #ascending, not overlapping ranges of covered days per ticker, the end is inclusive
+        self._coverage:dict[str, list[tuple[datetime.date, datetime.date]]] = {}
+        try:
+            with open(self._getCoveragePath(), "r") as coverage_file:
+                coverage = json.load(coverage_file)
+            for ticker_symbol, ranges in coverage.items():
+                self._coverage[ticker_symbol] = [(datetime.date.fromisoformat(start), datetime.date.fromisoformat(end)) for start, end in ranges]
+        except:
+            #nothing is stored yet or the file is broken, in both cases all prices are loaded again
+            self._coverage = {}
+
+    def getHistory(self, ticker_symbol:str, start:datetime.date, end:datetime.date, timeout:float=None):
+        """
+        getter for the close prices of a ticker in a date window, the missing ranges are loaded first
+        if they cannot be loaded, only the stored prices are returned
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day of the window>
+        :param end: datetime.date<last day of the window>
+        :param timeout: float<seconds to wait for the quote provider> or None to wait until its done
+        :return: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>>
+        """
+        ticker_symbol = ticker_symbol.lower()
+        self.update([ticker_symbol], start, end, timeout)
+        return self.getStoredHistory(ticker_symbol, start, end)
+
+    def getStoredHistory(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        getter for the stored close prices of a ticker in a date window, nothing is loaded
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day of the window>
+        :param end: datetime.date<last day of the window>
+        :return: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>>
+        """
+        assert(type(start) == datetime.date), STRINGS.getTypeErrorString(start, "start", datetime.date)
+        assert(type(end) == datetime.date), STRINGS.getTypeErrorString(end, "end", datetime.date)
+        prices = self._getPrices(ticker_symbol.lower())
+        first = numpy.searchsorted(prices["date"], numpy.datetime64(start, "D"), side="left")
+        last = numpy.searchsorted(prices["date"], numpy.datetime64(end, "D"), side="right")
+        window = prices[first:last]
+        return window["date"], window["close"]
+
+    def update(self, ticker_symbols:list[str], start:datetime.date, end:datetime.date, timeout:float=None):
+        """
+        loads all missing prices of the tickers in a date window
+        tickers that miss the same range are loaded with one request
+        if a request fails or times out, the other requests are cancelled and the prices that are already stored are kept
+        :param ticker_symbols: list<str<ticker symbol>>
+        :param start: datetime.date<first day of the window>
+        :param end: datetime.date<last day of the window>
+        :param timeout: float<seconds to wait for the quote provider> or None to wait until its done
+        :return: bool<were all missing prices loaded?>
+        """
+        assert(type(start) == datetime.date), STRINGS.getTypeErrorString(start, "start", datetime.date)
+        assert(type(end) == datetime.date), STRINGS.getTypeErrorString(end, "end", datetime.date)
+        end = min(end, datetime.date.today())
+        requests:dict[tuple[datetime.date, datetime.date], list[str]] = {}
+        with self._lock:
+            for ticker_symbol in ticker_symbols:
+                for gap in self._getGaps(ticker_symbol.lower(), start, end):
+                    requests.setdefault(gap, []).append(ticker_symbol.lower())
+        futures = [(gap, symbols, self.quote_provider.submitPrices(symbols, gap[0], gap[1])) for gap, symbols in requests.items()]
+        deadline = None if timeout == None else time.monotonic() + timeout
+        for index, (gap, symbols, future) in enumerate(futures):
+            try:
+                #the timeout is for all requests together
+                loaded = future.result(None if deadline == None else max(deadline - time.monotonic(), 0.0))
+            except Exception as e:
+                print("Some error occured while loading the prices: "+repr(e))
+                #nobody waits for the other requests anymore
+                for _, _, other in futures[index:]:
+                    other.cancel()
+                return False
+            with self._lock:
+                for ticker_symbol in symbols:
+                    self._store(ticker_symbol, gap, loaded.get(ticker_symbol))
+                self._writeCoverage()
+        return True
+
+    def _getGaps(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        gets the ranges of a date window that are not covered yet
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first day of the window>
+        :param end: datetime.date<last day of the window>
+        :return: list<tuple<datetime.date<first missing day>, datetime.date<last missing day>>>
+        """
+        gaps = []
+        day = start
+        for covered_start, covered_end in self._coverage.get(ticker_symbol, []):
+            if covered_end < day:
+                continue
+            if covered_start > end:
+                break
+            if day < covered_start:
+                gaps.append((day, covered_start - datetime.timedelta(days=1)))
+            day = covered_end + datetime.timedelta(days=1)
+        if day <= end:
+            gaps.append((day, end))
+        return gaps
+
+    def _store(self, ticker_symbol:str, gap:tuple[datetime.date, datetime.date], loaded:tuple[numpy.ndarray, numpy.ndarray]):
+        """
+        merges loaded prices into the price file of a ticker and marks the range as covered
+        :param ticker_symbol: str<ticker symbol>
+        :param gap: tuple<datetime.date<first loaded day>, datetime.date<last loaded day>>
+        :param loaded: tuple<numpy.ndarray<dates>, numpy.ndarray<close prices>> or None if the provider had no prices
+        :return: void
+        """
+        if loaded != None and len(loaded[0]) > 0:
+            new_prices = numpy.empty(len(loaded[0]), dtype=PRICE_DTYPE)
+            new_prices["date"] = loaded[0]
+            new_prices["close"] = loaded[1]
+            prices = numpy.concatenate([self._getPrices(ticker_symbol), new_prices])
+            #the loaded prices replace stored prices of the same day, so the last occurrence of each date is kept
+            _, last_index = numpy.unique(prices["date"][::-1], return_index=True)
+            prices = prices[len(prices) - 1 - last_index]
+            self._writePrices(ticker_symbol, prices)
+        covered_end = min(gap[1], datetime.date.today() - datetime.timedelta(days=1))
+        if gap[0] <= covered_end:
+            self._addCoverage(ticker_symbol, gap[0], covered_end)
+
+    def _addCoverage(self, ticker_symbol:str, start:datetime.date, end:datetime.date):
+        """
+        adds a covered range and merges it with adjacent ranges
+        :param ticker_symbol: str<ticker symbol>
+        :param start: datetime.date<first covered day>
+        :param end: datetime.date<last covered day>
+        :return: void
+        """
+        merged = []
+        for covered_start, covered_end in sorted(self._coverage.get(ticker_symbol, []) + [(start, end)]):
+            if merged != [] and covered_start <= merged[-1][1] + datetime.timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], covered_end))
+            else:
+                merged.append((covered_start, covered_end))
+        self._coverage[ticker_symbol] = merged
+
+    def _getPrices(self, ticker_symbol:str):
+        """
+        getter for the memory mapped price file of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: numpy.ndarray<PRICE_DTYPE> (empty if there is no file)
+        """
+        with self._lock:
+            if not ticker_symbol in self._maps:
+                try:
+                    self._maps[ticker_symbol] = numpy.load(self._getPricePath(ticker_symbol), mmap_mode="r")
+                except (FileNotFoundError, ValueError):
+                    #an empty file cannot be mapped
+                    return numpy.empty(0, dtype=PRICE_DTYPE)
+            return self._maps[ticker_symbol]
+
+    def _writePrices(self, ticker_symbol:str, prices:numpy.ndarray):
+        """
+        replaces the price file of a ticker, views of the old file stay valid
+        :param ticker_symbol: str<ticker symbol>
+        :param prices: numpy.ndarray<PRICE_DTYPE sorted by date>
+        :return: void
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        buffer = io.BytesIO()
+        numpy.save(buffer, prices)
+        writeFileAtomic(self._getPricePath(ticker_symbol), buffer.getvalue())
+        self._maps.pop(ticker_symbol, None)     #the file is mapped again with the next read
+
+    def _writeCoverage(self):
+        """
+        writes the covered ranges of all tickers
+        :return: void
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        coverage = {ticker_symbol: [[start.isoformat(), end.isoformat()] for start, end in ranges] for ticker_symbol, ranges in self._coverage.items()}
+        writeFileAtomic(self._getCoveragePath(), json.dumps(coverage).encode("utf-8"))
+
+    def _getPricePath(self, ticker_symbol:str):
+        """
+        gets the path of the price file of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: str<path>
+        """
+        return os.path.join(self.directory, ticker_symbol + ".npy")
+
+    def _getCoveragePath(self):
+        """
+        gets the path of the file with the covered ranges
+        :return: str<path>
+        """
+        return os.path.join(self.directory, "coverage.json")
@@ -0,0 +1,310 @@
+"""
+this module provides the quote providers that are used by the backend to get the data of tickers
+the backend only uses the QuoteProvider interface, so the api can be exchanged without changing the backend
+the fixture provider reads the data from a file, so the investment part can be used without any network
+"""
+import json
+import time
+import datetime
+from threading import Lock, Event
+from concurrent.futures import ThreadPoolExecutor, Future, InvalidStateError
+import numpy
+import yahooquery
+from strings import ENG as STRINGS
+from constants import CONSTANTS
+from backend_tickercache import TickerMetadata
+
+
+class QuoteProvider:
+    """
+    the quote provider is the interface for all sources of ticker data
+    a provider only has to implement the blocking batch methods metadata and prices
+    the submit methods run them on the worker threads of the provider and return a future,
+    so the caller can wait with a timeout or keep working until the data is there
+    a failed attempt is retried with an increasing backoff
+    a request that is already running for the same arguments is not started again, the caller waits for the running one
+    every caller gets its own future, cancelling it only stops the wait of that caller
+    the request itself is cancelled (and its retries are stopped) if the last waiting caller cancelled its future
+    """
+    def __init__(self, max_workers:int=CONSTANTS.QUOTE_WORKERS, retries:int=CONSTANTS.QUOTE_RETRIES, backoff:float=CONSTANTS.QUOTE_BACKOFF):
+        """
+        basic constructor is setting up the worker threads
+        :param max_workers: int<number of requests that can run at once>
+        :param retries: int<number of attempts after the first one failed>
+        :param backoff: float<seconds to wait before the first retry, doubled for every further retry>
+        :return: void
+        """
+        assert(type(max_workers) == int), STRINGS.getTypeErrorString(max_workers, "max_workers", int)
+        assert(type(retries) == int), STRINGS.getTypeErrorString(retries, "retries", int)
+        assert(type(backoff) == float), STRINGS.getTypeErrorString(backoff, "backoff", float)
+        self.retries = retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=type(self).__name__)
+        #running requests by their arguments, each with the futures of its waiting callers
+        self._in_flight:dict[tuple, tuple[Future, list[Future]]] = {}
+        self._lock = Lock()                         #protects the running requests
+
+    def metadata(self, symbols:list[str]):
+        """
+        loads the metadata of some tickers at once
+        tickers without a short name or currency are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :return: dict<str<ticker symbol>: object<TickerMetadata>>
+        """
+        raise NotImplementedError(STRINGS.ERROR_NOT_IMPLEMENTED+"metadata")
+
+    def prices(self, symbols:list[str], start:datetime.date, end:datetime.date):
+        """
+        loads the daily close prices of some tickers at once
+        tickers without prices in the range are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: dict<str<ticker symbol>: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>>>
+        """
+        raise NotImplementedError(STRINGS.ERROR_NOT_IMPLEMENTED+"prices")
+
+    def submitMetadata(self, symbols:list[str]) -> Future:
+        """
+        runs metadata on a worker thread
+        :param symbols: list<str<ticker symbol in lower case>>
+        :return: object<Future<result of metadata>>
+        """
+        return self._submit(self.metadata, (tuple(sorted(symbols)),), (list(symbols),))
+
+    def submitPrices(self, symbols:list[str], start:datetime.date, end:datetime.date) -> Future:
+        """
+        runs prices on a worker thread
+        :param symbols: list<str<ticker symbol in lower case>>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: object<Future<result of prices>>
+        """
+        return self._submit(self.prices, (tuple(sorted(symbols)), start, end), (list(symbols), start, end))
+
+    def _submit(self, func:callable, key:tuple, args:tuple):
+        """
+        starts a request on a worker thread, if the same request is already running the caller waits for that one
+        :param func: function<blocking method of the provider>
+        :param key: tuple<hashable arguments that identify the request>
+        :param args: tuple<arguments of the method>
+        :return: object<Future<result of the method>> of this caller
+        """
+        key = (func.__name__,) + key
+        waiter = Future()
+        with self._lock:
+            entry = self._in_flight.get(key)
+            start = entry == None
+            if start:
+                #the future stays pending until the request is done, so it can be cancelled while the request is running
+                entry = (Future(), [])
+                self._in_flight[key] = entry
+            request, waiters = entry
+            waiters.append(waiter)
+        waiter.add_done_callback(lambda waiter: self._onWaiterDone(key, request, waiter))
+        if start:
+            cancelled = Event()
+            request.add_done_callback(lambda request: self._onDone(key, request, cancelled))
+            self._executor.submit(self._run, request, cancelled, func, args)
+        return waiter
+
+    def _run(self, future:Future, cancelled:Event, func:callable, args:tuple):
+        """
+        runs a request on a worker thread and retries it with an increasing backoff if it fails
+        :param future: object<Future> of the request
+        :param cancelled: object<Event> that is set if the future is done (or cancelled)
+        :param func: function<blocking method of the provider>
+        :param args: tuple<arguments of the method>
+        :return: void
+        """
+        for attempt in range(self.retries + 1):
+            if cancelled.is_set():
+                #nobody waits for the result anymore
+                return
+            try:
+                result = func(*args)
+            except Exception as e:
+                if attempt == self.retries or cancelled.wait(self.backoff * 2**attempt):
+                    self._setFuture(future, exception=e)
+                    return
+                continue
+            self._setFuture(future, result=result)
+            return
+
+    def _setFuture(self, future:Future, result=None, exception:Exception=None):
+        """
+        sets the result of a request, if it was cancelled in the meantime the result is dropped
+        :param future: object<Future> of the request
+        :param result: any<result of the request>
+        :param exception: object<Exception> if the request failed
+        :return: void
+        """
+        try:
+            if exception != None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _onDone(self, key:tuple, request:Future, cancelled:Event):
+        """
+        gets called if a request is done or cancelled, the result is passed to all waiting callers
+        :param key: tuple<arguments that identify the request>
+        :param request: object<Future> of the request
+        :param cancelled: object<Event> that stops the retries
+        :return: void
+        """
+        cancelled.set()
+        with self._lock:
+            waiters = []
+            if self._in_flight.get(key, (None,))[0] is request:
+                _, waiters = self._in_flight.pop(key)
+        for waiter in waiters:
+            if request.cancelled():
+                waiter.cancel()
+            elif request.exception() != None:
+                self._setFuture(waiter, exception=request.exception())
+            else:
+                self._setFuture(waiter, result=request.result())
+
+    def _onWaiterDone(self, key:tuple, request:Future, waiter:Future):
+        """
+        gets called if the future of a caller is done, if it was cancelled the caller stops waiting
+        the request is cancelled if no caller waits for it anymore
+        :param key: tuple<arguments that identify the request>
+        :param request: object<Future> of the request
+        :param waiter: object<Future> of the caller
+        :return: void
+        """
+        if not waiter.cancelled():
+            return
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry == None or not entry[0] is request:
+                #the request is already done
+                return
+            entry[1].remove(waiter)
+            last = entry[1] == []
+        if last:
+            request.cancel()
+
+
+class YahooQuoteProvider(QuoteProvider):
+    """
+    the yahoo quote provider gets the data from the yahoo finance api with yahooquery
+    """
+    def metadata(self, symbols:list[str]):
+        """
+        loads the metadata of some tickers at once
+        tickers without a short name or currency are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :return: dict<str<ticker symbol>: object<TickerMetadata>>
+        """
+        ticker_obj = yahooquery.Ticker(symbols)
+        quote_types = ticker_obj.quote_type
+        prices = ticker_obj.price
+        fetch_time = time.time()
+        ret = {}
+        for symbol in symbols:
+            try:
+                #the api returns an error string instead of a dict for unknown tickers
+                short_name = quote_types[symbol]["shortName"]
+                cur = prices[symbol]["currency"]
+                quote_type = quote_types[symbol].get("quoteType", "")
+            except:
+                continue
+            ret[symbol] = TickerMetadata(short_name, cur, quote_type, fetch_time)
+        return ret
+
+    def prices(self, symbols:list[str], start:datetime.date, end:datetime.date):
+        """
+        loads the daily close prices of some tickers at once
+        tickers without prices in the range are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: dict<str<ticker symbol>: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>>>
+        """
+        #the end of the api is exclusive
+        history = yahooquery.Ticker(symbols).history(start=start, end=end + datetime.timedelta(days=1), interval="1d")
+        ret = {}
+        if not hasattr(history, "index"):
+            #the api returns a dict with error messages if there is no data at all
+            return ret
+        for symbol in symbols:
+            try:
+                closes = history.loc[symbol]["close"].dropna()
+            except KeyError:
+                continue
+            #the last day can be a timestamp with time zone, so only the date part is used
+            dates = numpy.array([str(date)[:10] for date in closes.index], dtype="datetime64[D]")
+            ret[symbol] = (dates, closes.to_numpy(dtype=numpy.float64))
+        return ret
+
+
+class FixtureQuoteProvider(QuoteProvider):
+    """
+    the fixture quote provider gets the data from a json file, its used for benchmarks and load tests without network
+    the file contains {"metadata": {symbol: {"shortName": str, "currency": str, "quoteType": str}},
+                       "prices": {symbol: {"YYYY-MM-DD": float}}}
+    an optional delay simulates the latency of a real api
+    """
+    def __init__(self, path:str, delay:float=0.0, max_workers:int=CONSTANTS.QUOTE_WORKERS):
+        """
+        basic constructor is loading the fixture file
+        :param path: str<path of the json fixture file>
+        :param delay: float<seconds each request waits before it returns>
+        :param max_workers: int<number of requests that can run at once>
+        :return: void
+        """
+        assert(type(path) == str), STRINGS.getTypeErrorString(path, "path", str)
+        assert(type(delay) == float), STRINGS.getTypeErrorString(delay, "delay", float)
+        super().__init__(max_workers)
+        self.delay = delay
+        with open(path, "r") as fixture_file:
+            fixture = json.load(fixture_file)
+        self._metadata:dict[str, dict] = {symbol.lower(): data for symbol, data in fixture.get("metadata", {}).items()}
+        self._prices:dict[str, tuple[numpy.ndarray, numpy.ndarray]] = {}
+        for symbol, closes in fixture.get("prices", {}).items():
+            dates = numpy.array(list(closes.keys()), dtype="datetime64[D]")
+            order = numpy.argsort(dates, kind="stable")
+            self._prices[symbol.lower()] = (dates[order], numpy.array(list(closes.values()), dtype=numpy.float64)[order])
+
+    def metadata(self, symbols:list[str]):
+        """
+        loads the metadata of some tickers at once
+        tickers without a short name or currency are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :return: dict<str<ticker symbol>: object<TickerMetadata>>
+        """
+        time.sleep(self.delay)
+        fetch_time = time.time()
+        ret = {}
+        for symbol in symbols:
+            data = self._metadata.get(symbol)
+            if data == None or not "shortName" in data or not "currency" in data:
+                continue
+            ret[symbol] = TickerMetadata(data["shortName"], data["currency"], data.get("quoteType", ""), fetch_time)
+        return ret
+
+    def prices(self, symbols:list[str], start:datetime.date, end:datetime.date):
+        """
+        loads the daily close prices of some tickers at once
+        tickers without prices in the range are left out
+        :param symbols: list<str<ticker symbol in lower case>>
+        :param start: datetime.date<first day of the range>
+        :param end: datetime.date<last day of the range>
+        :return: dict<str<ticker symbol>: tuple<numpy.ndarray<datetime64[D] dates ascending>, numpy.ndarray<float64 close prices>>>
+        """
+        time.sleep(self.delay)
+        ret = {}
+        for symbol in symbols:
+            if not symbol in self._prices:
+                continue
+            dates, closes = self._prices[symbol]
+            first = numpy.searchsorted(dates, numpy.datetime64(start, "D"), side="left")
+            last = numpy.searchsorted(dates, numpy.datetime64(end, "D"), side="right")
+            if first < last:
+                ret[symbol] = (dates[first:last], closes[first:last])
+        return ret
@@ -0,0 +1,203 @@
+"""
+this module provides the return calculator that is used by the backend to compute the money and time weighted returns
+the cashflows of each ticker are cached as numpy arrays until an investment of the ticker changes,
+the returns of all tickers are computed at once on padded matrices
+"""
+import datetime
+import numpy
+from strings import ENG as STRINGS
+from backend_datatypes import Investment
+
+#days of a year for the exponent of the money weighted return
+DAYS_PER_YEAR = 365.0
+#the money weighted return is searched between these rates
+XIRR_MIN_RATE = -0.9999
+XIRR_MAX_RATE = 1000.0
+
+
+def solveXirr(years:numpy.ndarray, amounts:numpy.ndarray, iterations:int=50):
+    """
+    solves the money weighted return of each row at once
+    the newton method is used first, rows that did not converge are solved with bisection afterwards
+    :param years: numpy.ndarray<2d float64 years of each cashflow since the first cashflow of the row>
+    :param amounts: numpy.ndarray<2d float64 cashflows (padded with zeros), negative if money is invested>
+    :param iterations: int<newton iterations>
+    :return: numpy.ndarray<float64 yearly rate of each row, nan if there is no solution>
+    """
+    rows = amounts.shape[0]
+    scale = numpy.abs(amounts).sum(axis=1)
+    rates = numpy.full(rows, 0.1)
+    converged = numpy.zeros(rows, dtype=bool)
+    with numpy.errstate(all="ignore"):
+        for _ in range(iterations):
+            discount = (1 + rates[:, None]) ** -years
+            npv = (amounts * discount).sum(axis=1)
+            derivative = (-years * amounts * discount / (1 + rates[:, None])).sum(axis=1)
+            converged |= numpy.abs(npv) <= 1e-10 * scale
+            step = numpy.where(converged | (derivative == 0), 0.0, npv / derivative)
+            rates = numpy.clip(rates - step, XIRR_MIN_RATE, XIRR_MAX_RATE)
+            if converged.all():
+                break
+        #bisection for the rows that did not converge
+        todo = ~converged
+        if todo.any():
+            low = numpy.full(rows, XIRR_MIN_RATE)
+            high = numpy.full(rows, XIRR_MAX_RATE)
+            npv_low = (amounts * (1 + low[:, None]) ** -years).sum(axis=1)
+            npv_high = (amounts * (1 + high[:, None]) ** -years).sum(axis=1)
+            bracketed = numpy.sign(npv_low) != numpy.sign(npv_high)
+            for _ in range(200):
+                middle = (low + high) / 2
+                npv_middle = (amounts * (1 + middle[:, None]) ** -years).sum(axis=1)
+                same_side = numpy.sign(npv_middle) == numpy.sign(npv_low)
+                low = numpy.where(same_side, middle, low)
+                npv_low = numpy.where(same_side, npv_middle, npv_low)
+                high = numpy.where(same_side, high, middle)
+            rates = numpy.where(todo, numpy.where(bracketed, (low + high) / 2, numpy.nan), rates)
+    #a row without an invested and a returned cashflow has no rate
+    has_both = (amounts < 0).any(axis=1) & (amounts > 0).any(axis=1)
+    return numpy.where(has_both, rates, numpy.nan)
+
+
+class TickerCashflows:
+    """
+    the ticker cashflows contain the trades of a ticker as arrays sorted by date
+    """
+    def __init__(self, trades:list[Investment]):
+        """
+        basic constructor
+        builds the arrays from the trades
+        :param trades: list<object<Investment>> sorted by date
+        :return: void
+        """
+        self.days = numpy.array([trade.date.toordinal() for trade in trades], dtype=numpy.int64)
+        number = numpy.array([trade.number for trade in trades], dtype=numpy.float64)
+        gross = number * numpy.array([trade.price_per_asset for trade in trades], dtype=numpy.float64)
+        costs = numpy.array([trade.tradingfee + trade.tax for trade in trades], dtype=numpy.float64)
+        buys = numpy.array([trade.trade_type == "buy" for trade in trades], dtype=bool)
+        sells = numpy.array([trade.trade_type == "sell" for trade in trades], dtype=bool)
+        #cashflows from the view of the user, buying is paying money
+        self.amounts = numpy.where(buys, -gross - costs, gross - costs)
+        #dividends paid out per trade and the shares after each trade
+        self.dividends = numpy.where(buys | sells, 0.0, gross - costs)
+        self.shares = numpy.cumsum(numpy.where(buys, number, numpy.where(sells, -number, 0.0)))
+        #price of the buys and sells, it is used if there is no close price of that day
+        self.prices = numpy.where(buys | sells, gross / number, numpy.nan)
+        self.cum_dividends = numpy.concatenate([[0.0], numpy.cumsum(self.dividends)])
+
+
+class ReturnCalculator:
+    """
+    the return calculator holds the cached cashflows of each ticker
+    the cache of a ticker has to be invalidated if one of its investments changed
+    """
+    def __init__(self, func_get_trades:callable):
+        """
+        basic constructor is setting up an empty cache
+        :param func_get_trades: function<str<ticker symbol>: list<object<Investment>> sorted by date>
+        :return: void
+        """
+        assert(callable(func_get_trades)), STRINGS.getTypeErrorString(func_get_trades, "func_get_trades", "function")
+        self.func_get_trades = func_get_trades
+        self._cashflows:dict[str, TickerCashflows] = {}
+
+    def invalidate(self, ticker_symbol:str=None):
+        """
+        drops the cached cashflows of a ticker
+        :param ticker_symbol: str<ticker symbol> or None for all tickers
+        :return: void
+        """
+        if ticker_symbol == None:
+            self._cashflows = {}
+        else:
+            self._cashflows.pop(ticker_symbol, None)
+
+    def getMoneyWeighted(self, ticker_symbols:list[str], values:dict[str, float], day:datetime.date):
+        """
+        computes the money weighted returns (xirr), the current value of each position is the last cashflow
+        :param ticker_symbols: list<str<ticker symbol>>
+        :param values: dict<str<ticker symbol>: float<current value of the held shares>>
+        :param day: datetime.date<day of the current values>
+        :return: tuple<dict<str<ticker symbol>: float<yearly return>>, float<yearly return of the portfolio>>
+        """
+        flows = [self._getCashflows(ticker_symbol) for ticker_symbol in ticker_symbols]
+        #one row per ticker that is padded with zero cashflows, the current value is the last cashflow of the row
+        length = max([len(flow.days) for flow in flows], default=0) + 1
+        days = numpy.full((len(flows), length), day.toordinal(), dtype=numpy.int64)
+        amounts = numpy.zeros(days.shape, dtype=numpy.float64)
+        for row, (ticker_symbol, flow) in enumerate(zip(ticker_symbols, flows)):
+            days[row, :len(flow.days)] = flow.days
+            amounts[row, :len(flow.days)] = flow.amounts
+            amounts[row, len(flow.days)] = values.get(ticker_symbol, 0.0)
+        rates = solveXirr((days - days.min(axis=1, keepdims=True)) / DAYS_PER_YEAR, amounts)
+        #the portfolio is one row with all cashflows
+        all_days = numpy.concatenate([flow.days for flow in flows] + [[day.toordinal()]])[None, :]
+        total_value = sum(values.get(ticker_symbol, 0.0) for ticker_symbol in ticker_symbols)
+        all_amounts = numpy.concatenate([flow.amounts for flow in flows] + [[total_value]])[None, :]
+        portfolio = solveXirr((all_days - all_days.min()) / DAYS_PER_YEAR, all_amounts)
+        return {ticker_symbol: float(rates[row]) for row, ticker_symbol in enumerate(ticker_symbols)}, float(portfolio[0])
+
+    def getTimeWeighted(self, ticker_symbols:list[str], prices:dict[str, float], day:datetime.date, func_get_history:callable):
+        """
+        computes the time weighted returns, the periods are split at every day with a trade of any ticker
+        the value on a day uses the last close price of that day or before, the price of a trade if there is none
+        :param ticker_symbols: list<str<ticker symbol>>
+        :param prices: dict<str<ticker symbol>: float<current price>>
+        :param day: datetime.date<day of the current prices>
+        :param func_get_history: function<ticker symbol, start, end: tuple<numpy.ndarray<datetime64[D] dates>, numpy.ndarray<close prices>>>
+        :return: tuple<dict<str<ticker symbol>: float<return of the whole holding time>>, float<return of the portfolio>>
+        """
+        flows = [self._getCashflows(ticker_symbol) for ticker_symbol in ticker_symbols]
+        if flows == []:
+            return {}, numpy.nan
+        dates = numpy.union1d(numpy.concatenate([flow.days for flow in flows]), [day.toordinal()])
+        #matrices with one row per ticker and one column per date
+        shares_before = numpy.zeros((len(flows), len(dates)))
+        shares_after = numpy.zeros((len(flows), len(dates)))
+        dividends = numpy.zeros((len(flows), len(dates)))
+        price_matrix = numpy.full((len(flows), len(dates)), numpy.nan)
+        for row, (ticker_symbol, flow) in enumerate(zip(ticker_symbols, flows)):
+            before = numpy.searchsorted(flow.days, dates, side="left")
+            after = numpy.searchsorted(flow.days, dates, side="right")
+            shares = numpy.concatenate([[0.0], flow.shares])
+            shares_before[row] = shares[before]
+            shares_after[row] = shares[after]
+            dividends[row] = flow.cum_dividends[after] - flow.cum_dividends[before]
+            history_dates, closes = func_get_history(ticker_symbol, datetime.date.fromordinal(int(flow.days[0])), day)
+            if len(closes) > 0:
+                index = numpy.searchsorted(history_dates.astype("datetime64[D]").astype(numpy.int64) + datetime.date(1970, 1, 1).toordinal(), dates, side="right") - 1
+                price_matrix[row] = numpy.where(index >= 0, closes[numpy.maximum(index, 0)], numpy.nan)
+            #the price of a trade is used if there is no close price
+            trade_columns = numpy.searchsorted(dates, flow.days)
+            price_matrix[row, trade_columns] = numpy.where(numpy.isnan(price_matrix[row, trade_columns]), flow.prices, price_matrix[row, trade_columns])
+            if ticker_symbol in prices and not numpy.isnan(prices[ticker_symbol]):
+                price_matrix[row, -1] = prices[ticker_symbol]
+        with numpy.errstate(all="ignore"):
+            #a day without held shares has no value, even if there is no price
+            value_before = numpy.where(shares_before > 0, shares_before * price_matrix, 0.0) + dividends
+            value_after = numpy.where(shares_after > 0, shares_after * price_matrix, 0.0)
+            returns = self._getLinkedReturns(value_before, value_after)
+            portfolio = self._getLinkedReturns(value_before.sum(axis=0, keepdims=True), value_after.sum(axis=0, keepdims=True))
+        return {ticker_symbol: float(returns[row]) for row, ticker_symbol in enumerate(ticker_symbols)}, float(portfolio[0])
+
+    def _getLinkedReturns(self, value_before:numpy.ndarray, value_after:numpy.ndarray):
+        """
+        links the returns of the periods between the dates of each row
+        :param value_before: numpy.ndarray<2d value on each date before its trades, including the paid dividends>
+        :param value_after: numpy.ndarray<2d value on each date after its trades>
+        :return: numpy.ndarray<float64 return of each row>
+        """
+        start_values = value_after[:, :-1]
+        #a period that starts without value has no return
+        factors = numpy.where(start_values > 0, value_before[:, 1:] / start_values, 1.0)
+        return numpy.prod(factors, axis=1) - 1
+
+    def _getCashflows(self, ticker_symbol:str):
+        """
+        getter for the cached cashflows of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :return: object<TickerCashflows>
+        """
+        if not ticker_symbol in self._cashflows:
+            self._cashflows[ticker_symbol] = TickerCashflows(self.func_get_trades(ticker_symbol))
+        return self._cashflows[ticker_symbol]
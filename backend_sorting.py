@@ -0,0 +1,113 @@
+"""
+this module provides the sorted container that is used by the backend to keep the transactions and investments sorted
+instead of sorting the whole list after every change, the position of a new element is searched with bisect
+"""
+from bisect import bisect_left, bisect_right
+from strings import ENG as STRINGS
+from fullstack_utils import SortEnum
+
+
+class SortedOrders:
+    """
+    the sorted orders class holds the same elements in one ascending list for each sort key
+    an ordering is created the first time its key is used and is kept up to date afterwards,
+    so switching back to a key does not sort again
+    the key of each element is stored next to it, so it is computed only once per element
+    the direction is not part of the ordering, a descending order is the ascending list iterated backwards
+    """
+    def __init__(self, sort_keys:dict[SortEnum, callable], active:SortEnum):
+        """
+        basic constructor is setting up an empty container
+        :param sort_keys: dict<SortEnum: function<gets the sort key of an element>>
+        :param active: object<SortEnum<key of the ordering that is used by default>>
+        :return: void
+        """
+        assert(active in sort_keys), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(active)
+        self.sort_keys = sort_keys
+        self.active = active
+        self._orders:dict[SortEnum, tuple[list, list]] = {}     #(keys, elements) for each created ordering
+        self.reset([])
+
+    def reset(self, elements:list):
+        """
+        replaces all elements, only the active ordering is kept
+        :param elements: list<elements in any order>
+        :return: void
+        """
+        self._orders = {self.active: self._build(self.active, elements)}
+
+    def getElements(self, sortElement:SortEnum=None):
+        """
+        getter for the ascending list of an ordering, that is created if its not known yet
+        the list must not be changed from the outside
+        :param sortElement: object<SortEnum> or None for the active ordering
+        :return: list<elements>
+        """
+        if sortElement == None:
+            sortElement = self.active
+        assert(sortElement in self.sort_keys), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
+        if not sortElement in self._orders:
+            self._orders[sortElement] = self._build(sortElement, self._orders[self.active][1])
+        return self._orders[sortElement][1]
+
+    def setActive(self, sortElement:SortEnum):
+        """
+        switches the active ordering
+        :param sortElement: object<SortEnum>
+        :return: list<elements of the new active ordering>
+        """
+        elements = self.getElements(sortElement)
+        self.active = sortElement
+        return elements
+
+    def insert(self, element):
+        """
+        inserts a new element into all orderings, equal keys keep the insertion order
+        :param element: any<new element>
+        :return: void
+        """
+        for sortElement, (keys, elements) in self._orders.items():
+            key = self.sort_keys[sortElement](element)
+            index = bisect_right(keys, key)
+            keys.insert(index, key)
+            elements.insert(index, element)
+
+    def remove(self, element):
+        """
+        removes an element from all orderings
+        :param element: any<known element>
+        :return: void
+        """
+        for sortElement, (keys, elements) in self._orders.items():
+            key = self.sort_keys[sortElement](element)
+            index = bisect_left(keys, key)
+            #elements with the same key are next to each other, so only these have to be checked
+            while index < len(keys) and keys[index] == key and not elements[index] is element:
+                index += 1
+            assert(index < len(keys) and elements[index] is element), STRINGS.ERROR_ELEMENT_NOT_IN_ORDER+str(element)
+            del keys[index]
+            del elements[index]
+
+    def invalidate(self, sortElement:SortEnum):
+        """
+        should be called after the sort key of some elements changed
+        the active ordering is sorted again in place, any other ordering of that key is dropped
+        :param sortElement: object<SortEnum>
+        :return: void
+        """
+        if sortElement == self.active:
+            keys, elements = self._orders[sortElement]
+            keys[:], elements[:] = self._build(sortElement, elements)
+        else:
+            self._orders.pop(sortElement, None)
+
+    def _build(self, sortElement:SortEnum, elements:list):
+        """
+        sorts the elements by the given key
+        :param sortElement: object<SortEnum>
+        :param elements: list<elements in any order>
+        :return: tuple<list<keys>, list<elements>>
+        """
+        key_func = self.sort_keys[sortElement]
+        pairs = sorted(((key_func(element), element) for element in elements), key=lambda x: x[0])
+        return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
@@ -0,0 +1,398 @@
+"""
+this module provides a columnar store of the transactions that is used by the backend to filter and sort them fast
+the values of the transactions that can be filtered are kept in numpy arrays, so a filter is evaluated as boolean masks
+and a sort order is a cached permutation of the rows
+"""
+import numpy
+from PyQt5.QtCore import QDate
+from strings import ENG as STRINGS
+from backend_datatypes import Transaction, Product
+from fullstack_utils import Filter, SortEnum
+
+
+class GrowingArray:
+    """
+    a numpy array that can be appended to in amortized constant time
+    the capacity is doubled if its full
+    """
+    def __init__(self, dtype:type):
+        """
+        basic constructor is setting up an empty array
+        :param dtype: type<numpy dtype of the elements>
+        :return: void
+        """
+        self._data = numpy.empty(16, dtype=dtype)
+        self.size = 0
+
+    def append(self, value):
+        """
+        appends a value at the end of the array
+        :param value: any<value that fits the dtype>
+        :return: void
+        """
+        if self.size == len(self._data):
+            self._data = numpy.resize(self._data, 2 * len(self._data))
+        self._data[self.size] = value
+        self.size += 1
+
+    def extend(self, values:list):
+        """
+        appends many values at the end of the array
+        :param values: list<any<values that fit the dtype>>
+        :return: void
+        """
+        size = self.size + len(values)
+        if size > len(self._data):
+            self._data = numpy.resize(self._data, max(size, 2 * len(self._data)))
+        self._data[self.size:size] = values
+        self.size = size
+
+    def view(self):
+        """
+        gets the used part of the array (no copy)
+        :return: numpy.ndarray
+        """
+        return self._data[:self.size]
+
+    def keep(self, mask:numpy.ndarray):
+        """
+        removes all elements that are not selected, the order of the kept ones is not changed
+        :param mask: numpy.ndarray<bool<should the element be kept?>>
+        :return: void
+        """
+        kept = self.view()[mask]
+        self._data = numpy.resize(kept, max(16, 2 * len(kept)))
+        self.size = len(kept)
+
+
+class TransactionStore:
+    """
+    the transaction store holds the filterable values of all transactions column wise
+    every transaction gets a row, that is never reused. deleted transactions are only marked as not alive
+    if more than half of the rows are deleted, the store is compacted and the cached orders are dropped
+    the rows are found by the id of the transaction, the backend has to set it before a transaction is added
+    products and persons are integer coded, categories are evaluated per product, because they belong to the product
+    edits of persons and products update the affected codes, so the store never has to be rebuild while the program runs
+    the rows sorted by date, cashflow and product name are cached and new rows are inserted into the cached orders
+    """
+    def __init__(self, func_get_transactions:callable):
+        """
+        basic constructor is setting up an empty store
+        :param func_get_transactions: function<gets all transaction objects, used to rebuild the store>
+        :return: void
+        """
+        assert(callable(func_get_transactions)), STRINGS.getTypeErrorString(func_get_transactions, "func_get_transactions", "function")
+        self.func_get_transactions = func_get_transactions
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        builds the store from scratch with the current transactions
+        :return: void
+        """
+        self.rows = []                  #transaction object for each row
+        self.dead = 0                   #number of rows of deleted transactions
+        self.row_of = {}                #row for each transaction id
+        self.products = []              #product object for each product code
+        self.product_codes = {}         #product code for each product object
+        self.person_codes = {}          #person code for each lower case person name
+        self._next_person_code = 0      #code of the next new person, codes of deleted or renamed persons are never reused
+        self.alive = GrowingArray(numpy.bool_)
+        self.date = GrowingArray(numpy.int32)              #date ordinal
+        self.cashflow = GrowingArray(numpy.int64)               #minor units (cents)
+        self.cashflow_per_product = GrowingArray(numpy.int64)   #minor units (cents)
+        self.product = GrowingArray(numpy.int32)           #product code
+        #the persons are stored as (row, person code) pairs, because a transaction can have any number of persons
+        self.ftperson_row = GrowingArray(numpy.int32)
+        self.ftperson = GrowingArray(numpy.int32)
+        self.whyperson_row = GrowingArray(numpy.int32)
+        self.whyperson = GrowingArray(numpy.int32)
+        #cached (sorted keys, rows) for each sort element, deleted rows stay in there, they are excluded by the mask
+        self._orders:dict[SortEnum, tuple[numpy.ndarray, numpy.ndarray]] = {}
+        self._name_ranks = None         #position of each product code in the products sorted by lower case name
+        self.addMany(list(self.func_get_transactions()))
+
+    def renamePerson(self, person_name:str, new_person_name:str):
+        """
+        changes the name of a person code (ignoring case)
+        if the new name has already a code, the entries of the old code are moved to that code
+        :param person_name: str<old name of the person>
+        :param new_person_name: str<new name of the person>
+        :return: void
+        """
+        person_name = person_name.lower()
+        new_person_name = new_person_name.lower()
+        if not person_name in self.person_codes:
+            return
+        code = self.person_codes.pop(person_name)
+        if new_person_name in self.person_codes:
+            new_code = self.person_codes[new_person_name]
+            for person in (self.ftperson, self.whyperson):
+                codes = person.view()
+                codes[codes == code] = new_code
+        else:
+            self.person_codes[new_person_name] = code
+
+    def deletePerson(self, person_name:str):
+        """
+        forgets the code of a person, so the filter cannot match the old entries anymore
+        a new person with the same name gets a new code
+        :param person_name: str<name of the person>
+        :return: void
+        """
+        self.person_codes.pop(person_name.lower(), None)
+
+    def getTransaction(self, transaction_id:int):
+        """
+        getter for the transaction of an id
+        :param transaction_id: int<id of the transaction>
+        :return: object<Transaction> or None if there is no transaction with that id
+        """
+        row = self.row_of.get(transaction_id)
+        return None if row == None else self.rows[row]
+
+    def setProduct(self, transaction:Transaction):
+        """
+        updates the product code of a transaction, should be called if the product object of the transaction changed
+        :param transaction: object<Transaction>
+        :return: void
+        """
+        assert(transaction.id in self.row_of), STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(transaction)
+        self.product.view()[self.row_of[transaction.id]] = self._getProductCode(transaction.product)
+        self.invalidateOrder(SortEnum.NAME)
+
+    def invalidateOrder(self, sortElement:SortEnum):
+        """
+        drops a cached order, should be called if the sort key of some rows changed (for example a product was renamed)
+        the order is created again the next time its needed
+        :param sortElement: object<SortEnum>
+        :return: void
+        """
+        self._orders.pop(sortElement, None)
+        if sortElement == SortEnum.NAME:
+            self._name_ranks = None
+
+    def getOrder(self, sortElement:SortEnum):
+        """
+        getter for all rows sorted ascending by the given element, equal keys are in the order they were added
+        the rows of deleted transactions are included
+        :param sortElement: object<SortEnum>
+        :return: numpy.ndarray<int<row>>
+        """
+        assert(type(sortElement) == SortEnum), STRINGS.getTypeErrorString(sortElement, "sortElement", SortEnum)
+        if not sortElement in self._orders:
+            keys = self._getSortKeys(sortElement)
+            rows = numpy.argsort(keys, kind="stable")
+            self._orders[sortElement] = (keys[rows], rows)
+        return self._orders[sortElement][1]
+
+    def add(self, transaction:Transaction):
+        """
+        adds a new transaction to the store
+        :param transaction: object<Transaction>
+        :return: void
+        """
+        assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
+        row = len(self.rows)
+        self.rows.append(transaction)
+        self.row_of[transaction.id] = row
+        self.alive.append(True)
+        self.date.append(transaction.date.toordinal())
+        self.cashflow.append(transaction.cashflow_cents)
+        self.cashflow_per_product.append(transaction.cashflow_per_product_cents)
+        self.product.append(self._getProductCode(transaction.product))
+        #insert the row into the cached orders, after all rows with the same key
+        for sortElement, (keys, rows) in list(self._orders.items()):
+            key = self._getSortKeys(sortElement)[row]
+            index = numpy.searchsorted(keys, key, side="right")
+            self._orders[sortElement] = (numpy.insert(keys, index, key), numpy.insert(rows, index, row))
+        for person in transaction.from_to_persons:
+            self.ftperson_row.append(row)
+            self.ftperson.append(self._getPersonCode(person.name))
+        for person in transaction.why_persons:
+            self.whyperson_row.append(row)
+            self.whyperson.append(self._getPersonCode(person.name))
+
+    def addMany(self, transactions:list[Transaction]):
+        """
+        adds many new transactions to the store
+        the columns are extended at once and the cached orders are dropped, so they are sorted once the next time they are needed
+        :param transactions: list<object<Transaction>>
+        :return: void
+        """
+        assert(all(map(lambda x: type(x) == Transaction, transactions))), STRINGS.getListTypeErrorString(transactions, "transactions", Transaction)
+        self._orders = {}
+        rows = range(len(self.rows), len(self.rows) + len(transactions))
+        self.rows += transactions
+        self.row_of.update(zip([transaction.id for transaction in transactions], rows))
+        self.alive.extend(numpy.ones(len(transactions), dtype=numpy.bool_))
+        self.date.extend([transaction.date.toordinal() for transaction in transactions])
+        self.cashflow.extend([transaction.cashflow_cents for transaction in transactions])
+        self.cashflow_per_product.extend([transaction.cashflow_per_product_cents for transaction in transactions])
+        self.product.extend([self._getProductCode(transaction.product) for transaction in transactions])
+        self.ftperson_row.extend([row for row, transaction in zip(rows, transactions) for _ in transaction.from_to_persons])
+        self.ftperson.extend([self._getPersonCode(person.name) for transaction in transactions for person in transaction.from_to_persons])
+        self.whyperson_row.extend([row for row, transaction in zip(rows, transactions) for _ in transaction.why_persons])
+        self.whyperson.extend([self._getPersonCode(person.name) for transaction in transactions for person in transaction.why_persons])
+
+    def delete(self, transaction:Transaction):
+        """
+        marks the row of a transaction as deleted
+        an edit is a delete and an add, so the store is compacted if the deleted rows are the majority
+        :param transaction: object<Transaction>
+        :return: void
+        """
+        assert(transaction.id in self.row_of), STRINGS.ERROR_TRANSACTION_NOT_IN_LIST+str(transaction)
+        self.alive.view()[self.row_of.pop(transaction.id)] = False
+        self.dead += 1
+        if 2 * self.dead > len(self.rows):
+            self._compact()
+
+    def _compact(self):
+        """
+        removes the rows of the deleted transactions, the order of the other rows is kept
+        the cached orders contain the old rows, so they are dropped
+        :return: void
+        """
+        alive = self.alive.view().copy()
+        #new row of each old row (only valid for the alive ones)
+        new_row = numpy.cumsum(alive, dtype=numpy.int32) - 1
+        self.rows = [transaction for transaction, is_alive in zip(self.rows, alive) if is_alive]
+        self.row_of = {transaction.id: row for row, transaction in enumerate(self.rows)}
+        for column in (self.alive, self.date, self.cashflow, self.cashflow_per_product, self.product):
+            column.keep(alive)
+        for person_row, person in ((self.ftperson_row, self.ftperson), (self.whyperson_row, self.whyperson)):
+            kept = alive[person_row.view()]
+            person.keep(kept)
+            person_row.keep(kept)
+            person_row.view()[:] = new_row[person_row.view()]
+        self.dead = 0
+        self._orders = {}
+
+    def getMask(self, filter:Filter):
+        """
+        evaluates the filter for all rows at once
+        :param filter: object<Filter>
+        :return: numpy.ndarray<bool<is the transaction of that row valid with the filter applied?>>
+        """
+        assert(type(filter) == Filter), STRINGS.getTypeErrorString(filter, "filter", Filter)
+        mask = self.alive.view().copy()
+        date = self.date.view()
+        mask &= (date >= self._toOrdinal(filter.minDate)) & (date <= self._toOrdinal(filter.maxDate))
+
+        cashflow = self.cashflow.view()
+        cashflow_per_product = self.cashflow_per_product.view()
+        if filter.absoluteValues:
+            cashflow = numpy.abs(cashflow)
+            cashflow_per_product = numpy.abs(cashflow_per_product)
+        for bound, values, is_min in ((filter.minCashflow, cashflow, True), (filter.maxCashflow, cashflow, False),
+                                      (filter.minCashflowPerProduct, cashflow_per_product, True), (filter.maxCashflowPerProduct, cashflow_per_product, False)):
+            if type(bound) == bool:
+                #filter not set
+                continue
+            if filter.absoluteValues:
+                bound = abs(bound)
+            mask &= (values >= bound) if is_min else (values <= bound)
+
+        #product name and categories are the same for all transactions of a product, so they are evaluated once per product
+        mask &= self._getProductTable(filter)[self.product.view()]
+
+        if filter.ftpersons != []:
+            mask &= self._getPersonMask(filter.ftpersons, self.ftperson_row, self.ftperson)
+        if filter.whypersons != []:
+            mask &= self._getPersonMask(filter.whypersons, self.whyperson_row, self.whyperson)
+        if filter.persons != []:
+            mask &= self._getPersonMask(filter.persons, self.ftperson_row, self.ftperson) | self._getPersonMask(filter.persons, self.whyperson_row, self.whyperson)
+        return mask
+
+    def getCashflowSum(self, mask:numpy.ndarray):
+        """
+        sums the cashflows of some rows, the sum is exact because the cashflows are integers
+        :param mask: numpy.ndarray<bool<should the row be summed?>> like returned by getMask
+        :return: int<sum of the cashflows in minor units>
+        """
+        return int(self.cashflow.view()[mask].sum())
+
+    def _getProductTable(self, filter:Filter):
+        """
+        evaluates the product name and category filters for each product code
+        :param filter: object<Filter>
+        :return: numpy.ndarray<bool<is the product valid with the filter applied?>>
+        """
+        contains = filter.contains.lower()
+        startswith = filter.startswith.lower()
+        categories = set(map(lambda x: x.lower(), filter.categories))
+        table = numpy.empty(len(self.products) + 1, dtype=numpy.bool_)   #one extra element, so its never empty
+        for code, product in enumerate(self.products):
+            name = product.name.lower()
+            table[code] = contains in name and name.startswith(startswith) and \
+                (categories == set() or any(map(lambda x: x.lower() in categories, product.categories)))
+        return table
+
+    def _getPersonMask(self, person_names:list[str], person_row:GrowingArray, person:GrowingArray):
+        """
+        gets the rows, that have at least one of the given persons
+        :param person_names: list<str<person name1>, ...>
+        :param person_row: object<GrowingArray<row of each person entry>>
+        :param person: object<GrowingArray<person code of each person entry>>
+        :return: numpy.ndarray<bool<has the row one of the persons?>>
+        """
+        codes = [self.person_codes[name.lower()] for name in person_names if name.lower() in self.person_codes]
+        mask = numpy.zeros(len(self.rows), dtype=numpy.bool_)
+        mask[person_row.view()[numpy.isin(person.view(), codes)]] = True
+        return mask
+
+    def _getProductCode(self, product:Product):
+        """
+        gets the code of a product object, a new code is created for unknown products
+        :param product: object<Product>
+        :return: int<product code>
+        """
+        if not product in self.product_codes:
+            self.product_codes[product] = len(self.products)
+            self.products.append(product)
+            #the new product changes the name ranks
+            self.invalidateOrder(SortEnum.NAME)
+        return self.product_codes[product]
+
+    def _getSortKeys(self, sortElement:SortEnum):
+        """
+        gets the sort key of each row
+        the name key is the rank of the product name, so the names are only lowered once per product
+        :param sortElement: object<SortEnum>
+        :return: numpy.ndarray<key of each row>
+        """
+        if sortElement == SortEnum.DATE:
+            return self.date.view()
+        elif sortElement == SortEnum.CASHFLOW:
+            return self.cashflow.view()
+        elif sortElement == SortEnum.NAME:
+            if self._name_ranks is None:
+                names = [product.name.lower() for product in self.products]
+                self._name_ranks = numpy.empty(len(names), dtype=numpy.int32)
+                self._name_ranks[sorted(range(len(names)), key=names.__getitem__)] = numpy.arange(len(names), dtype=numpy.int32)
+            return self._name_ranks[self.product.view()]
+        assert(False), STRINGS.ERROR_SORTELEMENT_OUT_OF_RANGE+str(sortElement)
+
+    def _getPersonCode(self, person_name:str):
+        """
+        gets the code of a person name (ignoring case), a new code is created for unknown names
+        :param person_name: str<name of the person>
+        :return: int<person code>
+        """
+        person_name = person_name.lower()
+        if not person_name in self.person_codes:
+            #the size of the dict cannot be used, because renamed and deleted persons are removed from it
+            self.person_codes[person_name] = self._next_person_code
+            self._next_person_code += 1
+        return self.person_codes[person_name]
+
+    def _toOrdinal(self, date:QDate):
+        """
+        converts a date of the filter to its ordinal
+        :param date: QDate or datetime.date
+        :return: int<ordinal>
+        """
+        if type(date) == QDate:
+            date = date.toPyDate()
+        return date.toordinal()
@@ -0,0 +1,120 @@
+"""
+this module provides the ticker cache that is used by the backend to validate investments without the api
+the metadata of each ticker that was loaded once is stored in an encrypted file next to the data file
+"""
+import time
+import pickle
+from threading import Lock
+from cryptography.fernet import Fernet
+from strings import ENG as STRINGS
+from backend_journal import writeFileAtomic
+
+
+class TickerMetadata:
+    """
+    the ticker metadata contains the short name, currency and quote type of a ticker and the time it was fetched
+    """
+    def __init__(self, short_name:str, currency:str, quote_type:str, fetch_time:float):
+        """
+        basic constructor
+        saves the arguments into the object
+        :param short_name: str<short name of the asset according to yahoo.ticker.quote_type["shortName"]>
+        :param currency: str<currency of the asset according to yahoo.ticker.price["currency"]>
+        :param quote_type: str<type of the asset (EQUITY, ETF, ...) according to yahoo.ticker.quote_type["quoteType"]>
+        :param fetch_time: float<unix time of the api response>
+        :return: void
+        """
+        assert(type(short_name) == str), STRINGS.getTypeErrorString(short_name, "short_name", str)
+        assert(type(currency) == str), STRINGS.getTypeErrorString(currency, "currency", str)
+        assert(type(quote_type) == str), STRINGS.getTypeErrorString(quote_type, "quote_type", str)
+        assert(type(fetch_time) == float), STRINGS.getTypeErrorString(fetch_time, "fetch_time", float)
+        self.short_name = short_name
+        self.currency = currency
+        self.quote_type = quote_type
+        self.fetch_time = fetch_time
+
+
+class TickerCache:
+    """
+    the ticker cache holds the metadata of all tickers that were loaded from the api
+    an entry is fresh for the time to live, afterwards the ticker should be loaded again
+    a stale entry is still returned if the api is not reachable, so known assets can be traded offline
+    changes are only kept in memory until the save worker writes them
+    """
+    def __init__(self, path:str, ttl:float):
+        """
+        basic constructor is setting up an empty cache for the given file
+        :param path: str<path of the cache file>
+        :param ttl: float<seconds an entry is fresh>
+        :return: void
+        """
+        assert(type(path) == str), STRINGS.getTypeErrorString(path, "path", str)
+        assert(type(ttl) == float), STRINGS.getTypeErrorString(ttl, "ttl", float)
+        self.path = path
+        self.ttl = ttl
+        self._entries:dict[str, TickerMetadata] = {}
+        self._dirty = False     #there are changes that are not written yet
+        self._lock = Lock()     #protects the entries
+        self._key = None
+
+    def setKey(self, key:bytes):
+        """
+        setter for the key that is used to encrypt and decrypt the cache file
+        :param key: bytes<fernet key>
+        :return: void
+        """
+        assert(type(key) == bytes), STRINGS.getTypeErrorString(key, "key", bytes)
+        self._key = key
+
+    def load(self):
+        """
+        loads the entries from the cache file, a missing or unreadable file results in an empty cache
+        :return: void
+        """
+        try:
+            with open(self.path, "rb") as cache_file:
+                entries = pickle.loads(Fernet(self._key).decrypt(cache_file.read()))
+        except:
+            #the cache only saves api calls, so its fine to start without it
+            print("no ticker cache to load from found")
+            entries = {}
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+
+    def get(self, ticker_symbol:str, stale:bool=False):
+        """
+        getter for the metadata of a ticker
+        :param ticker_symbol: str<ticker symbol>
+        :param stale: bool<should an entry be returned that is older than the time to live?>
+        :return: object<TickerMetadata> or None if there is no (fresh) entry
+        """
+        with self._lock:
+            metadata = self._entries.get(ticker_symbol.lower())
+        if metadata == None or (not stale and time.time() - metadata.fetch_time > self.ttl):
+            return None
+        return metadata
+
+    def set(self, ticker_symbol:str, metadata:TickerMetadata):
+        """
+        setter for the metadata of a ticker, that gets written with the next call of write
+        :param ticker_symbol: str<ticker symbol>
+        :param metadata: object<TickerMetadata>
+        :return: void
+        """
+        assert(type(metadata) == TickerMetadata), STRINGS.getTypeErrorString(metadata, "metadata", TickerMetadata)
+        with self._lock:
+            self._entries[ticker_symbol.lower()] = metadata
+            self._dirty = True
+
+    def write(self):
+        """
+        writes the cache file if there are changes
+        :return: void
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            dumped_data = pickle.dumps(self._entries)
+            self._dirty = False
+        writeFileAtomic(self.path, Fernet(self._key).encrypt(dumped_data))
@@ -0,0 +1,150 @@
+"""
+this module provides the valuation engine that is used by the backend to mark the current positions to market
+the prices of all held tickers are loaded with one batched request of the quote provider,
+the values and profits of all positions are computed at once with numpy
+"""
+import time
+import datetime
+from threading import Lock
+from concurrent.futures import Future
+import numpy
+from strings import ENG as STRINGS
+from constants import CONSTANTS
+from backend_quotes import QuoteProvider
+
+
+class PortfolioValuation:
+    """
+    the portfolio valuation contains the market value and unrealized profit of each position at one point in time
+    all arrays have the same order as the ticker symbols, a position without a price has nan values
+    """
+    def __init__(self, tickers:list[str], shares:numpy.ndarray, costs:numpy.ndarray, prices:numpy.ndarray, valuation_time:float):
+        """
+        basic constructor
+        computes the values and profits of all positions
+        :param tickers: list<str<ticker symbol>>
+        :param shares: numpy.ndarray<float64 number of shares held>
+        :param costs: numpy.ndarray<float64 cost basis of the held shares>
+        :param prices: numpy.ndarray<float64 last close price, nan if unknown>
+        :param valuation_time: float<unix time of the price request>
+        :return: void
+        """
+        assert(len(tickers) == len(shares) == len(costs) == len(prices)), STRINGS.ERROR_WRONG_DATA_LENGTH+str(len(tickers))
+        self.tickers = tickers
+        self.shares = shares
+        self.costs = costs
+        self.prices = prices
+        self.values = shares * prices
+        self.profits = self.values - costs
+        self.time = valuation_time
+        #positions without a price are left out of the totals
+        priced = ~numpy.isnan(prices)
+        self.total_value = float(self.values[priced].sum())
+        self.total_profit = float(self.profits[priced].sum())
+        self.missing = [ticker for ticker, has_price in zip(tickers, priced) if not has_price]
+
+
+class ValuationEngine:
+    """
+    the valuation engine loads the prices of all positions with one request and builds a new portfolio valuation
+    only one refresh runs at a time, a refresh that is requested while another one runs gets the future of the running one
+    if the positions changed in the meantime, one more refresh with the newest positions is started after the running one
+    """
+    def __init__(self, quote_provider:QuoteProvider):
+        """
+        basic constructor is setting up the engine without a valuation
+        :param quote_provider: object<QuoteProvider> that gets the prices
+        :return: void
+        """
+        assert(isinstance(quote_provider, QuoteProvider)), STRINGS.getTypeErrorString(quote_provider, "quote_provider", QuoteProvider)
+        self.quote_provider = quote_provider
+        self.last:PortfolioValuation = None     #the last finished valuation
+        self._running:Future = None             #the refresh that is currently running
+        self._running_positions:dict[str, tuple[float, float]] = None   #positions of the running refresh
+        self._queued:Future = None              #the refresh that starts after the running one or None
+        self._queued_positions:dict[str, tuple[float, float]] = None    #newest positions for the queued refresh
+        self._lock = Lock()                     #protects the running and queued refresh
+
+    def refresh(self, positions:dict[str, tuple[float, float]]):
+        """
+        starts a refresh of the valuation, it doesnt block
+        :param positions: dict<str<ticker symbol>: tuple<float<shares held>, float<cost basis>>>
+        :return: object<Future<PortfolioValuation>>
+        """
+        with self._lock:
+            if self._running != None and not self._running.done():
+                if positions == self._running_positions and self._queued == None:
+                    return self._running
+                #the positions changed while the refresh runs, so it would value the old ones
+                if self._queued == None:
+                    self._queued = Future()
+                self._queued_positions = positions
+                return self._queued
+            result = Future()
+            self._running = result
+            self._running_positions = positions
+        self._start(result, positions)
+        return result
+
+    def _start(self, result:Future, positions:dict[str, tuple[float, float]]):
+        """
+        starts the price request of a refresh
+        :param result: object<Future<PortfolioValuation>> of the refresh
+        :param positions: dict<str<ticker symbol>: tuple<float<shares held>, float<cost basis>>>
+        :return: void
+        """
+        tickers = list(positions.keys())
+        shares = numpy.array([positions[ticker][0] for ticker in tickers], dtype=numpy.float64)
+        costs = numpy.array([positions[ticker][1] for ticker in tickers], dtype=numpy.float64)
+        if tickers == []:
+            self._finish(result, PortfolioValuation(tickers, shares, costs, shares.copy(), time.time()))
+            return
+        #the last close is searched in a few days back, so weekends and holidays have a price too
+        end = datetime.date.today()
+        start = end - datetime.timedelta(days=CONSTANTS.VALUATION_LOOKBACK_DAYS)
+        request = self.quote_provider.submitPrices(tickers, start, end)     #one request for all positions
+        request.add_done_callback(lambda request: self._onPrices(request, result, tickers, shares, costs))
+
+    def _onPrices(self, request:Future, result:Future, tickers:list[str], shares:numpy.ndarray, costs:numpy.ndarray):
+        """
+        gets called on the thread of the quote provider if the prices are loaded
+        :param request: object<Future<prices of the quote provider>>
+        :param result: object<Future<PortfolioValuation>> of the refresh
+        :param tickers: list<str<ticker symbol>>
+        :param shares: numpy.ndarray<float64 number of shares held>
+        :param costs: numpy.ndarray<float64 cost basis of the held shares>
+        :return: void
+        """
+        try:
+            loaded = request.result()
+        except Exception as e:
+            #the last valuation is kept
+            self._finish(result, exception=e)
+            return
+        prices = numpy.full(len(tickers), numpy.nan, dtype=numpy.float64)
+        for index, ticker in enumerate(tickers):
+            if ticker in loaded and len(loaded[ticker][1]) > 0:
+                prices[index] = loaded[ticker][1][-1]
+        self._finish(result, PortfolioValuation(tickers, shares, costs, prices, time.time()))
+
+    def _finish(self, result:Future, valuation:PortfolioValuation=None, exception:Exception=None):
+        """
+        saves a finished valuation and starts the queued refresh
+        :param result: object<Future<PortfolioValuation>> of the refresh
+        :param valuation: object<PortfolioValuation> or None if the refresh failed
+        :param exception: object<Exception> if the refresh failed
+        :return: void
+        """
+        with self._lock:
+            #the queued refresh becomes the running one before the result is set, so no other refresh can start in between
+            queued, positions = self._queued, self._queued_positions
+            if queued != None:
+                self._running, self._running_positions = queued, positions
+                self._queued, self._queued_positions = None, None
+        if valuation != None:
+            self.last = valuation
+            result.set_result(valuation)
+        else:
+            result.set_exception(exception)
+        if queued != None:
+            self._start(queued, positions)
@@ -1,3 +1,21 @@
-
 class CONSTANTS:
-    MAX_COMBOS = 5
\ No newline at end of file
+    MAX_COMBOS = 5
+    DATA_FILE = "data.fin"              #snapshot of all user data
+    JOURNAL_FILE = "data.fin.journal"   #mutations since the last snapshot
+    TICKER_CACHE_FILE = "data.fin.tickers" #metadata of the tickers loaded from the api
+    TICKER_CACHE_TTL = 604800.0         #seconds until the metadata of a ticker is loaded again (one week)
+    PRICE_HISTORY_DIR = "data.fin.prices" #daily close prices of the tickers, one file per ticker
+    QUOTE_WORKERS = 4                   #requests of a quote provider that can run at once
+    QUOTE_RETRIES = 2                   #attempts of a failed quote request after the first one
+    QUOTE_BACKOFF = 0.5                 #seconds before the first retry of a quote request, doubled for every further retry
+    VALUATION_LOOKBACK_DAYS = 10        #days of prices that are loaded to find the last close of an asset
+    VALUATION_REFRESH_INTERVAL = 60000  #milliseconds between two refreshes of the portfolio value
+    RETURNS_TIMEOUT = 30.0              #seconds the time weighted return waits for missing prices, the stored ones are used afterwards
+    JOURNAL_MAX_RECORDS = 1000          #the journal gets compacted into a new snapshot after that many records
+    SAVE_DEBOUNCE = 0.5                 #seconds without changes before the changes are saved
+    SAVE_MAX_DELAY = 5.0                #maximum seconds a change waits to be saved
+    SAVE_RETRY_BACKOFF = 1.0            #seconds before a failed save is tried again, doubled for every further failure
+    SAVE_MAX_RETRY_BACKOFF = 60.0       #maximum seconds between two attempts of a failing save
+    MONEY_MINOR_UNITS = 100             #smallest units (cents) of one currency unit, all money amounts are stored as integers of them
+    CSV_CHUNK_SIZE = 10000              #rows of a csv file that are parsed at once while importing
+    MAX_IMPORT_ERRORS_SHOWN = 20        #skipped rows of an import that are listed in the message box
@@ -3,6 +3,7 @@ this module provides some utility functions and datatypes that can be used in fr
 """
 from enum import Enum
 from strings import ENG as STRINGS
+from constants import CONSTANTS
 from PyQt5.QtWidgets import QLineEdit
 from PyQt5.QtCore import QDate
 
@@ -59,6 +60,33 @@ class utils:
             value = 0.0
         return value
 
+    def toCents(value:float):
+        """
+        converts a money amount into its integer number of minor units (cents), so sums of amounts are exact
+        :param value: float<money amount in currency units>
+        :return: int<money amount in minor units>
+        """
+        return int(round(value * CONSTANTS.MONEY_MINOR_UNITS))
+
+    def fromCents(cents:int):
+        """
+        converts an integer number of minor units (cents) into a money amount
+        :param cents: int<money amount in minor units>
+        :return: float<money amount in currency units>
+        """
+        return cents / CONSTANTS.MONEY_MINOR_UNITS
+
+    def formatCents(cents:int):
+        """
+        formats an integer number of minor units (cents) with all its decimal places, without any rounding of floats
+        :param cents: int<money amount in minor units>
+        :return: str<money amount in currency units, e.g. "-7.05">
+        """
+        decimals = len(str(CONSTANTS.MONEY_MINOR_UNITS)) - 1
+        units, minor = divmod(abs(int(cents)), CONSTANTS.MONEY_MINOR_UNITS)
+        sign = "-" if cents < 0 else ""
+        return f"{sign}{units}.{minor:0{decimals}d}" if decimals > 0 else f"{sign}{units}"
+
 class SortEnum(Enum):
     """
     this enum holds the flags for the sort criteria
@@ -67,11 +95,19 @@ class SortEnum(Enum):
     CASHFLOW = 1
     NAME = 2
 
+class LotMethod(Enum):
+    """
+    this enum holds the flags for the methods that match sold shares to bought shares
+    """
+    FIFO = 0        #the shares that were bought first are sold first
+    AVERAGE = 1     #all held shares have the average cost
+
 
 class Filter:
     """
     the filter class is containing filter settings for transactions
     its used to filter or search for specific transactions
+    the cashflow filters are stored in minor units (cents) or False if they are not set
     """
     def __init__(self):
         """
@@ -167,7 +203,7 @@ class Filter:
         :return: void
         """
         assert(type(minCashflow) in [float, bool]), STRINGS.getTypeErrorString(minCashflow, "minCashflow", "float or bool")
-        self.minCashflow = minCashflow
+        self.minCashflow = minCashflow if type(minCashflow) == bool else utils.toCents(minCashflow)
 
     def setMaxCashflow(self, maxCashflow:float):
         """
@@ -176,7 +212,7 @@ class Filter:
         :return: void
         """
         assert(type(maxCashflow) in [float, bool]), STRINGS.getTypeErrorString(maxCashflow, "maxCashflow", "float or bool")
-        self.maxCashflow = maxCashflow
+        self.maxCashflow = maxCashflow if type(maxCashflow) == bool else utils.toCents(maxCashflow)
 
     def setMinCashflowPerProduct(self, minCashflowPerProduct:float):
         """
@@ -185,7 +221,7 @@ class Filter:
         :return: void
         """
         assert(type(minCashflowPerProduct) in [float, bool]), STRINGS.getTypeErrorString(minCashflowPerProduct, "minCashflowPerProduct", "float or bool")
-        self.minCashflowPerProduct = minCashflowPerProduct
+        self.minCashflowPerProduct = minCashflowPerProduct if type(minCashflowPerProduct) == bool else utils.toCents(minCashflowPerProduct)
 
     def setMaxCashflowPerProduct(self, maxCashflowPerProduct:float):
         """
@@ -194,7 +230,7 @@ class Filter:
         :return: void
         """
         assert(type(maxCashflowPerProduct) in [float, bool]), STRINGS.getTypeErrorString(maxCashflowPerProduct, "maxCashflowPerProduct", "float or bool")
-        self.maxCashflowPerProduct = maxCashflowPerProduct
+        self.maxCashflowPerProduct = maxCashflowPerProduct if type(maxCashflowPerProduct) == bool else utils.toCents(maxCashflowPerProduct)
 
     def setAbsoluteValues(self, absoluteValues:bool):
         """
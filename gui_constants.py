@@ -48,5 +48,6 @@ class COLORS:
     all colors that are used in the program are stored here
     """
     RED = "#ff0000"
+    DARK_RED = "#550000"
     GREEN = "#007700"
     BLUE = "#0000ff"
\ No newline at end of file
@@ -6,4 +6,6 @@ App = QApplication(sys.argv)    #have to construct a Application first
 from ui import Window
 
 window = Window()
-sys.exit(App.exec())
\ No newline at end of file
+ret = App.exec()
+window.backend.flush()  #writes the changes that are not saved yet
+sys.exit(ret)
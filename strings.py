@@ -187,6 +187,15 @@ class ENG:
     INVFORM_LAST_INVESTMENTS_DATE = "Date"
     INVFORM_LAST_INVESTMENTS_CASHFLOW = "Cashflow"
     INVFORM_LAST_INVESTMENTS_ASSET = "Asset"
+    INVFORM_LABEL_VALUATION = "Portfolio value: "
+    INVFORM_LABEL_VALUATION_LOADING = "Portfolio value: loading prices..."
+    INVFORM_LABEL_VALUATION_PROFIT = "Unrealized profit: "
+    INVFORM_LABEL_VALUATION_MISSING = "No price for: "
+    INVFORM_LABEL_RETURN_MONEY_WEIGHTED = "Money weighted return: "
+    INVFORM_LABEL_RETURN_TIME_WEIGHTED = "Time weighted return: "
+    INVFORM_LABEL_RETURN_LOADING = "loading prices..."
+    INVFORM_LABEL_RETURN_UNKNOWN = "unknown"
+    INVFORM_LABEL_RETURN_PER_YEAR = " per year"
 
     INVFORM_LABEL_EDIT_INVESTMENT = "Edit investment"
     INVFORM_BUTTON_EDIT_INVESTMENT_SUBMIT = "Save changes"
@@ -227,11 +236,13 @@ class ENG:
     WARNING_EXPORT_TRANSACTIONS_TITLE = "WARNING Export transactions"
     WARNING_EXPORT_TRANSACTIONS = "Please note that you only export the transactions.\nSettings, person categories, etc. are NOT saved\nIf you wanna save all data, please #WORK"
     WARNING_IMPORT_TRANSACTIONS_TITLE = "WARNING Import transactions"
+    WARNING_IMPORT_ROWS_SKIPPED_TITLE = "WARNING Some transactions were not imported"
+    WARNING_IMPORT_ROWS_SKIPPED = " rows of the csv file are not valid and were skipped:\n"
     WARNING_IMPORT_TRANSACTIONS = "Please note that all data currently saved in the app could be lost\n All transactions currently stored in the app will be DELETED\nIf you wanna save your old transactions export them first\nYou should also consider to save all data before importing"
 
     #critical
     CRITICAL_IMPORT_TRANSACTIONS_TITLE = "Error importing transactions"
-    CRITICAL_IMPORT_TRANSACTIONS = "Some errors are occured while importing the transactions.\nThe csv file was probably not in the right format\nYour data got lost due to this error, please load your backup (your full data backup) that you have made (hopefully :))"
+    CRITICAL_IMPORT_TRANSACTIONS = "Some errors are occured while importing the transactions.\nThe csv file was probably not in the right format\nYour transactions were not changed"
     CRITICAL_ADD_INVESTMENT_TITLE = "Error while adding the investment"
     CRITICAL_SUBMIT_FILTER = "Error while processing the filter"
 
@@ -278,6 +289,9 @@ class ENG:
     ERROR_TRADINGFEE_LESS_ZERO = "The tradingfee is below zero: "
     ERROR_TAX_LESS_ZERO = "The tax is below zero: "
     ERROR_CASHFLOW_ZERO = "The given Cashflow is zero: "
+    ERROR_IMPORT_INVALID_DATE = "The date is not in the format yyyy-mm-dd or in the future: "
+    ERROR_IMPORT_INVALID_NUMBER = "The number of products is not a whole number greater than zero: "
+    ERROR_IMPORT_INVALID_CASHFLOW = "The cashflow is not a number or zero: "
     ERROR_NOT_ALL_CATEGORIES_ARE_VALID = "There are some categories, which are not in the database: "
     ERROR_NOT_ALL_FTPERSONS_ARE_VALID = "There are some from/to persons, which are not in the database: "
     ERROR_NOT_ALL_WHYPERSONS_ARE_VALID = "There are some why persons, which are not in the database: "
@@ -291,14 +305,19 @@ class ENG:
     ERROR_PRODUCT_ALREADY_KNOWN = "The product that should be added is already known to the system: "
     ERROR_NO_PRODUCT_FOUND = "No product found with name: "
     ERROR_BUTTON_NOT_FOUND = "The provided button is not found in the button list"
+    ERROR_ROW_NOT_FOUND = "The provided row is not found in the list: "
     ERROR_TRANSACTION_OUT_OF_RANGE = "the transaction index is out of range, should be as long as buttons"
     ERROR_NOT_IN_EDIT_MODE = "The action cannot be done because the window is not in edit mode"
     ERROR_IN_EDIT_MODE = "The action cannot be done because the window is in edit mode"
-    ERROR_NO_TRANSACTION_BUTTON_SET = "There is no active transaction button set"
+    ERROR_NO_TRANSACTION_BUTTON_SET = "There is no active transaction set"
+    ERROR_NO_INVESTMENT_BUTTON_SET = "There is no active investment set"
     ERROR_TRANSACTION_NOT_IN_LIST = "The given transaction is not found in the transaction list: "
     ERROR_INVESTMENT_NOT_IN_LIST = "The given investment is not found in the investment list: "
+    ERROR_NOT_IMPLEMENTED = "This method has to be implemented by the subclass: "
+    ERROR_TICKER_NOT_IN_LEDGER = "The given ticker has no trades in the ledger: "
     ERROR_SENDER_NOT_IN_SORT_BUTTONS = "The sender button is not part of the sort button list"
     ERROR_SORTELEMENT_OUT_OF_RANGE = "The sort element has some invalid data or is out of range: "
+    ERROR_ELEMENT_NOT_IN_ORDER = "The given element is not found in the sorted order: "
     ERROR_TOOLTIPS_ALREADY_SET = "The tooltips are already set"
     ERROR_NO_DATE_SELECTED = "No date has been selected"
     ERROR_CATEGORY_NOT_FOUND = "The provided category is not known to the system"
@@ -0,0 +1,36 @@
+"""
+shared fixtures of the tests
+the backend writes its data files into the working directory, so every test runs in its own temporary directory
+"""
+import os
+import sys
+import json
+import pytest
+
+#the tests dont need a display, the ui models are only used offscreen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """
+    runs the test in an empty temporary directory
+    :return: pathlib.Path<the directory>
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def backend(workdir):
+    """
+    a backend without loaded data and without network, its quote provider only knows the ticker "abc" (without prices)
+    :return: object<Backend>
+    """
+    from backend import Backend
+    from backend_quotes import FixtureQuoteProvider
+    from strings import ENG as STRINGS
+    with open("fixture.json", "w") as fixture_file:
+        json.dump({"metadata": {"ABC": {"shortName": "Abc Inc", "currency": STRINGS.CURRENCY_STRING, "quoteType": "EQUITY"}}}, fixture_file)
+    return Backend(None, load=False, quote_provider=FixtureQuoteProvider("fixture.json"))
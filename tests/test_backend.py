@@ -0,0 +1,42 @@
+"""
+tests of the journaled mutations of the backend
+"""
+import datetime
+from backend import Backend
+
+
+def getTransactionRows(backend:Backend):
+    """
+    values of all transactions to compare two backends
+    :param backend: object<Backend>
+    :return: list<tuple<values of a transaction>>
+    """
+    return [(trans.date, trans.product.name, trans.number, trans.cashflow_cents, [person.name for person in trans.from_to_persons])
+            for trans in backend.getTransactions()]
+
+
+def test_declined_mutation_is_not_journaled(backend):
+    assert backend.addPerson("person1")
+    seq = backend._journal.seq
+    assert backend.addPerson("PERSON1") == False
+    assert backend._journal.seq == seq
+    backend.flush()
+    loaded = Backend(None, load=True, quote_provider=backend.quote_provider)
+    assert loaded.getPersonNames() == ["person1"]
+
+
+def test_import_is_replayed_if_the_snapshot_fails(backend, workdir, monkeypatch):
+    backend.addPerson("person9")
+    backend.addTransaction(backend.getTransactionObject(datetime.date(2020, 1, 1), "product9", 1, 5.0, [], ["person9"], []))
+    with open("import.csv", "w") as csv_file:
+        csv_file.write("date;product;categories;number;cashflow_pp;cashflow;ftpersons;whypersons\n"
+                       "2021-01-01;product1;category1;1;5.00;5.00;person1;\n"
+                       "2021-01-02;product2;;2;-3.00;-6.00;;person2\n")
+    def failSnapshot():
+        raise OSError("disk full")
+    monkeypatch.setattr(backend, "_writeSnapshot", failSnapshot)
+    assert backend.loadFromCSV("import.csv") == []
+    #only the journal was written, it replaces the old transactions with the imported ones
+    loaded = Backend(None, load=True, quote_provider=backend.quote_provider)
+    assert getTransactionRows(loaded) == getTransactionRows(backend)
+    assert len(getTransactionRows(loaded)) == 2
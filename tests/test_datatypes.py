@@ -0,0 +1,81 @@
+"""
+tests of the memory layout and the shared objects of the datatypes
+"""
+import datetime
+import tracemalloc
+from backend_datatypes import Transaction, Product, Person, Investment, Asset
+
+#bytes of one row (the object and its own values like the date and the amounts), measured with tracemalloc
+#the dict based classes needed about 280 bytes per transaction, the slotted ones need about 257 bytes
+TRANSACTION_BYTES_TARGET = 264
+#the dict based classes needed about 257 bytes per investment, the slotted ones need about 268 bytes with the cached hash
+INVESTMENT_BYTES_TARGET = 280
+ROWS = 20000
+
+
+def measureBytesPerRow(func_build:callable):
+    """
+    builds ROWS objects and measures the allocated bytes per object
+    :param func_build: function<int<row>: object>
+    :return: float<bytes per row>
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        rows = [func_build(row) for row in range(ROWS)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(rows) == ROWS
+    return (after - before) / ROWS
+
+
+def test_transaction_bytes_per_row():
+    product = Product("product1", ["category1"])
+    persons = [Person("person1")]
+    start = datetime.date(2000, 1, 1)
+    bytes_per_row = measureBytesPerRow(lambda row: Transaction(start + datetime.timedelta(days=row), product, 1 + row % 5, 1000.25 + row % 9000, persons, []))
+    assert bytes_per_row <= TRANSACTION_BYTES_TARGET, bytes_per_row
+
+
+def test_investment_bytes_per_row():
+    asset = Asset("abc", "Abc Inc")
+    start = datetime.date(2000, 1, 1)
+    bytes_per_row = measureBytesPerRow(lambda row: Investment("buy", start + datetime.timedelta(days=row), asset, 1.0 + row % 5, 10.0 + row, 1.0, 0.5))
+    assert bytes_per_row <= INVESTMENT_BYTES_TARGET, bytes_per_row
+
+
+def test_slotted_objects_have_no_dict():
+    transaction = Transaction(datetime.date(2021, 1, 1), Product("product1"), 1, 5.0, [], [])
+    for element in (transaction, transaction.product, Person("person1"), Asset("abc", "Abc Inc")):
+        assert not hasattr(element, "__dict__")
+
+
+def test_equal_names_share_one_person_and_product(backend):
+    backend.addPerson("person1")
+    first = backend.getTransactionObject(datetime.date(2021, 1, 1), "product1", 1, 5.0, [], ["person1"], [])
+    backend.addTransaction(first)
+    second = backend.getTransactionObject(datetime.date(2021, 1, 2), "PRODUCT1", 1, 5.0, [], ["person1"], [])
+    assert second.product is first.product
+    assert second.from_to_persons[0] is first.from_to_persons[0]
+
+
+def test_equal_tickers_share_one_asset(backend):
+    today = datetime.date.today()
+    first = backend.getInvestmentObject([today, "buy", "abc", 1.0, 10.0, 0.0, 0.0])
+    backend.addInvestment(first)
+    second = backend.getInvestmentObject([today, "buy", "ABC", 2.0, 10.0, 0.0, 0.0])
+    assert second.asset is first.asset
+    assert backend._getAsset("ABC", "Abc Inc") is first.asset
+
+
+def test_loaded_investments_share_one_asset(backend):
+    from backend import Backend
+    day = datetime.date.today() - datetime.timedelta(days=10)
+    #investments of older data files have their own asset objects
+    backend.addInvestment(Investment("buy", day, Asset("abc", "Abc Inc"), 1.0, 10.0, 0.0, 0.0))
+    backend.addInvestment(Investment("buy", day, Asset("abc", "Abc Inc"), 2.0, 10.0, 0.0, 0.0))
+    backend._save()
+    loaded = Backend(None, load=True, quote_provider=backend.quote_provider)
+    assert len(loaded.investments) == 2
+    assert loaded.investments[0].asset is loaded.investments[1].asset
@@ -0,0 +1,37 @@
+"""
+tests of the journal and the save worker
+"""
+import os
+import pytest
+from cryptography.fernet import Fernet
+from backend_journal import Journal, SaveWorker
+
+
+def test_failed_write_keeps_the_records(tmp_path):
+    journal = Journal(str(tmp_path / "missing" / "data.fin.journal"))
+    journal.setKey(Fernet.generate_key())
+    journal.record("addPerson", ("person1",))
+    with pytest.raises(OSError):
+        journal.writePending()
+    assert journal.hasPending()
+    #a record of a later mutation is written after the older ones
+    journal.record("addPerson", ("person2",))
+    os.mkdir(tmp_path / "missing")
+    assert journal.writePending() == 2
+    assert not journal.hasPending()
+    assert list(journal.read(0)) == [("addPerson", ("person1",)), ("addPerson", ("person2",))]
+
+
+def test_flush_raises_and_the_worker_retries():
+    calls = []
+    def save():
+        calls.append(None)
+        if len(calls) == 1:
+            raise OSError("disk full")
+    worker = SaveWorker(save, 10.0, 10.0, 0.01, 0.01)
+    worker.markDirty()
+    with pytest.raises(OSError):
+        worker.flush()
+    #the changes stay dirty, so the next flush saves them
+    worker.flush()
+    assert len(calls) == 2
@@ -0,0 +1,60 @@
+"""
+tests of the price history store
+"""
+import datetime
+from threading import Event
+import numpy
+from backend_quotes import QuoteProvider
+from backend_prices import PriceHistoryStore
+
+
+class TestProvider(QuoteProvider):
+    """
+    returns a price of 1.0 for every day, the symbol "bad" fails and the symbol "slow" waits until it is released
+    """
+    __test__ = False
+
+    def __init__(self):
+        super().__init__(4, 0, 0.0)
+        self.release = Event()
+        self.futures = []
+
+    def prices(self, symbols, start, end):
+        if "bad" in symbols:
+            raise ValueError("no connection")
+        if "slow" in symbols:
+            self.release.wait(5.0)
+        dates = numpy.arange(numpy.datetime64(start, "D"), numpy.datetime64(end, "D") + 1)
+        return {symbol: (dates, numpy.ones(len(dates))) for symbol in symbols}
+
+    def submitPrices(self, symbols, start, end):
+        future = super().submitPrices(symbols, start, end)
+        self.futures.append(future)
+        return future
+
+
+START = datetime.date(2020, 1, 1)
+END = datetime.date(2020, 1, 31)
+
+
+def test_failed_request_keeps_stored_prices(workdir):
+    provider = TestProvider()
+    store = PriceHistoryStore("prices", provider)
+    assert store.update(["good"], START, datetime.date(2020, 1, 10))
+    #"good" and "bad" miss different ranges, so they are loaded with two requests
+    assert not store.update(["good", "bad"], START, END)
+    dates, closes = store.getHistory("good", START, END, timeout=1.0)
+    assert len(dates) >= 10 and (closes == 1.0).all()
+    assert len(store.getStoredHistory("bad", START, END)[0]) == 0
+
+
+def test_timeout_cancels_the_other_requests(workdir):
+    provider = TestProvider()
+    store = PriceHistoryStore("prices", provider)
+    store.update(["other"], START, datetime.date(2020, 1, 10))
+    provider.futures = []
+    assert not store.update(["slow", "other"], START, END, timeout=0.1)
+    assert all(future.cancelled() or future.done() for future in provider.futures)
+    assert any(future.cancelled() for future in provider.futures)
+    provider.release.set()
+    assert len(store.getStoredHistory("slow", START, END)[0]) == 0
@@ -0,0 +1,70 @@
+"""
+tests of the request handling of the quote providers
+"""
+import time
+from threading import Event, Lock
+import pytest
+from concurrent.futures import CancelledError
+from backend_quotes import QuoteProvider
+from backend_tickercache import TickerMetadata
+
+
+class TestProvider(QuoteProvider):
+    """
+    counts the calls of metadata, every call waits until it is released and fails if fail is set
+    """
+    __test__ = False
+
+    def __init__(self, retries:int=0, backoff:float=0.0, fail:bool=False):
+        super().__init__(4, retries, backoff)
+        self.release = Event()
+        self.fail = fail
+        self.calls = 0
+        self._calls_lock = Lock()
+
+    def metadata(self, symbols):
+        with self._calls_lock:
+            self.calls += 1
+        self.release.wait(5.0)
+        if self.fail:
+            raise ConnectionError("no connection")
+        return {symbol: TickerMetadata(symbol.upper(), "USD", "EQUITY", time.time()) for symbol in symbols}
+
+
+def test_same_request_runs_once():
+    provider = TestProvider()
+    first = provider.submitMetadata(["abc"])
+    second = provider.submitMetadata(["abc"])
+    assert not first is second
+    provider.release.set()
+    assert first.result(1.0)["abc"].short_name == "ABC"
+    assert second.result(1.0)["abc"].short_name == "ABC"
+    assert provider.calls == 1
+
+
+def test_cancel_of_one_caller_keeps_the_others():
+    provider = TestProvider()
+    first = provider.submitMetadata(["abc"])
+    second = provider.submitMetadata(["abc"])
+    first.cancel()
+    provider.release.set()
+    assert second.result(1.0)["abc"].short_name == "ABC"
+    with pytest.raises(CancelledError):
+        first.result(0)
+
+
+def test_last_cancel_stops_the_retries():
+    provider = TestProvider(retries=5, backoff=0.05, fail=True)
+    provider.release.set()
+    first = provider.submitMetadata(["abc"])
+    second = provider.submitMetadata(["abc"])
+    time.sleep(0.02)
+    first.cancel()
+    second.cancel()
+    calls = provider.calls
+    time.sleep(0.5)
+    assert provider.calls == calls
+    assert provider._in_flight == {}
+    #a new caller starts a new request
+    provider.fail = False
+    assert provider.submitMetadata(["abc"]).result(1.0)["abc"].currency == "USD"
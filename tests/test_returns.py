@@ -0,0 +1,64 @@
+"""
+tests of the money and time weighted returns
+"""
+import datetime
+import numpy
+from backend_returns import solveXirr, ReturnCalculator
+from backend_datatypes import Investment, Asset
+from backend_quotes import QuoteProvider
+
+
+def test_xirr_known_rates():
+    years = numpy.array([[0.0, 1.0, 0.0], [0.0, 1.0, 2.0]])
+    amounts = numpy.array([[-100.0, 110.0, 0.0], [-1000.0, 0.0, 1210.0]])
+    assert numpy.allclose(solveXirr(years, amounts), [0.1, 0.1])
+
+
+def test_xirr_bisection_fallback():
+    #without newton iterations every row is solved by the bisection
+    years = numpy.array([[0.0, 1.0], [0.0, 0.5]])
+    amounts = numpy.array([[-100.0, 150.0], [-100.0, 90.0]])
+    rates = solveXirr(years, amounts, iterations=0)
+    assert numpy.allclose(rates, [0.5, 0.9**2 - 1], atol=1e-9)
+    #a rate far away from the start of the newton method
+    assert numpy.allclose(solveXirr(numpy.array([[0.0, 1.0]]), numpy.array([[-100.0, 50000.0]])), [499.0])
+
+
+def test_xirr_rows_without_rate():
+    years = numpy.array([[0.0, 1.0], [0.0, 1.0], [0.0, 0.0]])
+    amounts = numpy.array([[-100.0, -50.0], [100.0, 50.0], [0.0, 0.0]])
+    assert numpy.isnan(solveXirr(years, amounts)).all()
+
+
+def test_linked_returns():
+    calculator = ReturnCalculator(lambda ticker_symbol: [])
+    #100 grow to 110, 100 are added, 210 grow to 231
+    value_before = numpy.array([[0.0, 110.0, 231.0], [0.0, 0.0, 50.0]])
+    value_after = numpy.array([[100.0, 210.0, 0.0], [0.0, 50.0, 0.0]])
+    with numpy.errstate(all="ignore"):
+        returns = calculator._getLinkedReturns(value_before, value_after)
+    #the second row has no value in the first period, so only the second one counts
+    assert numpy.allclose(returns, [0.21, 0.0])
+
+
+class FailingProvider(QuoteProvider):
+    """
+    a provider without network, every request fails
+    """
+    def metadata(self, symbols):
+        raise ConnectionError("no connection")
+
+    def prices(self, symbols, start, end):
+        raise ConnectionError("no connection")
+
+
+def test_time_weighted_returns_without_prices(workdir):
+    from backend import Backend
+    backend = Backend(None, load=False, quote_provider=FailingProvider(1, 0, 0.0))
+    asset = Asset("abc", "ABC")
+    day = datetime.date.today() - datetime.timedelta(days=100)
+    backend.addInvestment(Investment("buy", day, asset, 10.0, 10.0, 0.0, 0.0))
+    backend.addInvestment(Investment("sell", day + datetime.timedelta(days=50), asset, 10.0, 12.0, 0.0, 0.0))
+    #the prices of the trades are used, because no close price can be loaded
+    returns, portfolio = backend.getTimeWeightedReturns(1.0)
+    assert numpy.isclose(returns["abc"], 0.2) and numpy.isclose(portfolio, 0.2)
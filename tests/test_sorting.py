@@ -0,0 +1,51 @@
+"""
+tests of the sorted orders with equal keys
+"""
+import pytest
+from fullstack_utils import SortEnum
+from backend_sorting import SortedOrders
+
+
+class Element:
+    """
+    an element with a sort key, two elements with the same key are equal but not the same object
+    """
+    def __init__(self, key:int):
+        self.key = key
+
+    def __eq__(self, other) -> bool:
+        return type(other) == Element and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+def getOrders():
+    return SortedOrders({SortEnum.DATE: lambda x: x.key, SortEnum.CASHFLOW: lambda x: -x.key}, SortEnum.DATE)
+
+
+def test_equal_keys_keep_the_insertion_order():
+    orders = getOrders()
+    elements = [Element(1), Element(0), Element(1), Element(1)]
+    orders.reset(elements[:2])
+    orders.getElements(SortEnum.CASHFLOW)
+    for element in elements[2:]:
+        orders.insert(element)
+    assert [id(x) for x in orders.getElements()] == [id(x) for x in (elements[1], elements[0], elements[2], elements[3])]
+    assert [id(x) for x in orders.getElements(SortEnum.CASHFLOW)] == [id(x) for x in (elements[0], elements[2], elements[3], elements[1])]
+
+
+def test_remove_takes_the_same_object_of_equal_keys():
+    orders = getOrders()
+    elements = [Element(1) for _ in range(3)] + [Element(2)]
+    orders.reset(elements)
+    orders.getElements(SortEnum.CASHFLOW)
+    orders.remove(elements[1])
+    for sortElement in (SortEnum.DATE, SortEnum.CASHFLOW):
+        remaining = [id(x) for x in orders.getElements(sortElement)]
+        assert id(elements[1]) not in remaining
+        assert len(remaining) == 3
+    #an equal element that is not in the orders is not removed instead of the stored one
+    with pytest.raises(AssertionError):
+        orders.remove(Element(1))
+    assert len(orders.getElements()) == 3
@@ -0,0 +1,66 @@
+"""
+tests of the columnar transaction store
+"""
+import datetime
+from fullstack_utils import Filter
+
+
+def addTransaction(backend, day:int, person_name:str):
+    transaction = backend.getTransactionObject(datetime.date(2021, 1, day), "product1", 1, 5.0, [], [person_name], [])
+    backend.addTransaction(transaction)
+    return transaction
+
+
+def getFiltered(backend, **filter_values):
+    transaction_filter = Filter()
+    for name, value in filter_values.items():
+        setattr(transaction_filter, name, value)
+    backend.transactionFilter = transaction_filter
+    return list(backend.getFilteredTransactions())
+
+
+def test_person_code_not_reused_after_delete(backend):
+    for person_name in ("alice", "bobby", "david"):
+        backend.addPerson(person_name)
+    addTransaction(backend, 1, "alice")
+    bobby = addTransaction(backend, 2, "bobby")
+    backend.deletePersonByName("alice")
+    david = addTransaction(backend, 3, "david")
+    codes = backend._store.person_codes
+    assert codes["bobby"] != codes["david"]
+    assert getFiltered(backend, ftpersons=["bobby"]) == [bobby]
+    assert getFiltered(backend, ftpersons=["david"]) == [david]
+
+
+def test_person_code_not_reused_after_rename_into_other(backend):
+    for person_name in ("alice", "bobby"):
+        backend.addPerson(person_name)
+    addTransaction(backend, 1, "alice")
+    addTransaction(backend, 2, "bobby")
+    backend.renamePerson("alice", "bobby")
+    backend.addPerson("carol")
+    carol = addTransaction(backend, 3, "carol")
+    assert getFiltered(backend, ftpersons=["carol"]) == [carol]
+    assert len(getFiltered(backend, ftpersons=["bobby"])) == 2
+
+
+def test_delete_compacts_the_store(backend):
+    from backend_store import TransactionStore
+    from fullstack_utils import SortEnum
+    for person_name in ("alice", "bobby"):
+        backend.addPerson(person_name)
+    transactions = [addTransaction(backend, day, ("alice", "bobby")[day % 2]) for day in (5, 1, 4, 2, 3)]
+    store = backend._store
+    store.getOrder(SortEnum.DATE)
+    backend.deleteTransaction(transactions[0])
+    backend.deleteTransaction(transactions[1])
+    assert (len(store.rows), store.dead) == (5, 2)
+    #more than half of the rows are deleted now
+    backend.deleteTransaction(transactions[3])
+    assert (len(store.rows), store.dead) == (2, 0)
+    fresh = TransactionStore(backend.getTransactions)
+    #the fresh store adds the rows in date order, so the rows are compared by their transactions
+    assert [store.rows[row] for row in store.getOrder(SortEnum.DATE)] == [fresh.rows[row] for row in fresh.getOrder(SortEnum.DATE)]
+    assert [store.rows[row] for row in store.getMask(Filter()).nonzero()[0]] == [transactions[2], transactions[4]]
+    assert getFiltered(backend, ftpersons=["alice"]) == [transactions[2]]
+    assert getFiltered(backend, ftpersons=["bobby"]) == [transactions[4]]
@@ -0,0 +1,43 @@
+"""
+tests of the table models of the lists
+"""
+from PyQt5.QtCore import QPersistentModelIndex
+from PyQt5.QtWidgets import QApplication
+#the ui module creates its icons while importing, that needs an application
+app = QApplication.instance() or QApplication([])
+from ui_datatypes import ListTableModel
+
+
+class Element:
+    """
+    an object of a row, two elements with the same value are equal but not the same object
+    """
+    def __init__(self, value:int):
+        self.value = value
+
+    def __eq__(self, other) -> bool:
+        return type(other) == Element and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+def test_persistent_index_follows_its_object():
+    model = ListTableModel(2)
+    elements = [Element(value) for value in range(3)]
+    model.setElements(elements)
+    current = QPersistentModelIndex(model.index(0, 1))
+    model.setElements(elements[::-1])
+    assert current.isValid()
+    assert (current.row(), current.column()) == (2, 1)
+    assert model.getElement(model.index(current.row(), 0)) is elements[0]
+
+
+def test_replaced_object_resets_the_model():
+    model = ListTableModel(2)
+    elements = [Element(value) for value in range(3)]
+    model.setElements(elements)
+    current = QPersistentModelIndex(model.index(0, 0))
+    #an equal but new object is a different row, so the index must not point to it
+    model.setElements([Element(0)] + elements[1:])
+    assert not current.isValid()
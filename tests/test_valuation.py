@@ -0,0 +1,58 @@
+"""
+tests of the refreshes of the valuation engine
+"""
+import datetime
+from concurrent.futures import Future
+import numpy
+from backend_quotes import QuoteProvider
+from backend_valuation import ValuationEngine
+
+
+class TestProvider(QuoteProvider):
+    """
+    returns a future for every price request, that is set by the test
+    """
+    __test__ = False
+
+    def __init__(self):
+        super().__init__(1, 0, 0.0)
+        self.requests:list[tuple[list[str], Future]] = []
+
+    def submitPrices(self, symbols, start, end):
+        request = Future()
+        self.requests.append((list(symbols), request))
+        return request
+
+    def answer(self, index:int, price:float):
+        symbols, request = self.requests[index]
+        request.set_result({symbol: ([datetime.date.today()], numpy.array([price])) for symbol in symbols})
+
+
+def test_same_positions_share_the_running_refresh():
+    provider = TestProvider()
+    engine = ValuationEngine(provider)
+    first = engine.refresh({"abc": (1.0, 10.0)})
+    assert engine.refresh({"abc": (1.0, 10.0)}) is first
+    provider.answer(0, 12.0)
+    assert first.result(1.0).total_value == 12.0
+    assert len(provider.requests) == 1
+
+
+def test_changed_positions_queue_a_refresh():
+    provider = TestProvider()
+    engine = ValuationEngine(provider)
+    first = engine.refresh({"abc": (1.0, 10.0)})
+    second = engine.refresh({"abc": (2.0, 20.0)})
+    third = engine.refresh({"abc": (3.0, 30.0)})
+    #the queued refresh uses the newest positions, it is only started after the running one
+    assert not second is first
+    assert third is second
+    assert len(provider.requests) == 1
+    provider.answer(0, 12.0)
+    assert first.result(1.0).total_value == 12.0
+    assert not second.done()
+    assert len(provider.requests) == 2
+    #a refresh with the old positions must not get the result of the running one, because that values the new ones
+    assert engine.refresh({"abc": (1.0, 10.0)}) is not second
+    provider.answer(1, 12.0)
+    assert second.result(1.0).total_value == 36.0
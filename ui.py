@@ -3,6 +3,8 @@ This module provides the ui of the programm
 """
 
 import inspect
+import math
+from threading import Thread
 
 from strings import ENG as STRINGS
 from gui_constants import FONTS, ICONS
@@ -13,9 +15,9 @@ from ui_datatypes import Combo, Inputs, TransactionList, InvestmentList
 from fullstack_utils import SortEnum, utils, Filter
 
 from PyQt5.QtWidgets import QGridLayout, QLabel, QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton, QDialog, QWidget, QSizePolicy
-from PyQt5.QtWidgets import QSpinBox, QCalendarWidget, QLineEdit, QCompleter, QComboBox, QMessageBox, QScrollArea, QFileDialog, QTabWidget
+from PyQt5.QtWidgets import QSpinBox, QCalendarWidget, QLineEdit, QCompleter, QComboBox, QMessageBox, QFileDialog, QTabWidget
 from PyQt5 import QtGui, QtWidgets
-from PyQt5.QtCore import QDate, Qt
+from PyQt5.QtCore import QDate, Qt, QModelIndex, QTimer, pyqtSignal
 
 class Window(QDialog):
     """
@@ -40,7 +42,7 @@ class Window(QDialog):
         self.product_input_matched_content = None   #the form data that was entered before the user matched some product (to restore)
         self.tooltips_set = False   #are the tooltips are already set 
         self.edit_mode = False  #form is in edit mode?
-        self.choosed_trans_button = False   #the button, which transaction is currently choosen
+        self.choosed_transaction = False    #the transaction, which is currently choosen
 
         self.filter = Filter()          #sets up the filter object to filter the transactions
         self.backend = Backend(self)    #sets up the backend object to perform backend requests in the ui
@@ -420,25 +422,10 @@ class Window(QDialog):
         widget_sort.setLayout(layout_sort)
         self.layout_lastTransaction.addWidget(widget_sort)
 
-        #********************SCROLLAREA******************************
-        #creates a scrollarea with a vertical scroll bar and no horizontal scroll bar
-        self.scrollarea = QScrollArea()
-        self.scrollarea.setWidgetResizable(True)
-        self.scrollarea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scrollarea.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        self.scrollarea.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
-
-        self.scroll_widget = QWidget()      #inner widget, holds the buttons
-        self.scroll_vbox = QVBoxLayout()    #layout for the inner widget
-        self.scroll_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)    #buttons should build up from the top
-
-        self.TransList.setLayout(self.scroll_vbox)  #sets the layout inside the datatype
-        self.sortTransactions(SortEnum.DATE, True)            #loads the buttons from the backend
-
-        #sets the layout of the inner widget and sets this widget in the scrollarea, finally adds the scrollarea to the main layout
-        self.scroll_widget.setLayout(self.scroll_vbox)
-        self.scrollarea.setWidget(self.scroll_widget)
-        self.layout_lastTransaction.addWidget(self.scrollarea)
+        #********************TRANSACTION_VIEW************************
+        #the transaction list adds a scrollable view to the layout, that only renders the visible transactions
+        self.TransList.setLayout(self.layout_lastTransaction)  #sets the layout inside the datatype
+        self.sortTransactions(SortEnum.DATE, True)            #loads the transactions from the backend
 
         #********************IMPORT_EXPORT_CSV***********************
         #set buttons for loading/exporting
@@ -791,8 +778,7 @@ class Window(QDialog):
         :return: void
         """
         assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
-        assert(self.choosed_trans_button != False), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
-        assert(type(self.choosed_trans_button) == QPushButton), STRINGS.getTypeErrorString(self.choosed_trans_button, "self.sender_button", QPushButton)
+        assert(self.choosed_transaction is transaction), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
         assert(not self.edit_mode), STRINGS.ERROR_IN_EDIT_MODE
         self.edit_mode = True
 
@@ -807,8 +793,7 @@ class Window(QDialog):
         self.WhyCombo.setItems(transaction.getWhyPersonNames())         #why persons
 
         #make the gui look like edit mode
-        self.choosed_trans_button.setStyleSheet("QPushButton {background-color:red;}")
-        self.choosed_trans_button.adjustSize()
+        self.TransList.setChoosenTransaction(transaction)
         self.groupBox_transaction.setStyleSheet("QGroupBox {background-color:#ffcccc;}")
         self.groupBox_transaction_label.setText(STRINGS.APP_LABEL_EDIT_TRANSACTION)
 
@@ -838,8 +823,7 @@ class Window(QDialog):
         self.button_merging_product.disconnect()
 
         #connect with event handler
-        self.choosed_trans_button.clicked.disconnect()      #the choosen transaction should work as a cancel button too
-        self.choosed_trans_button.clicked.connect(self.Eedit_cancel)
+        #the choosen transaction works as a cancel button too (handled in Elast_trans_button_pressed)
         self.submit_button.clicked.connect(self.Eedit_save_changes)
         delete_button.clicked.connect(self.Eedit_delete_transaction)
         cancel_button.clicked.connect(self.Eedit_cancel)
@@ -861,8 +845,7 @@ class Window(QDialog):
         self.clearForm()
 
         #lets change the looking of the gui
-        self.choosed_trans_button.setStyleSheet("")
-        self.choosed_trans_button.adjustSize()
+        self.TransList.setChoosenTransaction(None)
         self.groupBox_transaction.setStyleSheet("")
         self.groupBox_transaction_label.setText(STRINGS.APP_LABEL_NEW_TRANSACTION)
 
@@ -872,8 +855,6 @@ class Window(QDialog):
                 button.deleteLater()
         
         #connect to the right event handler
-        self.choosed_trans_button.clicked.disconnect()
-        self.choosed_trans_button.clicked.connect(self.Elast_trans_button_pressed)
         self.submit_button.clicked.disconnect()
         self.submit_button.setEnabled(False)
         self.submit_button.clicked.connect(self.Esubmit_transaction)
@@ -889,7 +870,7 @@ class Window(QDialog):
         self.button_merging_person.clicked.connect(self.Eperson_merged)
         self.button_merging_product.clicked.connect(self.Eproduct_merged)
 
-        self.choosed_trans_button = False           #this transaction button is no more active
+        self.choosed_transaction = False            #this transaction is no more active
         self.adjustSize()
 
     def setToolTips(self):
@@ -966,8 +947,7 @@ class Window(QDialog):
             but.setEnabled(False)
         self.filter_button.setEnabled(False)
         self.reset_fiter_button.setEnabled(False)
-        for but in self.TransList.buttons_transaction_dict.keys():
-            but.setEnabled(False)
+        self.TransList.setEnabled(False)
         self.load_trans_button.setEnabled(False)
         self.export_trans_button.setEnabled(False)
     
@@ -994,6 +974,7 @@ class Window(QDialog):
         self.reset_fiter_button.setEnabled(True)
         self.load_trans_button.setEnabled(True)
         self.export_trans_button.setEnabled(True)
+        self.TransList.setEnabled(True)
 
     def loadNextData(self): #DEBUGONLY
         """
@@ -1027,7 +1008,7 @@ class Window(QDialog):
         """
         assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
         self.backend.addTransaction(transaction)
-        self.TransList.updateLastTrans()    #update the buttons in the scrollarea showing the last transactions
+        self.TransList.updateLastTrans()    #update the rows of the view showing the last transactions
 
     def getTransactionFromForm(self, noexcept:bool=False):
         """
@@ -1543,20 +1524,23 @@ class Window(QDialog):
             if self.loading:
                 self.loadNextData()
 
-    def Elast_trans_button_pressed(self):
+    def Elast_trans_button_pressed(self, index:QModelIndex):
         """
         event handler
-        activates if a transaction button from the scrollarea is pressed
-        gets the transaction conencted to that button and opens a view/edit transaction window
+        activates if a transaction row from the transaction view is clicked
+        gets the transaction of that row and opens a view/edit transaction window
+        :param index: object<QModelIndex> of the clicked row
         :return: void
         """
-        assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        but = self.sender()
-        trans = self.TransList.getTransactionForButton(but)
+        trans = self.TransList.getTransactionForIndex(index)
         if self.edit_mode:
+            if trans is self.choosed_transaction:
+                #the choosen transaction works as a cancel button
+                self.disableEditMode()
+                return
             #an other transaction was choosen, so we wanna switch to that
             self.disableEditMode()
-        self.choosed_trans_button = but
+        self.choosed_transaction = trans
         self.enableEditMode(trans)
 
     def Eedit_cancel(self):
@@ -1574,22 +1558,21 @@ class Window(QDialog):
         """
         event handler
         activates if the user wanna save the changes while editing a transaction
-        its just deleting the transaction currently choosed from the system and adds a new one, with the current options
+        its replacing the transaction currently choosed with a new one, with the current options
         :return: void
         """
         assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        assert(type(self.choosed_trans_button) == QPushButton), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
+        assert(type(self.choosed_transaction) == Transaction), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
         assert(self.edit_mode), STRINGS.ERROR_NOT_IN_EDIT_MODE
-        #delete the old transaction
-        old_trans = self.TransList.getTransactionForButton(self.choosed_trans_button)
+        old_trans = self.choosed_transaction
         new_trans = self.getTransactionFromForm()
         if new_trans == False:
             print("transaction could not be added")
             return
-        self.backend.deleteTransaction(old_trans)
+        #replace the old transaction with the new one
+        self.backend.replaceTransaction(old_trans, new_trans)
         self.disableEditMode()
-        #add the new one
-        self.addTransactionFromTransaction(new_trans)
+        self.TransList.updateLastTrans()    #update the rows of the view showing the last transactions
         self.productsChanged()
         
     def Eedit_delete_transaction(self):
@@ -1600,9 +1583,9 @@ class Window(QDialog):
         :return: void
         """
         assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        assert(type(self.choosed_trans_button) == QPushButton), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
+        assert(type(self.choosed_transaction) == Transaction), STRINGS.ERROR_NO_TRANSACTION_BUTTON_SET
         assert(self.edit_mode), STRINGS.ERROR_NOT_IN_EDIT_MODE
-        self.backend.deleteTransaction(self.TransList.getTransactionForButton(self.choosed_trans_button))
+        self.backend.deleteTransaction(self.choosed_transaction)
         self.disableEditMode()
         self.productsChanged()
         self.categoriesChanged()
@@ -1669,10 +1652,16 @@ class Window(QDialog):
                 "Import File", "", "CSV Files (*.csv)", options = options)
             if fileName:
                 #loads the new transactions
-                if self.backend.loadFromCSV(fileName) == False:
-                    #msg box that tells the user that the file is not in the right format, he has to import his old data
+                errors = self.backend.loadFromCSV(fileName)
+                if errors == False:
+                    #msg box that tells the user that the file is not in the right format, the old transactions are kept
                     msg = QMessageBox()
                     msg.critical(self, STRINGS.CRITICAL_IMPORT_TRANSACTIONS_TITLE, STRINGS.CRITICAL_IMPORT_TRANSACTIONS)
+                elif errors != []:
+                    #msg box that tells the user which rows were skipped
+                    msg = QMessageBox()
+                    msg.warning(self, STRINGS.WARNING_IMPORT_ROWS_SKIPPED_TITLE, 
+                        str(len(errors))+STRINGS.WARNING_IMPORT_ROWS_SKIPPED+"\n".join(errors[:CONSTANTS.MAX_IMPORT_ERRORS_SHOWN]))
                 #updates all ui comonents which belong to the transactions
                 self.productsChanged()
                 self.categoriesChanged()
@@ -2604,16 +2593,16 @@ class FilterWindow(QDialog):
         self.product_start_edit.setText(self.filter.startswith)
         if type(self.filter.minCashflow) != bool:
             #filter is set
-            self.min_fullp_edit.setText(str(self.filter.minCashflow))
+            self.min_fullp_edit.setText(utils.formatCents(self.filter.minCashflow))
         if type(self.filter.maxCashflow) != bool:
             #filter is set
-            self.max_fullp_edit.setText(str(self.filter.maxCashflow))
+            self.max_fullp_edit.setText(utils.formatCents(self.filter.maxCashflow))
         if type(self.filter.minCashflowPerProduct) != bool:
             #filter is set
-            self.min_ppp_edit.setText(str(self.filter.minCashflowPerProduct))
+            self.min_ppp_edit.setText(utils.formatCents(self.filter.minCashflowPerProduct))
         if type(self.filter.maxCashflowPerProduct) != bool:
             #filter is set
-            self.max_ppp_edit.setText(str(self.filter.maxCashflowPerProduct))
+            self.max_ppp_edit.setText(utils.formatCents(self.filter.maxCashflowPerProduct))
 
         self.CatCombo.setItems(self.filter.categories)
         self.FtpCombo.setItems(self.filter.ftpersons)
@@ -2828,6 +2817,9 @@ class InvestTab(QWidget):
     this widget is made of all ui components needed for the investment tab
     this widget just needs to be added to the layout of this tab
     """
+    valuation_ready = pyqtSignal()  #emitted from the thread of the quote provider if a valuation refresh finished
+    returns_ready = pyqtSignal(float)   #emitted from a worker thread with the time weighted return of the portfolio
+
     def __init__(self, backend):
         """
         basic constructor
@@ -2844,11 +2836,22 @@ class InvestTab(QWidget):
         self.InputsInvestment = Inputs(["ticker", "number", "price"], self.activateSubmitButton, self.deactivateSubmitButton)
         self.mode = "buy"
         self.edit_mode = False  #true if the user clicks a past investment to edit that investment
+        self.choosed_investment = False     #the investment, which is currently choosen
 
         self.filter = Filter()          #sets up the filter object to filter the investments
 
         self.InitWidget()       #creates the base state of the widget
 
+        #the prices of the held assets are refreshed in the background, the label is updated on the qt thread
+        self.valuation_ready.connect(self.Eupdate_valuation)
+        self.returns_ready.connect(self.Eupdate_returns)
+        self.valuation_text = ""        #text of the last valuation without the time weighted return
+        self.returns_loading = False    #true while the time weighted return is computed on a worker thread
+        self.valuation_timer = QTimer(self)
+        self.valuation_timer.timeout.connect(self.Erefresh_valuation)
+        self.valuation_timer.start(CONSTANTS.VALUATION_REFRESH_INTERVAL)
+        self.Erefresh_valuation()
+
     def InitWidget(self):
         """
         this init method should be called in the constructor after creating a layout for the widget
@@ -3090,6 +3093,12 @@ class InvestTab(QWidget):
         widget_filter.setLayout(layout_filter)
         self.layout_investments.addWidget(widget_filter)
 
+        #********************VALUATION*******************************
+        #shows the market value and unrealized profit of the held assets
+        self.valuation_label = QLabel(STRINGS.INVFORM_LABEL_VALUATION_LOADING)
+        self.valuation_label.setWordWrap(True)
+        self.layout_investments.addWidget(self.valuation_label)
+
         #********************SORT************************************
         #creates the sort buttons
         layout_sort = QHBoxLayout()
@@ -3111,25 +3120,10 @@ class InvestTab(QWidget):
         widget_sort.setLayout(layout_sort)
         self.layout_investments.addWidget(widget_sort)
 
-        #********************SCROLLAREA******************************
-        #creates a scrollarea with a vertical scroll bar and no horizontal scroll bar
-        self.scrollarea = QScrollArea()
-        self.scrollarea.setWidgetResizable(True)
-        self.scrollarea.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.scrollarea.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        self.scrollarea.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
-
-        self.scroll_widget = QWidget()      #inner widget, holds the buttons
-        self.scroll_vbox = QVBoxLayout()    #layout for the inner widget
-        self.scroll_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)    #buttons should build up from the top
-
-        self.InvestmentList.setLayout(self.scroll_vbox)  #sets the layout inside the datatype
-        self.sortInvestments(SortEnum.DATE, True)            #loads the buttons from the backend
-
-        #sets the layout of the inner widget and sets this widget in the scrollarea, finally adds the scrollarea to the main layout
-        self.scroll_widget.setLayout(self.scroll_vbox)
-        self.scrollarea.setWidget(self.scroll_widget)
-        self.layout_investments.addWidget(self.scrollarea)
+        #********************INVESTMENT_VIEW*************************
+        #the investment list adds a scrollable view to the layout, that only renders the visible investments
+        self.InvestmentList.setLayout(self.layout_investments)  #sets the layout inside the datatype
+        self.sortInvestments(SortEnum.DATE, True)            #loads the investments from the backend
 
         #********************IMPORT_EXPORT_CSV***********************
         #set buttons for loading/exporting
@@ -3369,8 +3363,7 @@ class InvestTab(QWidget):
         :return: void
         """
         assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
-        assert(self.choosed_inv_button != False), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
-        assert(type(self.choosed_inv_button) == QPushButton), STRINGS.getTypeErrorString(self.choosed_inv_button, "self.choosed_inv_button", QPushButton)
+        assert(self.choosed_investment is investment), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
         assert(not self.edit_mode), STRINGS.ERROR_IN_EDIT_MODE
         self.edit_mode = True
         #switches to the correct mode in order to load the investment properly
@@ -3395,8 +3388,7 @@ class InvestTab(QWidget):
         self.tax_edit.setText(str(investment.tax))
 
         #make the gui look like edit mode
-        self.choosed_inv_button.setStyleSheet("QPushButton {background-color:#550000;}")
-        self.choosed_inv_button.adjustSize()
+        self.InvestmentList.setChoosenInvestment(investment)
         self.widget_form.setStyleSheet("QGroupBox {background-color:#ffcccc;}")
         self.label_form.setText(STRINGS.INVFORM_LABEL_EDIT_INVESTMENT)
 
@@ -3415,8 +3407,7 @@ class InvestTab(QWidget):
         self.submit_layout.addWidget(cancel_button)
 
         #connect with event handler
-        self.choosed_inv_button.clicked.disconnect()      #the choosen transaction should work as a cancel button too
-        self.choosed_inv_button.clicked.connect(self.Eedit_cancel)
+        #the choosen investment works as a cancel button too (handled in Elast_inv_button_pressed)
         self.submit_button.clicked.connect(self.Eedit_save_changes)
         delete_button.clicked.connect(self.Eedit_delete_transaction)
         cancel_button.clicked.connect(self.Eedit_cancel)
@@ -3438,9 +3429,7 @@ class InvestTab(QWidget):
         self.wipeForm()
 
         #lets change the looking of the gui
-        color = self.InvestmentList.getColor(self.InvestmentList.getInvestmentForButton(self.choosed_inv_button).trade_type)
-        self.choosed_inv_button.setStyleSheet("QPushButton {background-color:"+color+"}")
-        self.choosed_inv_button.adjustSize()
+        self.InvestmentList.setChoosenInvestment(None)
         self.widget_form.setStyleSheet("")
         self.label_form.setText(STRINGS.INVFORM_LABEL_NEW_INV)
 
@@ -3450,13 +3439,11 @@ class InvestTab(QWidget):
                 button.deleteLater()
         
         #connect to the right event handler
-        self.choosed_inv_button.clicked.disconnect()
-        self.choosed_inv_button.clicked.connect(self.Elast_inv_button_pressed)
         self.submit_button.clicked.disconnect()
         self.submit_button.setEnabled(False)
         self.submit_button.clicked.connect(self.Esubmit_investment)
 
-        self.choosed_inv_button = False           #this transaction button is no more active
+        self.choosed_investment = False           #this investment is no more active
         self.switchMode()
         self.adjustSize()
 
@@ -3472,6 +3459,7 @@ class InvestTab(QWidget):
             self.ticker_completer.setCaseSensitivity(False)
             self.ticker_edit.setCompleter(self.ticker_completer)      #add an autocompleter
         self.InvestmentList.updateLastInvestments()
+        self.Erefresh_valuation()   #the held assets could be changed
 
 
     def activateNonFormButtons(self):
@@ -3513,6 +3501,73 @@ class InvestTab(QWidget):
         self.InvestmentList.updateLastInvestments()        #reloads the investments to make the filter work
         self.num_trade_label.setText(str(self.InvestmentList.getInvestmentCount())+STRINGS.APP_LABEL_INVESTMENT_COUNT)
 
+    def Erefresh_valuation(self):
+        """
+        event handler
+        activates if the valuation timer runs out or the investments changed
+        starts loading the prices of the held assets, the label is updated if they are loaded
+        :return: void
+        """
+        future = self.backend.refreshValuation()
+        future.add_done_callback(lambda future: self.valuation_ready.emit())
+
+    def Eupdate_valuation(self):
+        """
+        event handler
+        activates on the qt thread if a valuation refresh finished
+        shows the last valuation, if the refresh failed the older one is kept
+        :return: void
+        """
+        valuation = self.backend.getValuation()
+        if valuation == None:
+            #there was no successful refresh yet
+            return
+        text = STRINGS.INVFORM_LABEL_VALUATION+f"{valuation.total_value:.2f} {STRINGS.CURRENCY_STRING}\n"
+        text += STRINGS.INVFORM_LABEL_VALUATION_PROFIT+f"{valuation.total_profit:+.2f} {STRINGS.CURRENCY_STRING}"
+        if valuation.missing != []:
+            text += "\n"+STRINGS.INVFORM_LABEL_VALUATION_MISSING+", ".join(valuation.missing)
+        #the money weighted return only needs the cashflows and the valuation, so its computed right away
+        _, money_weighted = self.backend.getMoneyWeightedReturns()
+        text += "\n"+STRINGS.INVFORM_LABEL_RETURN_MONEY_WEIGHTED+self._getReturnText(money_weighted)+STRINGS.INVFORM_LABEL_RETURN_PER_YEAR
+        self.valuation_text = text
+        self.valuation_label.setText(text+"\n"+STRINGS.INVFORM_LABEL_RETURN_TIME_WEIGHTED+STRINGS.INVFORM_LABEL_RETURN_LOADING)
+        if not self.returns_loading:
+            #the time weighted return can wait for missing prices, so its computed on a worker thread
+            self.returns_loading = True
+            Thread(target=self._loadReturns, daemon=True).start()
+
+    def _loadReturns(self):
+        """
+        computes the time weighted return of the portfolio, runs on a worker thread
+        :return: void
+        """
+        time_weighted = math.nan
+        try:
+            _, time_weighted = self.backend.getTimeWeightedReturns(CONSTANTS.RETURNS_TIMEOUT)
+        except Exception as e:
+            print("Some error occured while computing the returns: "+str(e))
+        self.returns_ready.emit(time_weighted)
+
+    def Eupdate_returns(self, time_weighted:float):
+        """
+        event handler
+        activates on the qt thread if the time weighted return is computed
+        :param time_weighted: float<return of the portfolio over the whole holding time> (nan if its unknown)
+        :return: void
+        """
+        self.returns_loading = False
+        self.valuation_label.setText(self.valuation_text+"\n"+STRINGS.INVFORM_LABEL_RETURN_TIME_WEIGHTED+self._getReturnText(time_weighted))
+
+    def _getReturnText(self, rate:float):
+        """
+        formats a return as a percentage
+        :param rate: float<return> (nan if its unknown)
+        :return: str<text of the return>
+        """
+        if math.isnan(rate):
+            return STRINGS.INVFORM_LABEL_RETURN_UNKNOWN
+        return f"{rate*100:+.2f}%"
+
 
     def Eenter_only_positive_numbers(self):
         """
@@ -3713,20 +3768,23 @@ class InvestTab(QWidget):
     def Eexport_csv(self):
         pass
 
-    def Elast_inv_button_pressed(self):
+    def Elast_inv_button_pressed(self, index:QModelIndex):
         """
         event handler
-        activates if a investment button from the scrollarea is pressed
-        gets the investment conencted to that button and opens a view/edit investment window
+        activates if a investment row from the investment view is clicked
+        gets the investment of that row and opens a view/edit investment window
+        :param index: object<QModelIndex> of the clicked row
         :return: void
         """
-        assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        but = self.sender()
-        inv = self.InvestmentList.getInvestmentForButton(but)
+        inv = self.InvestmentList.getInvestmentForIndex(index)
         if self.edit_mode:
+            if inv is self.choosed_investment:
+                #the choosen investment works as a cancel button
+                self.disableEditMode()
+                return
             #an other investment was choosen, so we wanna switch to that
             self.disableEditMode()
-        self.choosed_inv_button = but
+        self.choosed_investment = inv
         self.enableEditMode(inv)
 
     def Eedit_cancel(self):
@@ -3744,25 +3802,23 @@ class InvestTab(QWidget):
         """
         event handler
         activates if the user wanna save the changes while editing a investment
-        its just deleting the investment currently choosed from the system and adds a new one, with the current options
+        its replacing the investment currently choosed with a new one, with the current options
         :return: void
         """
         assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        assert(type(self.choosed_inv_button) == QPushButton), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
+        assert(type(self.choosed_investment) == Investment), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
         assert(self.edit_mode), STRINGS.ERROR_NOT_IN_EDIT_MODE
-        #delete the old investment
-        old_inv = self.InvestmentList.getInvestmentForButton(self.choosed_inv_button)
-        new_inv = self.backend.getInvestmentObject(self.getDataFromForm())
+        old_inv = self.choosed_investment
+        new_inv = self.backend.getInvestmentObject(self.getDataFromForm(), old_inv)
         if new_inv == False:
             QMessageBox.critical(self, STRINGS.CRITICAL_ADD_INVESTMENT_TITLE, self.backend.error_string)
             return
-        success = self.backend.deleteInvestment(old_inv)
+        #replace the old investment with the new one
+        success = self.backend.replaceInvestment(old_inv, new_inv)
         if success == False:
             QMessageBox.critical(self, STRINGS.CRITICAL_ADD_INVESTMENT_TITLE, self.backend.error_string)
             return
         self.disableEditMode()
-        #add the new one
-        self.backend.addInvestment(new_inv)
         self.investmentChanged()
         
     def Eedit_delete_transaction(self):
@@ -3773,9 +3829,9 @@ class InvestTab(QWidget):
         :return: void
         """
         assert(type(self.sender()) == QPushButton), STRINGS.ERROR_WRONG_SENDER_TYPE+inspect.stack()[0][3]+", "+type(self.sender())
-        assert(type(self.choosed_inv_button) == QPushButton), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
+        assert(type(self.choosed_investment) == Investment), STRINGS.ERROR_NO_INVESTMENT_BUTTON_SET
         assert(self.edit_mode), STRINGS.ERROR_NOT_IN_EDIT_MODE
-        success = self.backend.deleteInvestment(self.InvestmentList.getInvestmentForButton(self.choosed_inv_button))
+        success = self.backend.deleteInvestment(self.choosed_investment)
         if success == False:
             QMessageBox.critical(self, STRINGS.CRITICAL_ADD_INVESTMENT_TITLE, self.backend.error_string)
             return
@@ -4044,16 +4100,16 @@ class FilterWIndowInvest(QDialog):
         self.max_date_button.setText(self.filter.maxDate.toString("dd.MM.yyyy"))
         if type(self.filter.minCashflow) != bool:
             #filter is set
-            self.min_fullp_edit.setText(str(self.filter.minCashflow))
+            self.min_fullp_edit.setText(utils.formatCents(self.filter.minCashflow))
         if type(self.filter.maxCashflow) != bool:
             #filter is set
-            self.max_fullp_edit.setText(str(self.filter.maxCashflow))
+            self.max_fullp_edit.setText(utils.formatCents(self.filter.maxCashflow))
         if type(self.filter.minCashflowPerProduct) != bool:
             #filter is set
-            self.min_ppa_edit.setText(str(self.filter.minCashflowPerProduct))
+            self.min_ppa_edit.setText(utils.formatCents(self.filter.minCashflowPerProduct))
         if type(self.filter.maxCashflowPerProduct) != bool:
             #filter is set
-            self.max_ppa_edit.setText(str(self.filter.maxCashflowPerProduct))
+            self.max_ppa_edit.setText(utils.formatCents(self.filter.maxCashflowPerProduct))
 
         self.AssetCombo.setItems(self.filter.assets)
 
@@ -1,8 +1,10 @@
 """
 This module provides the datatypes used by the ui
 """
-from PyQt5.QtWidgets import QComboBox, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QSizePolicy, QStyle
-from PyQt5.QtCore import QDate, Qt
+from PyQt5.QtWidgets import QComboBox, QVBoxLayout, QSizePolicy, QStyle
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import QDate, Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
 from backend_datatypes import Transaction, Person, Investment
 from strings import ENG as STRINGS
 from constants import CONSTANTS
@@ -10,6 +12,33 @@ from gui_constants import COLORS
 from backend import Dbenchmark
 
 
+def getListTableView(model:QAbstractTableModel, func_event_handler:callable):
+    """
+    sets up a table view that looks like a list of buttons
+    all rows have the same height, so the view only needs to ask the model for the visible rows
+    :param model: object<QAbstractTableModel>
+    :param func_event_handler: function<event handler for clicking a row, gets the QModelIndex of the row>
+    :return: object<QTableView>
+    """
+    view = QTableView()
+    view.setModel(model)
+    view.horizontalHeader().hide()
+    view.verticalHeader().hide()
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.setShowGrid(False)
+    view.setAlternatingRowColors(True)
+    view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+    view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+    view.setSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.MinimumExpanding)
+    view.setCursor(Qt.CursorShape.PointingHandCursor)
+    view.clicked.connect(func_event_handler)    #connect with event handler
+    return view
+
+
 class Combo:
     """
     The Combo class encapsulated the ComboBoxes, which are used in the ui
@@ -290,226 +319,243 @@ class Inputs:
             self.input_dict[i] = False  #sets all requirements to false
 
 
+class ListTableModel(QAbstractTableModel):
+    """
+    The ListTableModel class is the base of the table models of the transaction and investment lists
+    it only holds references to the shown objects, the view asks for the data of the visible rows only
+    so the texts and colors are created while painting and no widgets are created per object
+    """
+    def __init__(self, column_count:int):
+        """
+        basic constructor is setting up an empty model
+        :param column_count: int<number of columns>
+        :return: void
+        """
+        assert(type(column_count) == int), STRINGS.getTypeErrorString(column_count, "column_count", int)
+        super().__init__()
+        self.column_count = column_count
+        self.elements = []          #the shown objects, one per row
+        self.choosen_element = None #the object that is currently choosen, its row is highlighted
+
+    def rowCount(self, parent:QModelIndex=QModelIndex()):
+        """
+        getter for the number of rows, used by the view
+        :param parent: object<QModelIndex>
+        :return: int<number of rows>
+        """
+        return 0 if parent.isValid() else len(self.elements)
+
+    def columnCount(self, parent:QModelIndex=QModelIndex()):
+        """
+        getter for the number of columns, used by the view
+        :param parent: object<QModelIndex>
+        :return: int<number of columns>
+        """
+        return 0 if parent.isValid() else self.column_count
+
+    def setElements(self, elements:list):
+        """
+        sets the shown objects
+        if only the order of the same objects changed the view just updates its layout, otherwise the model is reset
+        :param elements: list<objects, one per row>
+        :return: void
+        """
+        #the objects are compared by identity, an equal but replaced object is a different row
+        new_rows = {id(element): row for row, element in enumerate(elements)}
+        if len(elements) == len(self.elements) and len(new_rows) == len(elements) and all(id(element) in new_rows for element in self.elements):
+            self.layoutAboutToBeChanged.emit()
+            #the persistent indexes (like the current index of the view) have to follow their objects
+            old_indexes = self.persistentIndexList()
+            new_indexes = [self.index(new_rows[id(self.elements[index.row()])], index.column()) for index in old_indexes]
+            self.elements = elements
+            self.changePersistentIndexList(old_indexes, new_indexes)
+            self.layoutChanged.emit()
+        else:
+            self.beginResetModel()
+            self.elements = elements
+            self.endResetModel()
+
+    def getElement(self, index:QModelIndex):
+        """
+        getter for the object of a row
+        :param index: object<QModelIndex>
+        :return: object
+        """
+        assert(index.isValid() and index.row() < len(self.elements)), STRINGS.ERROR_ROW_NOT_FOUND+str(index.row())
+        return self.elements[index.row()]
+
+    def setChoosenElement(self, element):
+        """
+        sets the object that is highlighted
+        :param element: object or None if no object should be highlighted
+        :return: void
+        """
+        self.choosen_element = element
+        #only the background of the visible rows is painted again
+        self.dataChanged.emit(self.index(0, 0), self.index(max(len(self.elements) - 1, 0), self.column_count - 1), [Qt.ItemDataRole.BackgroundRole])
+
+
+class TransactionModel(ListTableModel):
+    """
+    The TransactionModel class is the table model of the TransactionList
+    each row shows the date, cashflow and product name of a transaction
+    """
+    def __init__(self):
+        """
+        basic constructor is setting up an empty model with three columns
+        :return: void
+        """
+        super().__init__(3)
+
+    def data(self, index:QModelIndex, role:int=Qt.ItemDataRole.DisplayRole):
+        """
+        gets the data of a cell, this is only called for the visible rows
+        :param index: object<QModelIndex>
+        :param role: int<Qt.ItemDataRole>
+        :return: any<data of the cell for that role> or None
+        """
+        if not index.isValid():
+            return None
+        transaction:Transaction = self.elements[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            match index.column():
+                case 0:
+                    return transaction.date.strftime('[%d %b %Y]')
+                case 1:
+                    return f"{transaction.cashflow:.2f}{STRINGS.CURRENCY}"
+                case 2:
+                    return transaction.product.name
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() == 0:
+                return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if transaction is self.choosen_element:
+                return QColor(COLORS.RED)
+        return None
+
+
 class TransactionList:
     """
-    The TransactionList class sets up a list of PushButton objects, that are added in a scrollarea
-    The PushButtons should represent the transactions the user has taken
-    The user should be able to click on these buttons to view and edit that transaction
+    The TransactionList class sets up a table view of the transactions, that is added to a layout
+    The rows should represent the transactions the user has taken, only the visible rows are rendered
+    The user should be able to click on a row to view and edit that transaction
     """
     def __init__(self, func_get_transactions:callable, func_event_handler:callable):
         """
         basic constructor is setting up the TransactionList datatype, 
-        you have to provide a function that returns a list of transactions which are displayed and an event handler for the buttons
+        you have to provide a function that returns a list of transactions which are displayed and an event handler for clicking a row
         :param func_get_transactions: function<gets list of transaction objects>
-        :param func_event_handler: function<event handler for pressing a button>
+        :param func_event_handler: function<event handler for clicking a row, gets the QModelIndex of the row>
         :return: void
         """
         assert(callable(func_get_transactions)), STRINGS.getTypeErrorString(func_get_transactions, "func_get_transactions", "function")
-        self.layout = None  #the layout that is used to add the PushButtons
+        assert(callable(func_event_handler)), STRINGS.getTypeErrorString(func_event_handler, "func_event_handler", "function")
+        self.layout = None  #the layout that holds the view
         self.func_get_transactions = func_get_transactions
         self.func_event_handler = func_event_handler
-        self.buttons_transaction_dict = {}      #saves the buttons to transaction to avoid uneccessary updates
-        self.transactions_button_dict = {}      #saves the transaction to buttons to avoid uneccessary updates
-        self.transaction_product_name_dict = {} #saves the current product name label text on the button for each transaction
-    
+        self.model = TransactionModel()
+        self.view = getListTableView(self.model, func_event_handler)
+
     def setLayout(self, layout:QVBoxLayout):
         """
-        sets the layout which holds the PushButtons, has to be done before using this object
-        :param layout: Some pyqt5 layout type<layout in which the buttons are added and removed>
+        sets the layout which holds the view, has to be done before using this object
+        :param layout: Some pyqt5 layout type<layout in which the view is added>
         :return: void
         """
         assert(type(layout) == QVBoxLayout), STRINGS.getTypeErrorString(layout, "layout", QVBoxLayout)
         self.layout = layout
+        self.layout.addWidget(self.view)
 
     def updateLastTrans(self):
         """
-        updates the buttons by getting the new transaction data from the backend
+        updates the rows by getting the new transaction data from the backend
         :return: void
         """
-        assert(self.layout != False), STRINGS.ERROR_NO_LAYOUT
-        #deletes all current buttons
-        for i in reversed(range(self.layout.count())): 
-            self.layout.removeWidget(self.layout.itemAt(i).widget())
-
-        #sets up the buttons
-        self.buttons_transaction_dict = {}
-        new_transactions = []
-        for transaction in self.func_get_transactions():
-            if not transaction in self.transactions_button_dict:
-                #if we dont know the button, a new one is created
-                button = self._getTransactionButton(transaction)
-                self.transactions_button_dict[transaction] = button
-            elif not transaction.product.name == self.transaction_product_name_dict[transaction]:
-                #product name got changed
-                button = self._getTransactionButton(transaction)
-                self.transactions_button_dict[transaction] = button
-            else:
-                #the button is already created
-                button = self.transactions_button_dict[transaction]
-            new_transactions.append(transaction)
-            self.layout.addWidget(button)  
-            self.buttons_transaction_dict[button] = transaction
-        
-        #syncing the two hashmaps
-        #if the user deletes or changes one transaction it has to be deleted from the transaction_button_dict
-        if len(self.buttons_transaction_dict.keys()) != len(self.transactions_button_dict.keys()):
-            cur_trans = list(self.transactions_button_dict.keys())
-            s = set(new_transactions)
-            for dif in [x for x in cur_trans if x not in s]:
-                self.transactions_button_dict.pop(dif)
-
-    def getTransactionForButton(self, button:QPushButton):
-        """
-        getter for a transaction object coresponding to a given button
-        :param button: object<PushButton>
+        assert(self.layout != None), STRINGS.ERROR_NO_LAYOUT
+        self.model.setElements(list(self.func_get_transactions()))
+
+    def getTransactionForIndex(self, index:QModelIndex):
+        """
+        getter for a transaction object coresponding to a given row
+        :param index: object<QModelIndex>
         :return: object<Transaction>
         """
-        assert(button in self.buttons_transaction_dict.keys()), STRINGS.ERROR_BUTTON_NOT_FOUND
-        return self.buttons_transaction_dict[button]
+        return self.model.getElement(index)
 
     def getTransactionCount(self):
         """
         getter for the number of transactions currently shown
         :return: int<number>
         """
-        return len(self.buttons_transaction_dict.keys())
+        return self.model.rowCount()
 
-    def _getTransactionButton(self, transaction:Transaction):
-        """
-        gets a PushButton object created using a transaction object. This method is labeling a button with transaction data
-        :param transaction: object<Transaction>
-        :return: object<PushButton>
+    def setChoosenTransaction(self, transaction:Transaction):
         """
-        assert(self.layout != False), STRINGS.ERROR_NO_LAYOUT
-        assert(type(transaction) == Transaction), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
-        
-        element_button = QPushButton()
-        element_layout = QHBoxLayout()  #layout for the button
-        element_layout.setContentsMargins(10, 3, 10, 3)     #CHANGE
-
-        #some label with transaction data
-        date_string = transaction.date.strftime('[%d %b %Y]')
-        cashflow_string = f"{transaction.cashflow:.2f}{STRINGS.CURRENCY}"
-        product_string = transaction.product.name
-        #define the labels that are on the button
-        date_label = QLabel(date_string)
-        empty_label = QLabel("")
-        cashflow_label = QLabel(cashflow_string)
-        product_label = QLabel(product_string)
-        #placeholder between date and cashflow
-        empty_label.setFixedSize(10, 1)
-        #set their size Policys to match a convenient pattern
-        date_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Expanding)
-        empty_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        cashflow_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Expanding)
-        product_label.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-        #sets their text alignments on the labels
-        date_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        cashflow_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        product_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        #adds them to the button layout
-        element_layout.addWidget(date_label)
-        element_layout.addWidget(empty_label)
-        element_layout.addWidget(cashflow_label)
-        element_layout.addWidget(product_label)
-
-        element_button.setLayout(element_layout)
-        element_button.adjustSize() #makes the content fit
-        element_button.clicked.connect(self.func_event_handler)    #connect with event handler
-        self.transaction_product_name_dict[transaction] = product_string
-        return element_button
-
-
-class InvestmentList:
-    """
-    The InvestmentList class sets up a list of PushButton objects, that are added in a scrollarea
-    The PushButtons should represent the investment the user has taken
-    The user should be able to click on these buttons to view and edit that investment
-    """
-    def __init__(self, func_get_investments:callable, func_event_handler:callable):
-        """
-        basic constructor is setting up the InvestmentList datatype, 
-        you have to provide a function that returns a list of investments which are displayed and an event handler for the buttons
-        :param func_get_investments: function<gets list of investment objects>
-        :param func_event_handler: function<event handler for pressing a button>
+        highlights the row of the given transaction
+        :param transaction: object<Transaction> or None to remove the highlight
         :return: void
         """
-        assert(callable(func_get_investments)), STRINGS.getTypeErrorString(func_get_investments, "func_get_investments", "function")
-        self.layout = None  #the layout that is used to add the PushButtons
-        self.func_get_investments = func_get_investments
-        self.func_event_handler = func_event_handler
-        self.buttons_investment_dict = {}      #saves the buttons to investments to avoid uneccessary updates
-        self.investment_button_dict = {}      #saves the investments to buttons to avoid uneccessary updates
-        self.investment_short_name_dict = {} #saves the current short name label text on the button for each investment
-    
-    def setLayout(self, layout:QVBoxLayout):
-        """
-        sets the layout which holds the PushButtons, has to be done before using this object
-        :param layout: Some pyqt5 layout type<layout in which the buttons are added and removed>
-        :return: void
-        """
-        assert(type(layout) == QVBoxLayout), STRINGS.getTypeErrorString(layout, "layout", QVBoxLayout)
-        self.layout = layout
+        assert(type(transaction) == Transaction or transaction == None), STRINGS.getTypeErrorString(transaction, "transaction", Transaction)
+        self.model.setChoosenElement(transaction)
 
-    def updateLastInvestments(self):
+    def setEnabled(self, enabled:bool):
         """
-        updates the buttons by getting the new investment data from the backend
+        enables or disables clicking the rows
+        :param enabled: bool<enabled?>
         :return: void
         """
-        assert(self.layout != False), STRINGS.ERROR_NO_LAYOUT
-        #deletes all current buttons
-        for i in reversed(range(self.layout.count())): 
-            self.layout.removeWidget(self.layout.itemAt(i).widget())
-
-        #sets up the buttons
-        self.buttons_investment_dict = {}
-        new_investments = []
-        for investment in self.func_get_investments():
-            if not investment in self.investment_button_dict:
-                #if we dont know the button, a new one is created
-                button = self._getInvestmentButton(investment)
-                self.investment_button_dict[investment] = button
-            elif not investment.asset.short_name == self.investment_short_name_dict[investment]:
-                #short name got changed
-                button = self._getInvestmentButton(investment)
-                self.investment_button_dict[investment] = button
-            else:
-                #the button is already created
-                button = self.investment_button_dict[investment]
-            new_investments.append(investment)
-            self.layout.addWidget(button)  
-            self.buttons_investment_dict[button] = investment
-        
-        #syncing the two hashmaps
-        #if the user deletes or changes one investment it has to be deleted from the transaction_button_dict
-        if len(self.buttons_investment_dict.keys()) != len(self.investment_button_dict.keys()):
-            cur_inv = list(self.investment_button_dict.keys())
-            s = set(new_investments)
-            for dif in [x for x in cur_inv if x not in s]:
-                self.investment_button_dict.pop(dif)
-
-    def getInvestmentForButton(self, button:QPushButton):
-        """
-        getter for a investment object coresponding to a given button
-        :param button: object<PushButton>
-        :return: object<Investment>
-        """
-        assert(button in self.buttons_investment_dict.keys()), STRINGS.ERROR_BUTTON_NOT_FOUND
-        return self.buttons_investment_dict[button]
+        self.view.setEnabled(enabled)
 
-    def getInvestmentCount(self):
+
+class InvestmentModel(ListTableModel):
+    """
+    The InvestmentModel class is the table model of the InvestmentList
+    each row shows the date, trade type, price and asset name of an investment and is colored by its trade type
+    """
+    def __init__(self):
         """
-        getter for the number of investments currently shown
-        :return: int<number>
+        basic constructor is setting up an empty model with four columns
+        :return: void
         """
-        return len(self.buttons_investment_dict.keys())
+        super().__init__(4)
+
+    def data(self, index:QModelIndex, role:int=Qt.ItemDataRole.DisplayRole):
+        """
+        gets the data of a cell, this is only called for the visible rows
+        :param index: object<QModelIndex>
+        :param role: int<Qt.ItemDataRole>
+        :return: any<data of the cell for that role> or None
+        """
+        if not index.isValid():
+            return None
+        investment:Investment = self.elements[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            match index.column():
+                case 0:
+                    return investment.date.strftime('[%d %b %Y]')
+                case 1:
+                    return self.getTradeTypeString(investment.trade_type)
+                case 2:
+                    return f"{investment.price:.2f}{STRINGS.CURRENCY}"
+                case 3:
+                    return investment.asset.short_name
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if index.column() == 0:
+                return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if investment is self.choosen_element:
+                return QColor(COLORS.DARK_RED)
+            return QColor(self.getColor(investment.trade_type))
+        return None
 
     def getColor(self, trade_type:str):
         """
-        gets the button color depending on the trade type
+        gets the row color depending on the trade type
         this call is case insensitive
         :param trade_type: str<trade type of the investment>
-        :return: str<color string for the button>
+        :return: str<color string for the row>
         """
         assert(type(trade_type) == str), STRINGS.getTypeErrorString(trade_type, "trade_type", str)
         match self.getTradeTypeString(trade_type):
@@ -524,10 +570,10 @@ class InvestmentList:
 
     def getTradeTypeString(self, trade_type:str):
         """
-        gets the string that is shown on the buttons for the trade type
+        gets the string that is shown in the rows for the trade type
         this call is case insensitive
         :param trade_type: str<trade type of the investment>
-        :return: str<trade type string for the button>
+        :return: str<trade type string for the row>
         """
         assert(type(trade_type) == str), STRINGS.getTypeErrorString(trade_type, "trade_type", str)
         if trade_type.lower() == STRINGS.INVFORM_TYPE_BUY.lower():
@@ -539,49 +585,67 @@ class InvestmentList:
         else:
             assert(False)
 
-    def _getInvestmentButton(self, investment:Investment):
+
+class InvestmentList:
+    """
+    The InvestmentList class sets up a table view of the investments, that is added to a layout
+    The rows should represent the investments the user has taken, only the visible rows are rendered
+    The user should be able to click on a row to view and edit that investment
+    """
+    def __init__(self, func_get_investments:callable, func_event_handler:callable):
         """
-        gets a PushButton object created using a Investment object. This method is labeling a button with investment data
-        :param transaction: object<Investment>
-        :return: object<PushButton>
+        basic constructor is setting up the InvestmentList datatype, 
+        you have to provide a function that returns a list of investments which are displayed and an event handler for clicking a row
+        :param func_get_investments: function<gets list of investment objects>
+        :param func_event_handler: function<event handler for clicking a row, gets the QModelIndex of the row>
+        :return: void
         """
-        assert(self.layout != False), STRINGS.ERROR_NO_LAYOUT
-        assert(type(investment) == Investment), STRINGS.getTypeErrorString(investment, "investment", Investment)
-        
-        element_button = QPushButton()
-        element_layout = QHBoxLayout()  #layout for the button
-        element_layout.setContentsMargins(10, 3, 10, 3)     #CHANGE
-
-        #some label with investment data
-        date_string = investment.date.strftime('[%d %b %Y]')
-        cashflow_string = f"{investment.price:.2f}{STRINGS.CURRENCY}"
-        name_string = investment.asset.short_name
-        #define the labels that are on the button
-        date_label = QLabel(date_string)
-        empty_label = QLabel("")
-        cashflow_label = QLabel(cashflow_string)
-        name_label = QLabel(name_string)
-        #placeholder between date and cashflow
-        empty_label.setFixedSize(10, 1)
-        #set their size Policys to match a convenient pattern
-        date_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Expanding)
-        empty_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-        cashflow_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Expanding)
-        name_label.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
-        #sets their text alignments on the labels
-        date_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        cashflow_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        name_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-        #adds them to the button layout
-        element_layout.addWidget(date_label)
-        element_layout.addWidget(empty_label)
-        element_layout.addWidget(cashflow_label)
-        element_layout.addWidget(name_label)
-
-        element_button.setLayout(element_layout)
-        color = self.getColor(investment.trade_type)
-        element_button.setStyleSheet("QPushButton {background-color:"+color+"}")
-        element_button.adjustSize() #makes the content fit
-        element_button.clicked.connect(self.func_event_handler)    #connect with event handler
-        self.investment_short_name_dict[investment] = name_string
-        return element_button
+        assert(callable(func_get_investments)), STRINGS.getTypeErrorString(func_get_investments, "func_get_investments", "function")
+        assert(callable(func_event_handler)), STRINGS.getTypeErrorString(func_event_handler, "func_event_handler", "function")
+        self.layout = None  #the layout that holds the view
+        self.func_get_investments = func_get_investments
+        self.func_event_handler = func_event_handler
+        self.model = InvestmentModel()
+        self.view = getListTableView(self.model, func_event_handler)
+
+    def setLayout(self, layout:QVBoxLayout):
+        """
+        sets the layout which holds the view, has to be done before using this object
+        :param layout: Some pyqt5 layout type<layout in which the view is added>
+        :return: void
+        """
+        assert(type(layout) == QVBoxLayout), STRINGS.getTypeErrorString(layout, "layout", QVBoxLayout)
+        self.layout = layout
+        self.layout.addWidget(self.view)
+
+    def updateLastInvestments(self):
+        """
+        updates the rows by getting the new investment data from the backend
+        :return: void
+        """
+        assert(self.layout != None), STRINGS.ERROR_NO_LAYOUT
+        self.model.setElements(list(self.func_get_investments()))
+
+    def getInvestmentForIndex(self, index:QModelIndex):
+        """
+        getter for a investment object coresponding to a given row
+        :param index: object<QModelIndex>
+        :return: object<Investment>
+        """
+        return self.model.getElement(index)
+
+    def getInvestmentCount(self):
+        """
+        getter for the number of investments currently shown
+        :return: int<number>
+        """
+        return self.model.rowCount()
+
+    def setChoosenInvestment(self, investment:Investment):
+        """
+        highlights the row of the given investment
+        :param investment: object<Investment> or None to remove the highlight
+        :return: void
+        """
+        assert(type(investment) == Investment or investment == None), STRINGS.getTypeErrorString(investment, "investment", Investment)
+        self.model.setChoosenElement(investment)